@@ -1,17 +1,29 @@
 import os
+import sqlite3
 from pathlib import Path
 
 import pygame
 
+from album_catalog import AlbumCatalog, CatalogView
+from album_dedupe import DuplicateScanner
+from album_prefetch import ImagePrefetcher
+from album_thumbs import FAILED, PENDING, READY, ThumbnailStore
+from album_zoom import ZoomView
 from config import asset_path
 from pg_utils import load_font
 from photo_mode import album_folder, list_photos
+from surface_cache import SurfaceLRU
 
 
 BG_COLOR = (245, 245, 245)
 PANEL_COLOR = (230, 230, 230)
 BORDER = (0, 0, 0)
 FONT_PATH = asset_path("fonts", "ThinDungGeunMo.ttf")
+# 356x436 RGBA 원본 보기 기준 약 6장
+FULL_BUDGET_BYTES = 4 * 1024 * 1024
+# 분류 버튼이 도는 순서. None은 전체 보기.
+GROUP_ORDER = (None, "day", "stage", "player")
+GROUP_LABELS = {None: "전체", "day": "날짜별", "stage": "단계별", "player": "고양이별"}
 
 
 class AlbumUI:
@@ -32,26 +44,62 @@ class AlbumUI:
         self.prev_rect = pygame.Rect(112, 548, 80, 32)
         self.next_rect = pygame.Rect(204, 548, 80, 32)
         self.delete_rect = pygame.Rect(296, 548, 84, 32)
+        self.group_rect = pygame.Rect(150, 12, 96, 28)
+        self.value_rect = pygame.Rect(252, 12, 100, 28)
+        self.collapse_rect = pygame.Rect(150, 46, 96, 28)
+        self.cleanup_rect = pygame.Rect(252, 46, 100, 28)
+        self.group_field = None
+        self.group_values = []
+        self.group_value_index = 0
         self.photo_rects = []
-        self.thumb_cache = {}
-        self.full_cache = {}
-        self.photos = list_photos(self.folder)
+        self.collapse_duplicates = False
+        self.duplicate_count = 0
+        self.confirm_cleanup = False
+        self.full_cache = SurfaceLRU(FULL_BUDGET_BYTES)
+        self.catalog = self._open_catalog()
+        self.photos = CatalogView(self.catalog) if self.catalog is not None else []
+        self._photo_index = {}
+        self._visible = (0, -1)
+        self._reload_photos()
+        self.show_cache_stats = False
         self.confirm_delete = False
         self.message = ""
 
-        self.list_top = 82
+        self.list_top = 100
         self.card_w = 152
         self.card_h = 198
         self.card_gap_x = 24
         self.card_gap_y = 14
         self.thumb_size = (126, 150)
+        self.thumbs = ThumbnailStore(self.folder, self.thumb_size)
+        self.full_size = (356, 436)
+        self.prefetch = ImagePrefetcher(self.full_size, self.full_cache)
+        self.zoom = ZoomView(pygame.Rect((22, 80), self.full_size))
+        self.dedupe = None
+        if self.catalog is not None:
+            self.duplicate_count = self.catalog.duplicate_count()
+            self.dedupe = DuplicateScanner(self.folder)
+            self.dedupe.scan()
 
     def run(self):
         clock = pygame.time.Clock()
-        while self.running:
-            clock.tick(60)
-            self.handle_events()
-            self.draw()
+        try:
+            while self.running:
+                clock.tick(60)
+                self.thumbs.poll(self._thumb_distance)
+                self.prefetch.poll(self._full_distance)
+                self.zoom.poll()
+                self._poll_dedupe()
+                self.handle_events()
+                self.draw()
+        finally:
+            self.thumbs.close()
+            self.prefetch.close()
+            self.zoom.close()
+            if self.dedupe is not None:
+                self.dedupe.close()
+            if self.catalog is not None:
+                self.catalog.close()
 
     def _click(self):
         if self.play_click_sound:
@@ -66,6 +114,139 @@ class AlbumUI:
         view_h = screen_h - self.list_top - 18
         return max(0, int(content_h - view_h))
 
+    def _open_catalog(self):
+        # 카탈로그를 쓸 수 없으면 None을 돌려주고 예전처럼 폴더를 통째로 훑는다.
+        if not Path(self.folder).is_dir():
+            return None
+        try:
+            catalog = AlbumCatalog(self.folder)
+            catalog.reconcile()
+            return catalog
+        except (OSError, sqlite3.Error):
+            return None
+
+    def _reload_photos(self):
+        if self.catalog is not None:
+            self.photos.refresh()
+            if self.group_field:
+                # 지운 사진이 묶음의 마지막이었으면 첫 묶음으로 옮긴다.
+                current = self.photos.filters.get(self.group_field)
+                self.group_values = self.catalog.groups(self.group_field, collapse=self.collapse_duplicates)
+                values = [value for value, _ in self.group_values]
+                if current in values:
+                    self.group_value_index = values.index(current)
+                else:
+                    self.group_value_index = 0
+                    filters = {self.group_field: values[0]} if values else {}
+                    self.photos = CatalogView(self.catalog, collapse=self.collapse_duplicates, **filters)
+            return
+        self.photos = list_photos(self.folder)
+        self._photo_index = {path: index for index, path in enumerate(self.photos)}
+
+    def _cycle_group(self):
+        index = GROUP_ORDER.index(self.group_field)
+        self.group_field = GROUP_ORDER[(index + 1) % len(GROUP_ORDER)]
+        self.group_values = (
+            self.catalog.groups(self.group_field, collapse=self.collapse_duplicates) if self.group_field else []
+        )
+        self.group_value_index = 0
+        self._apply_group()
+
+    def _cycle_group_value(self, delta=1):
+        if not self.group_values:
+            return
+        self.group_value_index = (self.group_value_index + delta) % len(self.group_values)
+        self._apply_group()
+
+    def _apply_group(self):
+        filters = {}
+        if self.group_field and self.group_values:
+            filters[self.group_field] = self.group_values[self.group_value_index][0]
+        self.photos = CatalogView(self.catalog, collapse=self.collapse_duplicates, **filters)
+        self.scroll = 0
+        self._visible = (0, -1)
+        self.selected_index = None
+        self.confirm_delete = False
+        self.confirm_cleanup = False
+        self.message = ""
+
+    def _toggle_collapse(self):
+        # 묶음 값의 장수도 접은 기준으로 다시 센다. 보던 값은 남아 있으면 그대로 둔다.
+        self.collapse_duplicates = not self.collapse_duplicates
+        if self.group_field:
+            current = self.group_values[self.group_value_index][0] if self.group_values else None
+            self.group_values = self.catalog.groups(self.group_field, collapse=self.collapse_duplicates)
+            values = [value for value, _ in self.group_values]
+            self.group_value_index = values.index(current) if current in values else 0
+        self._apply_group()
+
+    def _request_or_confirm_cleanup(self):
+        if self.dedupe is None or self.dedupe.busy or not self.duplicate_count:
+            return
+        if not self.confirm_cleanup:
+            self.confirm_cleanup = True
+            self.message = f"중복 {self.duplicate_count}장, 다시 누르면 지워집니다."
+            return
+        self.confirm_cleanup = False
+        self.message = "중복 사진 정리 중..."
+        self.dedupe.cleanup()
+
+    def _poll_dedupe(self):
+        if self.dedupe is None:
+            return
+        for kind, result in self.dedupe.poll():
+            if kind == "scan":
+                self.duplicate_count = result
+                if self.collapse_duplicates:
+                    self._reload_photos()
+            elif kind == "cleanup":
+                self.thumbs.invalidate_many(result)
+                for path in result:
+                    self.prefetch.invalidate(path)
+                self._reload_photos()
+                self.duplicate_count = self.catalog.duplicate_count()
+                self.selected_index = None
+                self.confirm_delete = False
+                self.scroll = min(self.scroll, self._max_scroll())
+                self.message = f"중복 사진 {len(result)}장 삭제됨"
+            else:
+                self.message = "중복 사진 정리 실패"
+
+    def _group_value_label(self):
+        if not self.group_values:
+            return "-"
+        value, count = self.group_values[self.group_value_index]
+        if value is None:
+            text = "미상"
+        elif self.group_field == "day":
+            text = f"Day {value}"
+        else:
+            text = self._short_name(value, 7)
+        return f"{text} ({count})"
+
+    def _index_of(self, path):
+        if self.catalog is not None:
+            return self.photos.index_of(path)
+        return self._photo_index.get(path)
+
+    def _thumb_distance(self, path):
+        # 현재 보이는 카드 범위 밖으로 몇 장 떨어져 있는지
+        index = self._index_of(path)
+        if index is None:
+            return len(self.photos) + 1
+        first, last = self._visible
+        if index < first:
+            return first - index
+        if index > last:
+            return index - last
+        return 0
+
+    def _full_distance(self, path):
+        index = self._index_of(path)
+        if index is None:
+            return len(self.photos) + 1
+        return abs(index - (self.selected_index or 0))
+
     def _scroll_by(self, delta):
         self.scroll = max(0, min(int(self.scroll) + int(delta), self._max_scroll()))
 
@@ -74,10 +255,16 @@ class AlbumUI:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            elif self.selected_index is not None and not self.confirm_delete and self.zoom.handle_event(event):
+                continue
+
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if self.confirm_delete:
+                if event.key == pygame.K_F3:
+                    self.show_cache_stats = not self.show_cache_stats
+                elif event.key == pygame.K_ESCAPE:
+                    if self.confirm_delete or self.confirm_cleanup:
                         self.confirm_delete = False
+                        self.confirm_cleanup = False
                         self.message = ""
                     elif self.selected_index is not None:
                         self.selected_index = None
@@ -103,6 +290,28 @@ class AlbumUI:
             self.running = False
             return
 
+        if self.selected_index is None and self.catalog is not None:
+            if self.cleanup_rect.collidepoint(event.pos):
+                self._click()
+                self._request_or_confirm_cleanup()
+                return
+            if self.confirm_cleanup:
+                # 다른 곳을 누르면 정리 확인을 취소한다.
+                self.confirm_cleanup = False
+                self.message = ""
+            if self.collapse_rect.collidepoint(event.pos):
+                self._click()
+                self._toggle_collapse()
+                return
+            if self.group_rect.collidepoint(event.pos):
+                self._click()
+                self._cycle_group()
+                return
+            if self.group_field and self.value_rect.collidepoint(event.pos):
+                self._click()
+                self._cycle_group_value(-1 if event.button == 3 else 1)
+                return
+
         if self.selected_index is not None:
             if self.back_rect.collidepoint(event.pos):
                 self._click()
@@ -145,7 +354,10 @@ class AlbumUI:
     def _selected_path(self):
         if self.selected_index is None or not (0 <= self.selected_index < len(self.photos)):
             return None
-        return self.photos[self.selected_index]
+        try:
+            return self.photos[self.selected_index]
+        except IndexError:
+            return None
 
     def _select_relative(self, delta):
         if self.selected_index is None or not self.photos:
@@ -174,58 +386,47 @@ class AlbumUI:
                 self.message = "삭제할 수 없는 위치입니다."
                 self.confirm_delete = False
                 return
+            stamp = self.catalog.folder_stamp() if self.catalog is not None else ""
             target.unlink()
         except OSError:
             self.message = "사진 삭제 실패"
             self.confirm_delete = False
             return
 
-        self.thumb_cache.pop(path, None)
-        self.full_cache.pop(path, None)
-        self.photos = list_photos(self.folder)
+        if self.catalog is not None:
+            try:
+                self.catalog.remove(path, stamp)
+                self.duplicate_count = self.catalog.duplicate_count()
+            except sqlite3.Error:
+                pass
+        self.thumbs.invalidate(path)
+        self.prefetch.invalidate(path)
+        self._reload_photos()
         self.selected_index = None
         self.confirm_delete = False
         self.scroll = min(self.scroll, self._max_scroll())
         self.message = "사진 삭제됨"
 
-    def _load_image(self, path):
-        try:
-            image = pygame.image.load(path).convert_alpha()
-            return image
-        except (OSError, TypeError, ValueError, pygame.error):
-            return None
+    def cache_stats(self):
+        return {
+            "thumbs": self.thumbs.cache.stats(),
+            "full": self.full_cache.stats(),
+            "zoom": self.zoom.view_tiles.stats(),
+        }
 
-    def _fit_image(self, image, max_size):
-        width, height = image.get_size()
-        if width <= 0 or height <= 0:
-            return None
-        scale = min(max_size[0] / width, max_size[1] / height, 1.0)
-        size = (max(1, int(width * scale)), max(1, int(height * scale)))
-        return pygame.transform.smoothscale(image, size)
-
-    def _thumbnail(self, path):
-        cached = self.thumb_cache.get(path)
-        if cached is not None:
-            return cached
-        image = self._load_image(path)
-        if image is None:
-            self.thumb_cache[path] = None
-            return None
-        thumb = self._fit_image(image, self.thumb_size)
-        self.thumb_cache[path] = thumb
-        return thumb
-
-    def _full_image(self, path):
-        cached = self.full_cache.get(path)
-        if cached is not None:
-            return cached
-        image = self._load_image(path)
-        if image is None:
-            self.full_cache[path] = None
-            return None
-        full = self._fit_image(image, (356, 436))
-        self.full_cache[path] = full
-        return full
+    def _draw_cache_stats(self):
+        parts = []
+        # 한 줄에 두 개만 들어가서 원본 보기에서는 썸네일 대신 확대 타일 캐시를 보여 준다.
+        if self.selected_index is None:
+            caches = (("썸네일", self.thumbs.cache), ("원본", self.full_cache))
+        else:
+            caches = (("원본", self.full_cache), ("확대", self.zoom.view_tiles))
+        for label, stats in ((label, cache.stats()) for label, cache in caches):
+            used = stats["bytes"] / (1024 * 1024)
+            budget = stats["budget"] / (1024 * 1024)
+            parts.append(f"{label} {stats['entries']}장 {used:.1f}/{budget:.0f}MB 적중 {stats['hit_rate'] * 100:.0f}%")
+        text = self.small_font.render("  ".join(parts), True, (90, 90, 140))
+        self.screen.blit(text, (20, 70 if self.selected_index is not None else 84))
 
     def _short_name(self, name, limit):
         text = str(name)
@@ -241,13 +442,35 @@ class AlbumUI:
         self.screen.blit(count, (20, 52))
         if self.message and self.selected_index is None:
             msg = self.small_font.render(self.message, True, (150, 55, 55))
-            self.screen.blit(msg, (132, 56))
+            self.screen.blit(msg, (20, 78))
 
         pygame.draw.rect(self.screen, PANEL_COLOR, self.close_rect)
         pygame.draw.rect(self.screen, BORDER, self.close_rect, 1)
         x_text = self.font.render("X", True, (0, 0, 0))
         self.screen.blit(x_text, x_text.get_rect(center=self.close_rect.center))
 
+        if self.catalog is not None and self.selected_index is None:
+            self.draw_button(self.group_rect, GROUP_LABELS[self.group_field])
+            if self.group_field:
+                self.draw_button(self.value_rect, self._group_value_label(), enabled=bool(self.group_values))
+            self.draw_button(self.collapse_rect, "중복 펼치기" if self.collapse_duplicates else "중복 접기")
+            text, enabled = self._cleanup_button()
+            self.draw_button(self.cleanup_rect, text, enabled=enabled, danger=self.confirm_cleanup)
+
+        if self.show_cache_stats:
+            self._draw_cache_stats()
+
+    def _cleanup_button(self):
+        # (글자, 누를 수 있는지)
+        if self.dedupe is not None and self.dedupe.busy:
+            if self.dedupe.task == "cleanup":
+                return "정리 중", False
+            done, total = self.dedupe.progress
+            return (f"검사 {done * 100 // total}%" if total else "검사 중"), False
+        if self.confirm_cleanup:
+            return "정리 확인", True
+        return f"정리 {self.duplicate_count}", bool(self.duplicate_count)
+
     def draw_button(self, rect, text, *, enabled=True, danger=False):
         if enabled:
             color = (238, 214, 214) if danger else PANEL_COLOR
@@ -280,7 +503,17 @@ class AlbumUI:
         left = (screen_w - (self.card_w * 2 + self.card_gap_x)) // 2
         y0 = self.list_top - int(self.scroll)
 
-        for index, path in enumerate(self.photos):
+        # 위쪽으로 지나간 줄은 건너뛰고 시작한다. 사진이 수천 장이어도 보이는 카드만 돈다.
+        pitch = self.card_h + self.card_gap_y
+        first_row = max(0, (int(self.scroll) - self.card_h) // pitch - 1)
+        first = last = None
+
+        for index in range(first_row * 2, len(self.photos)):
+            try:
+                path = self.photos[index]
+            except IndexError:
+                # 중복 검사/정리가 그 사이 목록을 줄였다. 남은 카드는 다음 프레임에 그린다.
+                break
             col = index % 2
             row = index // 2
             x = left + col * (self.card_w + self.card_gap_x)
@@ -297,19 +530,27 @@ class AlbumUI:
 
             thumb_rect = pygame.Rect(rect.x + 13, rect.y + 10, *self.thumb_size)
             pygame.draw.rect(self.screen, (225, 225, 225), thumb_rect)
-            thumb = self._thumbnail(path)
-            if thumb is not None:
+            status, thumb = self.thumbs.get(path)
+            if status == READY:
                 self.screen.blit(thumb, thumb.get_rect(center=thumb_rect.center))
-            else:
+            elif status == FAILED:
                 err = self.small_font.render("불러오기 실패", True, (120, 60, 60))
                 self.screen.blit(err, err.get_rect(center=thumb_rect.center))
+            else:
+                wait = self.small_font.render("...", True, (120, 120, 120))
+                self.screen.blit(wait, wait.get_rect(center=thumb_rect.center))
 
             name = self._short_name(Path(path).stem, 18)
             label = self.small_font.render(name, True, (45, 45, 45))
             self.screen.blit(label, (rect.x + 10, rect.y + self.thumb_size[1] + 18))
 
             self.photo_rects.append((rect, index))
+            if first is None:
+                first = index
+            last = index
 
+        if first is not None:
+            self._visible = (first, last)
         self.screen.set_clip(old_clip)
 
     def draw_selected(self):
@@ -317,15 +558,29 @@ class AlbumUI:
             self.selected_index = None
             return
 
-        path = self.photos[self.selected_index]
-        image = self._full_image(path)
+        path = self.prefetch.focus(self.selected_index, self.photos)
+        if path is None:
+            self.selected_index = None
+            return
+        status, image = self.prefetch.get(path)
 
         area = pygame.Rect(20, 78, 360, 440)
         pygame.draw.rect(self.screen, (225, 225, 225), area)
         pygame.draw.rect(self.screen, BORDER, area, 1)
 
-        if image is not None:
+        self.zoom.show(path, image if status == READY else None)
+        if self.zoom.active:
+            self.zoom.draw(self.screen, image)
+        elif status == READY:
             self.screen.blit(image, image.get_rect(center=area.center))
+        elif status == PENDING:
+            # 원본이 준비될 때까지 썸네일을 늘려서 보여 준다.
+            thumb = self.thumbs.cache.peek(path)
+            if thumb is not None:
+                tw, th = thumb.get_size()
+                scale = min(self.full_size[0] / tw, self.full_size[1] / th)
+                preview = pygame.transform.scale(thumb, (int(tw * scale), int(th * scale)))
+                self.screen.blit(preview, preview.get_rect(center=area.center))
         else:
             err = self.font.render("사진을 불러올 수 없습니다.", True, (120, 60, 60))
             self.screen.blit(err, err.get_rect(center=area.center))
@@ -335,6 +590,9 @@ class AlbumUI:
         label_color = (150, 55, 55) if self.confirm_delete else (45, 45, 45)
         label = self.small_font.render(label_text, True, label_color)
         self.screen.blit(label, (20, 526))
+        if self.zoom.active and not self.confirm_delete:
+            ratio = self.small_font.render(f"{self.zoom.zoom * 100:.0f}%", True, (45, 45, 45))
+            self.screen.blit(ratio, ratio.get_rect(topright=(380, 526)))
 
         self.draw_button(self.back_rect, "취소" if self.confirm_delete else "목록")
         if self.confirm_delete:
@@ -0,0 +1,466 @@
+from __future__ import annotations
+
+import datetime
+import os
+import re
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+
+import photo_hash
+import png_writer
+
+
+PHOTO_EXTENSIONS = {".png", ".jpg", ".jpeg"}
+CATALOG_DIR_NAME = ".catalog"
+CATALOG_FILE_NAME = "catalog.sqlite3"
+PAGE_SIZE = 64
+SCHEMA_VERSION = 4
+
+# 사진 PNG의 iTXt 청크에 "growing-cat:<필드>" 키로 들어가는 메타데이터
+META_PREFIX = "growing-cat:"
+META_FIELDS = ("player", "day", "stage", "difficulty", "taken_at")
+# 앨범에서 묶어 보기/거르기에 쓰는 필드
+GROUP_FIELDS = ("day", "stage", "player", "difficulty")
+# 찍을 때 계산한 dHash(16진수). 카탈로그에도 16진수 그대로 넣는다. 중복 찾기에만 쓰고 묶어 보기에는 나오지 않는다.
+HASH_KEY = META_PREFIX + "dhash"
+
+# 메타데이터가 없는 예전 사진은 take_photo 파일 이름 형식에서 이름, 날짜, 찍은 시각을 읽는다.
+_NAME_PATTERN = re.compile(r"^(?P<player>.+?)(?:_day(?P<day>\d+))?_(?P<stamp>\d{8}_\d{6})_\d{3}(?:_clip|_hd)?$")
+
+_META_TABLE = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS photos (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    player TEXT,
+    day INTEGER,
+    stage TEXT,
+    difficulty TEXT,
+    taken_at TEXT,
+    dhash TEXT,
+    dup_of TEXT
+);
+CREATE INDEX IF NOT EXISTS photos_by_time ON photos (mtime_ns DESC, name DESC);
+CREATE INDEX IF NOT EXISTS photos_by_day ON photos (day, mtime_ns DESC, name DESC);
+CREATE INDEX IF NOT EXISTS photos_by_stage ON photos (stage, mtime_ns DESC, name DESC);
+CREATE INDEX IF NOT EXISTS photos_by_player ON photos (player, mtime_ns DESC, name DESC);
+CREATE INDEX IF NOT EXISTS photos_by_difficulty ON photos (difficulty, mtime_ns DESC, name DESC);
+CREATE INDEX IF NOT EXISTS photos_by_dup ON photos (dup_of);
+"""
+
+# 움짤은 첫 프레임이 같은 장면의 사진과 겹치기 쉬워 중복 찾기에서 뺀다.
+_NOT_CLIP = "name NOT LIKE '%\\_clip.png' ESCAPE '\\'"
+
+# dup_of는 넣지 않으므로 다시 색인된 사진은 다음 중복 검사 전까지 중복이 아닌 것으로 보인다.
+_COLUMNS = ("name", "mtime_ns", "size", *META_FIELDS, "dhash")
+_UPSERT = f"INSERT OR REPLACE INTO photos ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+
+
+def catalog_path(folder: str | os.PathLike) -> Path:
+    # 저널 파일이 앨범 폴더의 수정 시각을 건드리지 않도록 하위 폴더에 둔다.
+    return Path(folder) / CATALOG_DIR_NAME / CATALOG_FILE_NAME
+
+
+def _is_photo_name(name: str) -> bool:
+    return not name.startswith(".") and os.path.splitext(name)[1].lower() in PHOTO_EXTENSIONS
+
+
+def meta_text(meta: dict) -> dict[str, str]:
+    text = {META_PREFIX + key: str(meta[key]) for key in META_FIELDS if meta.get(key) is not None}
+    if meta.get("dhash") is not None:
+        text[HASH_KEY] = photo_hash.to_hex(meta["dhash"])
+    return text
+
+
+def read_photo_meta(path: str | os.PathLike) -> dict:
+    # PNG는 헤더 쪽 텍스트 청크만 읽는다. 없으면 파일 이름에서 이름, 날짜, 찍은 시각을 꺼낸다.
+    meta = {}
+    if Path(path).suffix.lower() == ".png":
+        try:
+            text = png_writer.read_text(path)
+        except OSError:
+            text = {}
+        for key in META_FIELDS:
+            value = text.get(META_PREFIX + key)
+            if value is not None:
+                meta[key] = value
+        value = photo_hash.from_hex(text.get(HASH_KEY))
+        dhash = photo_hash.to_hex(value) if value is not None else None
+    else:
+        dhash = None
+    if not meta:
+        match = _NAME_PATTERN.match(Path(path).stem)
+        if match:
+            meta["player"] = match.group("player")
+            meta["day"] = match.group("day")
+            try:
+                stamp = datetime.datetime.strptime(match.group("stamp"), "%Y%m%d_%H%M%S")
+                meta["taken_at"] = stamp.isoformat(timespec="seconds")
+            except ValueError:
+                pass
+    try:
+        meta["day"] = int(meta["day"]) if meta.get("day") is not None else None
+    except (TypeError, ValueError):
+        meta["day"] = None
+    meta["dhash"] = dhash
+    return meta
+
+
+def _row(name: str, mtime_ns: int, size: int, meta: dict) -> tuple:
+    return (name, mtime_ns, size, *(meta.get(key) for key in META_FIELDS), meta.get("dhash"))
+
+
+def _time_ns(value) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime.datetime):
+        return int(value.timestamp() * 1_000_000_000)
+    if isinstance(value, datetime.date):
+        return int(datetime.datetime.combine(value, datetime.time()).timestamp() * 1_000_000_000)
+    return int(value)
+
+
+class AlbumCatalog:
+    # 앨범 폴더의 사진 목록을 SQLite에 (이름, 수정 시각, 크기, 사진 메타데이터)로 들고 있는다.
+    # take_photo와 삭제는 한 줄씩 바로 반영하고, 바깥에서 폴더가 바뀐 경우는
+    # 폴더 수정 시각이 기록과 다를 때만 os.scandir로 한 번 맞춘다.
+    def __init__(self, folder: str | os.PathLike):
+        self.folder = Path(folder)
+        self.path = catalog_path(folder)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(_META_TABLE)
+        if self._meta("schema") != str(SCHEMA_VERSION):
+            # 색인일 뿐이므로 스키마가 바뀌면 버리고 다음 reconcile에서 다시 채운다.
+            with self._conn:
+                self._conn.execute("DROP TABLE IF EXISTS photos")
+                self._set_meta("schema", str(SCHEMA_VERSION))
+                self._set_meta("folder_mtime_ns", "")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _meta(self, key: str) -> str | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def data_version(self) -> int:
+        # 다른 연결(중복 검사 작업 스레드 등)이 커밋할 때마다 바뀌는 값. 이 연결의 커밋으로는 바뀌지 않는다.
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def folder_stamp(self) -> str:
+        # 폴더 수정 시각(ns). 사진을 쓰거나 지우기 직전에 받아 add/remove에 넘긴다.
+        try:
+            return str(os.stat(self.folder).st_mtime_ns)
+        except OSError:
+            return ""
+
+    def reconcile(self, *, force: bool = False) -> bool:
+        # 폴더가 바뀌었을 때만 다시 훑는다. 실제로 훑었으면 True.
+        folder_mtime = self.folder_stamp()
+        if not force and folder_mtime and folder_mtime == self._meta("folder_mtime_ns"):
+            return False
+
+        found = {}
+        try:
+            with os.scandir(self.folder) as entries:
+                for entry in entries:
+                    if not _is_photo_name(entry.name):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    found[entry.name] = (int(stat.st_mtime_ns), int(stat.st_size))
+        except OSError:
+            pass
+
+        known = dict(
+            (name, (mtime_ns, size))
+            for name, mtime_ns, size in self._conn.execute("SELECT name, mtime_ns, size FROM photos")
+        )
+        with self._conn:
+            gone = [(name,) for name in known if name not in found]
+            if gone:
+                self._conn.executemany("DELETE FROM photos WHERE name = ?", gone)
+                self._conn.executemany("UPDATE photos SET dup_of = NULL WHERE dup_of = ?", gone)
+            changed = [
+                _row(name, *info, read_photo_meta(self.folder / name))
+                for name, info in found.items()
+                if known.get(name) != info
+            ]
+            if changed:
+                self._conn.executemany(_UPSERT, changed)
+            self._set_meta("folder_mtime_ns", folder_mtime)
+        return True
+
+    def add(self, path: str | os.PathLike, stamp: str | None = None):
+        path = Path(path)
+        stat = path.stat()
+        row = _row(path.name, int(stat.st_mtime_ns), int(stat.st_size), read_photo_meta(path))
+        with self._conn:
+            self._conn.execute(_UPSERT, row)
+            self._advance_stamp(stamp)
+
+    def remove(self, path: str | os.PathLike, stamp: str | None = None):
+        self.remove_many([path], stamp)
+
+    def remove_many(self, paths, stamp: str | None = None):
+        # 지운 사진을 대표로 둔 중복은 다시 보이게 한다.
+        names = [(Path(path).name,) for path in paths]
+        with self._conn:
+            self._conn.executemany("DELETE FROM photos WHERE name = ?", names)
+            self._conn.executemany("UPDATE photos SET dup_of = NULL WHERE dup_of = ?", names)
+            self._advance_stamp(stamp)
+
+    def _advance_stamp(self, stamp: str | None):
+        # 변경 직전 폴더 시각이 기록과 같았다면 바뀐 것은 방금 반영한 파일뿐이다.
+        # 아니면 바깥 변경이 섞였을 수 있으니 기록을 그대로 두어 다음 reconcile이 훑게 한다.
+        if stamp and stamp == self._meta("folder_mtime_ns"):
+            self._set_meta("folder_mtime_ns", self.folder_stamp())
+
+    def count(self, *, since=None, until=None, collapse: bool = False, **filters) -> int:
+        where, args = self._where(since, until, filters, collapse)
+        return self._conn.execute(f"SELECT COUNT(*) FROM photos{where}", args).fetchone()[0]
+
+    def page(
+        self,
+        offset: int = 0,
+        limit: int = PAGE_SIZE,
+        *,
+        since=None,
+        until=None,
+        collapse: bool = False,
+        **filters,
+    ) -> list[str]:
+        # 최신 사진부터. limit이 음수면 끝까지.
+        # since/until은 datetime, date 또는 ns 정수이며 until은 포함하지 않는다.
+        # filters는 GROUP_FIELDS 중 하나를 키로 같은 값만 고른다(day=3, stage="adult").
+        # collapse가 참이면 중복 묶음에서 대표 한 장만 남긴다.
+        where, args = self._where(since, until, filters, collapse)
+        rows = self._conn.execute(
+            f"SELECT name FROM photos{where} ORDER BY mtime_ns DESC, name DESC LIMIT ? OFFSET ?",
+            (*args, int(limit) if int(limit) >= 0 else -1, max(0, int(offset))),
+        )
+        return [str(self.folder / name) for (name,) in rows]
+
+    def paths(self) -> list[str]:
+        return self.page(0, -1)
+
+    def index_of(self, path: str | os.PathLike, *, collapse: bool = False, **filters) -> int | None:
+        name = Path(path).name
+        row = self._conn.execute("SELECT mtime_ns FROM photos WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        where, args = self._where(None, None, filters, collapse)
+        order = "(mtime_ns > ? OR (mtime_ns = ? AND name > ?))"
+        where = f"{where} AND {order}" if where else f" WHERE {order}"
+        return self._conn.execute(
+            f"SELECT COUNT(*) FROM photos{where}", (*args, row[0], row[0], name)
+        ).fetchone()[0]
+
+    def metadata(self, path: str | os.PathLike) -> dict:
+        row = self._conn.execute(
+            f"SELECT {', '.join(META_FIELDS)} FROM photos WHERE name = ?", (Path(path).name,)
+        ).fetchone()
+        return dict(zip(META_FIELDS, row)) if row else {}
+
+    def groups(self, field: str, *, collapse: bool = False) -> list[tuple[object, int]]:
+        # (값, 장수). 날짜는 최근 날부터, 나머지는 이름순. 값이 없는 사진은 None으로 묶인다.
+        if field not in GROUP_FIELDS:
+            raise ValueError(f"묶을 수 없는 필드입니다: {field}")
+        order = "DESC" if field == "day" else "ASC"
+        where = " WHERE dup_of IS NULL" if collapse else ""
+        rows = self._conn.execute(
+            f"SELECT {field}, COUNT(*) FROM photos{where} GROUP BY {field} "
+            f"ORDER BY {field} IS NULL, {field} {order}"
+        )
+        return [(value, count) for value, count in rows]
+
+    def days(self) -> list[tuple[str, int]]:
+        # (YYYY-MM-DD, 장수). 최신 날짜부터.
+        rows = self._conn.execute(
+            "SELECT date(mtime_ns / 1000000000, 'unixepoch', 'localtime') AS day, COUNT(*) "
+            "FROM photos GROUP BY day ORDER BY day DESC"
+        )
+        return [(day, count) for day, count in rows]
+
+    def missing_hashes(self) -> list[str]:
+        # 해시가 없는 사진(예전 사진, JPG). 중복 검사 작업 스레드가 디코딩해서 채운다.
+        rows = self._conn.execute(f"SELECT name FROM photos WHERE dhash IS NULL AND {_NOT_CLIP}")
+        return [str(self.folder / name) for (name,) in rows]
+
+    def set_hashes(self, pairs):
+        # (경로, 해시) 목록
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE photos SET dhash = ? WHERE name = ?",
+                [(photo_hash.to_hex(value), Path(path).name) for path, value in pairs],
+            )
+
+    def hashes(self) -> list[tuple[str, int, tuple, str | None]]:
+        # (경로, 해시, (이름, 날짜, 단계), 찍은 시각).
+        # 묶음의 첫 장이 대표가 되도록 큰 파일(HD 사진)부터, 같으면 최신부터.
+        rows = self._conn.execute(
+            f"SELECT name, dhash, player, day, stage, taken_at FROM photos WHERE dhash IS NOT NULL AND {_NOT_CLIP} "
+            "ORDER BY size DESC, mtime_ns DESC, name DESC"
+        )
+        result = []
+        for name, text, player, day, stage, taken_at in rows:
+            value = photo_hash.from_hex(text)
+            if value is not None:
+                result.append((str(self.folder / name), value, (player, day, stage), taken_at))
+        return result
+
+    def set_duplicates(self, groups):
+        # groups: 경로 묶음 목록. 첫 장이 대표이고 나머지는 dup_of에 대표 이름을 적는다.
+        rows = [
+            (Path(group[0]).name, Path(path).name)
+            for group in groups
+            for path in group[1:]
+        ]
+        with self._conn:
+            self._conn.execute("UPDATE photos SET dup_of = NULL WHERE dup_of IS NOT NULL")
+            self._conn.executemany("UPDATE photos SET dup_of = ? WHERE name = ?", rows)
+
+    def duplicate_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM photos WHERE dup_of IS NOT NULL").fetchone()[0]
+
+    def duplicates(self) -> list[tuple[str, str]]:
+        # (대표가 아닌 중복 사진 경로, 대표 경로). 한꺼번에 정리할 때 쓴다.
+        rows = self._conn.execute("SELECT name, dup_of FROM photos WHERE dup_of IS NOT NULL")
+        return [(str(self.folder / name), str(self.folder / dup_of)) for name, dup_of in rows]
+
+    def _where(self, since, until, filters: dict, collapse: bool = False) -> tuple[str, tuple]:
+        clauses = []
+        args = []
+        if collapse:
+            clauses.append("dup_of IS NULL")
+        since_ns = _time_ns(since)
+        until_ns = _time_ns(until)
+        if since_ns is not None:
+            clauses.append("mtime_ns >= ?")
+            args.append(since_ns)
+        if until_ns is not None:
+            clauses.append("mtime_ns < ?")
+            args.append(until_ns)
+        for field, value in filters.items():
+            if field not in GROUP_FIELDS:
+                raise ValueError(f"거를 수 없는 필드입니다: {field}")
+            if value is None:
+                clauses.append(f"{field} IS NULL")
+            else:
+                clauses.append(f"{field} = ?")
+                args.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), tuple(args)
+
+
+class CatalogView:
+    # AlbumUI가 리스트처럼 쓰는 지연 목록. len()과 [i]에 필요한 페이지만 읽고
+    # 최근 max_pages 페이지만 들고 있는다. 다른 연결이 카탈로그를 고치면 개수와 페이지를 함께 버리고,
+    # 그래도 len()과 [i] 사이에 줄어들 수 있으므로 부르는 쪽은 IndexError를 목록 끝으로 본다.
+    def __init__(
+        self,
+        catalog: AlbumCatalog,
+        *,
+        page_size: int = PAGE_SIZE,
+        max_pages: int = 8,
+        collapse: bool = False,
+        **filters,
+    ):
+        self.catalog = catalog
+        self.filters = filters
+        self.collapse = bool(collapse)
+        self.page_size = max(1, int(page_size))
+        self.max_pages = max(1, int(max_pages))
+        self._count = None
+        self._version = None
+        self._pages: OrderedDict[int, list[str]] = OrderedDict()
+        self._index: dict[str, int] = {}
+
+    def refresh(self):
+        self._count = None
+        self._pages.clear()
+        self._index.clear()
+
+    def _check_version(self):
+        version = self.catalog.data_version()
+        if version != self._version:
+            self.refresh()
+            self._version = version
+
+    def __len__(self) -> int:
+        self._check_version()
+        if self._count is None:
+            self._count = self.catalog.count(collapse=self.collapse, **self.filters)
+        return self._count
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self):
+        for index in range(len(self)):
+            try:
+                yield self[index]
+            except IndexError:
+                return
+
+    def __getitem__(self, index: int) -> str:
+        count = len(self)
+        index = int(index)
+        if index < 0:
+            index += count
+        if not (0 <= index < count):
+            raise IndexError(index)
+        page_no, offset = divmod(index, self.page_size)
+        page = self._pages.get(page_no)
+        if page is None:
+            page = self._load_page(page_no)
+        else:
+            self._pages.move_to_end(page_no)
+        if offset >= len(page):
+            # 개수를 읽은 뒤 다른 연결이 사진을 빼서 페이지가 짧아졌다. 다음 접근에서 다시 센다.
+            self.refresh()
+            raise IndexError(index)
+        return page[offset]
+
+    def _load_page(self, page_no: int) -> list[str]:
+        base = page_no * self.page_size
+        page = self.catalog.page(base, self.page_size, collapse=self.collapse, **self.filters)
+        self._pages[page_no] = page
+        for offset, path in enumerate(page):
+            self._index[path] = base + offset
+        while len(self._pages) > self.max_pages:
+            _, old = self._pages.popitem(last=False)
+            for path in old:
+                self._index.pop(path, None)
+        return page
+
+    def index_of(self, path: str) -> int | None:
+        self._check_version()
+        index = self._index.get(path)
+        if index is not None:
+            return index
+        return self.catalog.index_of(path, collapse=self.collapse, **self.filters)
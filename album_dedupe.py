@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import datetime
+import os
+import sqlite3
+import threading
+from collections import deque
+from pathlib import Path
+
+import pygame
+
+import photo_hash
+from album_catalog import AlbumCatalog
+
+
+# 해시를 이만큼 계산할 때마다 카탈로그에 한 번에 적는다.
+HASH_BATCH = 64
+# 같은 고양이/날짜/단계이면서 찍은 시각이 이 안쪽인 사진끼리만 중복으로 본다(연속으로 찍은 사진).
+SAME_SHOT_SECONDS = 5
+
+
+class DuplicateScanner:
+    # 거의 같은 사진을 찾고 정리하는 일을 작업 스레드 하나에서 한다.
+    # scan()은 해시가 없는 사진(예전 사진, JPG)만 디코딩해서 채운 뒤 전체 해시로 묶음을 다시 짜고,
+    # cleanup()은 대표가 아닌 중복을 지운다. 해시만으로는 배경이 같은 다른 장면이 가까울 수 있어
+    # 메타데이터까지 같은 사진만 묶고, 지우기 직전에도 대표와 다시 비교한다.
+    # SQLite 연결은 스레드끼리 나눠 쓸 수 없어서 작업 스레드가 카탈로그를 따로 열며,
+    # 결과는 UI 스레드가 poll()로 가져가 목록을 새로 고친다.
+    def __init__(self, folder: str | os.PathLike, *, max_distance: int = photo_hash.DUPLICATE_DISTANCE):
+        self.folder = Path(folder)
+        self.max_distance = max(0, int(max_distance))
+        # (해시를 채운 장수, 채워야 할 장수). UI가 진행률을 그릴 때 읽기만 한다.
+        self.progress = (0, 0)
+        self._jobs: deque = deque()
+        self._done: list[tuple[str, object]] = []
+        # 지금 돌고 있는 작업("scan"/"cleanup") 또는 None
+        self.task = None
+        self._cond = threading.Condition()
+        self._stop = False
+        self._thread = threading.Thread(target=self._work, name="album-dedupe", daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        with self._cond:
+            return self.task is not None or bool(self._jobs)
+
+    def scan(self):
+        self._submit("scan")
+
+    def cleanup(self):
+        self._submit("cleanup")
+
+    def poll(self) -> list[tuple[str, object]]:
+        # [("scan", 중복 장수), ("cleanup", 지운 경로 목록), ("error", 메시지)]
+        with self._cond:
+            done, self._done = self._done, []
+        return done
+
+    def close(self):
+        with self._cond:
+            self._stop = True
+            self._jobs.clear()
+            self._cond.notify_all()
+
+    def _submit(self, kind: str):
+        with self._cond:
+            if kind not in self._jobs:
+                self._jobs.append(kind)
+            self._cond.notify()
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._jobs and not self._stop:
+                    self._cond.wait()
+                if self._stop:
+                    return
+                kind = self._jobs.popleft()
+                self.task = kind
+            try:
+                with AlbumCatalog(self.folder) as catalog:
+                    result = (kind, self._scan(catalog) if kind == "scan" else self._cleanup(catalog))
+            except (OSError, sqlite3.Error) as exc:
+                result = ("error", str(exc) or type(exc).__name__)
+            with self._cond:
+                self.task = None
+                if result[1] is not None:
+                    self._done.append(result)
+
+    def _scan(self, catalog: AlbumCatalog) -> int | None:
+        missing = catalog.missing_hashes()
+        self.progress = (0, len(missing))
+        batch = []
+        for index, path in enumerate(missing, 1):
+            if self._stop:
+                return None
+            value = _hash_file(path)
+            if value is not None:
+                batch.append((path, value))
+            if len(batch) >= HASH_BATCH:
+                catalog.set_hashes(batch)
+                batch = []
+            self.progress = (index, len(missing))
+        catalog.set_hashes(batch)
+
+        # hashes()는 대표로 남길 사진부터 돌려주므로 묶음의 첫 장이 곧 대표다.
+        # 이름/날짜/단계가 같은 사진끼리 먼저 나눠서 그 안에서만 해시를 비교한다.
+        rows = _shot_rows(catalog)
+        shots: dict[tuple, list] = {}
+        for path, (value, shot, _) in rows.items():
+            shots.setdefault(shot, []).append((path, value))
+        groups = []
+        for items in shots.values():
+            if len(items) > 1:
+                groups += photo_hash.duplicate_groups(
+                    items, self.max_distance, lambda rep, path: _close_in_time(rows[rep], rows[path])
+                )
+        catalog.set_duplicates(groups)
+        return sum(len(group) - 1 for group in groups)
+
+    def _cleanup(self, catalog: AlbumCatalog) -> list[str]:
+        folder = self.folder.resolve()
+        stamp = catalog.folder_stamp()
+        rows = _shot_rows(catalog)
+        removed = []
+        for path, rep in catalog.duplicates():
+            if self._stop:
+                break
+            if not self._same_photo(rows.get(rep), rows.get(path)):
+                continue
+            try:
+                target = Path(path).resolve()
+                if target.parent != folder or not Path(rep).is_file():
+                    continue
+                target.unlink()
+            except OSError:
+                continue
+            removed.append(path)
+        catalog.remove_many(removed, stamp)
+        return removed
+
+    def _same_photo(self, rep, row) -> bool:
+        # 묶은 뒤 사진이 바뀌었을 수 있으니 지우기 전에 묶을 때의 조건을 그대로 다시 본다.
+        if rep is None or row is None or rep[1] != row[1]:
+            return False
+        return photo_hash.hamming(rep[0], row[0]) <= self.max_distance and _close_in_time(rep, row)
+
+
+def _shot_rows(catalog: AlbumCatalog) -> dict[str, tuple]:
+    # {경로: (해시, (이름, 날짜, 단계), 찍은 시각)}. 찍은 시각을 모르는 사진은 중복으로 묶지 않는다.
+    rows = {}
+    for path, value, shot, taken_at in catalog.hashes():
+        try:
+            taken = datetime.datetime.fromisoformat(taken_at)
+        except (TypeError, ValueError):
+            continue
+        rows[path] = (value, shot, taken)
+    return rows
+
+
+def _close_in_time(a: tuple, b: tuple) -> bool:
+    return abs((a[2] - b[2]).total_seconds()) <= SAME_SHOT_SECONDS
+
+
+def _hash_file(path: str) -> int | None:
+    try:
+        return photo_hash.dhash(pygame.image.load(path))
+    except (OSError, TypeError, ValueError, pygame.error):
+        return None
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+import pygame
+
+from album_thumbs import FAILED, PENDING, READY, fit_image
+from surface_cache import SurfaceLRU
+
+
+PREFETCH_RADIUS = 2
+
+
+class ImagePrefetcher:
+    # 원본 보기용 사진을 작업 스레드에서 디코딩·축소한다.
+    # focus()가 불릴 때마다 세대(generation)를 올리고 예전 요청을 큐에서 버린 뒤,
+    # 선택한 사진부터 ±radius 이웃을 가까운 순서로 넣는다. 이미 디코딩 중인 사진은
+    # 끝까지 돌고 결과는 캐시에 들어가며, 큐에 남아 있던 옛 세대 작업은 건너뛴다.
+    def __init__(self, size, cache: SurfaceLRU, *, radius: int = PREFETCH_RADIUS):
+        self.size = (int(size[0]), int(size[1]))
+        self.cache = cache
+        self.radius = max(0, int(radius))
+        self.generation = 0
+        self.skipped = 0
+        self._focus = None
+        self._pending: set[str] = set()
+        self._jobs: deque = deque()
+        self._done: list[tuple[str, pygame.Surface | None]] = []
+        self._cond = threading.Condition()
+        self._stop = False
+        self._thread = threading.Thread(target=self._work, name="album-prefetch", daemon=True)
+        self._thread.start()
+
+    def focus(self, index: int, photos) -> str | None:
+        # photos[index]를 보여 주려 할 때 프레임마다 불러도 된다. 선택이 바뀐 경우만 큐를 다시 짠다.
+        # photos는 카탈로그 목록일 수 있어 len()과 [i] 사이에 줄어들면 IndexError가 난다.
+        try:
+            if not (0 <= index < len(photos)):
+                return None
+            path = photos[index]
+            if self._focus == (index, path):
+                return path
+
+            order = [index]
+            for step in range(1, self.radius + 1):
+                order.extend((index + step, index - step))
+            wanted = [photos[i] for i in order if 0 <= i < len(photos)]
+        except IndexError:
+            return None
+        self._focus = (index, path)
+
+        with self._cond:
+            self.generation += 1
+            self.skipped += len(self._jobs)
+            for _, stale in self._jobs:
+                self._pending.discard(stale)
+            self._jobs.clear()
+            for target in wanted:
+                if target in self._pending or target in self.cache:
+                    continue
+                self._pending.add(target)
+                self._jobs.append((self.generation, target))
+            self._cond.notify()
+        return path
+
+    def get(self, path: str) -> tuple[str, pygame.Surface | None]:
+        with self._cond:
+            if path in self._pending:
+                return PENDING, None
+        found, image = self.cache.lookup(path)
+        if found:
+            return (READY, image) if image is not None else (FAILED, None)
+        # focus 없이 요청된 경우(캐시에서 밀려난 뒤 등)에도 다시 불러온다.
+        with self._cond:
+            self._pending.add(path)
+            self._jobs.appendleft((self.generation, path))
+            self._cond.notify()
+        return PENDING, None
+
+    def poll(self, distance=None) -> int:
+        with self._cond:
+            done, self._done = self._done, []
+            # pending에서 빠져 있으면 그 사이 invalidate된 사진이다.
+            done = [(path, image) for path, image in done if path in self._pending]
+            self._pending.difference_update(path for path, _ in done)
+        for path, image in done:
+            if image is not None:
+                try:
+                    image = image.convert_alpha()
+                except pygame.error:
+                    pass
+            self.cache.put(path, image, distance)
+        return len(done)
+
+    def invalidate(self, path: str):
+        with self._cond:
+            self._pending.discard(path)
+        self.cache.discard(path)
+        self._focus = None
+
+    def close(self):
+        with self._cond:
+            self._stop = True
+            self._jobs.clear()
+            self._cond.notify_all()
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._jobs and not self._stop:
+                    self._cond.wait()
+                if self._stop:
+                    return
+                generation, path = self._jobs.popleft()
+                if generation != self.generation or path not in self._pending:
+                    self.skipped += 1
+                    continue
+            image = self._load(path)
+            with self._cond:
+                self._done.append((path, image))
+
+    def _load(self, path: str) -> pygame.Surface | None:
+        try:
+            image = pygame.image.load(path)
+        except (OSError, TypeError, ValueError, pygame.error):
+            return None
+        return fit_image(image, self.size)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from pathlib import Path
+
+import pygame
+
+from surface_cache import SurfaceLRU
+
+
+THUMB_DIR_NAME = ".thumbs"
+THUMB_SUFFIX = ".png"
+DEFAULT_WORKERS = 2
+# 126x150 RGBA 기준 약 110장
+THUMB_BUDGET_BYTES = 8 * 1024 * 1024
+
+# get()이 돌려주는 상태
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+
+
+def thumb_folder(folder: str | os.PathLike) -> Path:
+    return Path(folder) / THUMB_DIR_NAME
+
+
+def thumb_key(path: str | os.PathLike) -> tuple[str, int, int]:
+    # 같은 이름으로 다시 저장된 사진도 구분되도록 (파일명, 수정 시각, 크기)를 키로 쓴다.
+    stat = os.stat(path)
+    return (Path(path).name, int(stat.st_mtime_ns), int(stat.st_size))
+
+
+def thumb_name(key: tuple[str, int, int], size: tuple[int, int]) -> str:
+    name, mtime_ns, file_size = key
+    return f"{name}.{mtime_ns}_{file_size}_{size[0]}x{size[1]}{THUMB_SUFFIX}"
+
+
+def fit_image(image: pygame.Surface, max_size) -> pygame.Surface | None:
+    width, height = image.get_size()
+    if width <= 0 or height <= 0:
+        return None
+    scale = min(max_size[0] / width, max_size[1] / height, 1.0)
+    size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    try:
+        return pygame.transform.smoothscale(image, size)
+    except ValueError:
+        # smoothscale은 24/32비트만 받는다. 팔레트 PNG 등은 일반 scale로 줄인다.
+        return pygame.transform.scale(image, size)
+
+
+class ThumbnailStore:
+    # 앨범 썸네일을 album/.thumbs 아래 PNG로 보관한다.
+    # 디코딩·축소·저장은 전부 작업 스레드에서 하고, UI 스레드는 get()으로 상태만 묻고
+    # poll()에서 완성된 표면을 넘겨받는다. 요청은 LIFO라 마지막에 보인 카드부터 처리된다.
+    # 메모리에는 budget_bytes만큼만 두고, 넘치면 화면에서 먼 썸네일부터 내보낸다.
+    def __init__(
+        self,
+        folder: str | os.PathLike,
+        size=(126, 150),
+        *,
+        workers: int = DEFAULT_WORKERS,
+        budget_bytes: int = THUMB_BUDGET_BYTES,
+    ):
+        self.folder = Path(folder)
+        self.thumb_dir = thumb_folder(folder)
+        self.size = (int(size[0]), int(size[1]))
+
+        self.cache = SurfaceLRU(budget_bytes)
+        self._pending: set[str] = set()
+        self._done: list[tuple[str, pygame.Surface | None]] = []
+        self._lock = threading.Lock()
+        self._queue: queue.LifoQueue = queue.LifoQueue()
+        self._stop = threading.Event()
+        self._threads = []
+        for index in range(max(1, int(workers))):
+            thread = threading.Thread(target=self._work, name=f"album-thumbs-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def get(self, path: str) -> tuple[str, pygame.Surface | None]:
+        if path in self._pending:
+            return PENDING, None
+        found, thumb = self.cache.lookup(path)
+        if found:
+            return (READY, thumb) if thumb is not None else (FAILED, None)
+        self._pending.add(path)
+        self._queue.put(path)
+        return PENDING, None
+
+    def poll(self, distance=None) -> int:
+        # UI 스레드에서 프레임마다 호출한다. 새로 준비된 썸네일 수를 돌려준다.
+        # distance(path)는 화면에서 얼마나 먼지를 돌려주며 예산을 넘을 때 내보낼 순서가 된다.
+        with self._lock:
+            done, self._done = self._done, []
+        for path, thumb in done:
+            if path not in self._pending:
+                # 그 사이 invalidate된 요청의 결과는 버린다.
+                continue
+            self._pending.discard(path)
+            if thumb is not None:
+                try:
+                    thumb = thumb.convert_alpha()
+                except pygame.error:
+                    pass
+            self.cache.put(path, thumb, distance)
+        return len(done)
+
+    def invalidate(self, path: str):
+        self.cache.discard(path)
+        self._pending.discard(path)
+        self._remove_thumbs({Path(path).name})
+
+    def invalidate_many(self, paths):
+        # 여러 장을 지울 때 썸네일 폴더를 한 번만 훑는다.
+        names = set()
+        for path in paths:
+            self.cache.discard(path)
+            self._pending.discard(path)
+            names.add(Path(path).name)
+        if names:
+            self._remove_thumbs(names)
+
+    def close(self):
+        self._stop.set()
+        for _ in self._threads:
+            self._queue.put(None)
+
+    def _remove_thumbs(self, names: set[str], keep: str | None = None):
+        try:
+            entries = list(os.scandir(self.thumb_dir))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name == keep:
+                continue
+            # 썸네일 이름은 "사진 이름.수정시각_..."이다. 사진 이름에도 점이 있을 수 있어 점마다 잘라 본다.
+            cuts = [i for i, ch in enumerate(entry.name) if ch == "."]
+            if any(entry.name[:i] in names for i in cuts):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def _work(self):
+        while not self._stop.is_set():
+            path = self._queue.get()
+            if path is None or self._stop.is_set():
+                return
+            thumb = self._build(path)
+            with self._lock:
+                self._done.append((path, thumb))
+
+    def _build(self, path: str) -> pygame.Surface | None:
+        try:
+            key = thumb_key(path)
+        except OSError:
+            return None
+        cached = self.thumb_dir / thumb_name(key, self.size)
+        try:
+            return pygame.image.load(str(cached))
+        except (OSError, TypeError, ValueError, pygame.error):
+            pass
+
+        try:
+            image = pygame.image.load(path)
+        except (OSError, TypeError, ValueError, pygame.error):
+            return None
+        thumb = fit_image(image, self.size)
+        if thumb is None:
+            return None
+
+        try:
+            self.thumb_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_name(f"{cached.name}.{threading.get_ident()}.tmp{THUMB_SUFFIX}")
+            pygame.image.save(thumb, str(tmp))
+            os.replace(tmp, cached)
+        except (OSError, pygame.error):
+            return thumb
+        # 수정 전 사진의 썸네일은 새 썸네일을 쓴 뒤에 정리한다.
+        self._remove_thumbs({key[0]}, keep=cached.name)
+        return thumb
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import math
+import threading
+
+import pygame
+
+from surface_cache import SurfaceLRU
+
+
+TILE = 256
+ZOOM_STEP = 1.25
+MAX_ZOOM = 8.0
+PINCH_SPEED = 4.0
+# 화면 배율에 맞춰 다시 줄인 타일 캐시. 356x436 보기에 타일이 20장 남짓 보이므로 넉넉하다.
+VIEW_TILE_BUDGET_BYTES = 6 * 1024 * 1024
+
+
+class TilePyramid:
+    # 원본을 TILE 크기 타일로 나눈 밉맵 피라미드. 0단계 타일은 원본의 subsurface이고,
+    # k단계 타일은 필요할 때 k-1단계의 2x2 타일을 이어 붙여 절반으로 smoothscale해서 만든다.
+    # 그래서 보이는 영역에 필요한 타일만, 단계마다 한 번씩만 만든다.
+    def __init__(self, source: pygame.Surface):
+        self.source = source
+        width, height = source.get_size()
+        self.sizes = [(width, height)]
+        while self.sizes[-1][0] > 1 or self.sizes[-1][1] > 1:
+            w, h = self.sizes[-1]
+            self.sizes.append(((w + 1) // 2, (h + 1) // 2))
+        self._tiles: dict[tuple[int, int, int], pygame.Surface] = {}
+        self.built = 0
+
+    @property
+    def levels(self) -> int:
+        return len(self.sizes)
+
+    def level_for(self, zoom: float) -> int:
+        # 배율이 zoom 이상인 단계 중 가장 작은 것. 화면에서는 (0.5, 1] 배로 더 줄여 그린다.
+        if zoom >= 1.0:
+            return 0
+        return max(0, min(self.levels - 1, int(math.floor(math.log2(1.0 / zoom)))))
+
+    def tile_count(self, level: int) -> tuple[int, int]:
+        w, h = self.sizes[level]
+        return (w + TILE - 1) // TILE, (h + TILE - 1) // TILE
+
+    def tile_rect(self, level: int, tx: int, ty: int) -> pygame.Rect:
+        w, h = self.sizes[level]
+        x = tx * TILE
+        y = ty * TILE
+        return pygame.Rect(x, y, min(TILE, w - x), min(TILE, h - y))
+
+    def tile(self, level: int, tx: int, ty: int) -> pygame.Surface:
+        if level == 0:
+            return self.source.subsurface(self.tile_rect(0, tx, ty))
+        key = (level, tx, ty)
+        cached = self._tiles.get(key)
+        if cached is not None:
+            return cached
+
+        rect = self.tile_rect(level, tx, ty)
+        child_w, child_h = self.sizes[level - 1]
+        region = pygame.Rect(tx * TILE * 2, ty * TILE * 2, 0, 0)
+        region.width = min(TILE * 2, child_w - region.x)
+        region.height = min(TILE * 2, child_h - region.y)
+        joined = pygame.Surface(region.size, 0, self.source)
+        cols, rows = self.tile_count(level - 1)
+        for cy in (ty * 2, ty * 2 + 1):
+            for cx in (tx * 2, tx * 2 + 1):
+                if cx < cols and cy < rows:
+                    joined.blit(self.tile(level - 1, cx, cy), (cx * TILE - region.x, cy * TILE - region.y))
+        built = pygame.transform.smoothscale(joined, rect.size)
+        self._tiles[key] = built
+        self.built += 1
+        return built
+
+
+class ZoomView:
+    # 원본 보기의 확대/이동 상태. zoom은 원본 1픽셀이 화면 몇 픽셀인지, center는 보기 중앙의 원본 좌표.
+    # 맞춤 배율일 때는 미리 읽어 둔 축소본을 그대로 쓰고, 처음 확대할 때 원본 해상도 파일을
+    # 스레드에서 읽어 TilePyramid를 만든다. 그동안은 축소본을 늘려 보여 준다.
+    def __init__(self, area):
+        self.area = pygame.Rect(area)
+        self.path = None
+        self.pyramid = None
+        self.size = None
+        self.fit_zoom = 1.0
+        self.zoom = 1.0
+        self.center = (0.0, 0.0)
+        self.dragging = False
+        self.view_tiles = SurfaceLRU(VIEW_TILE_BUDGET_BYTES)
+        self._loading = None
+        self._loaded = None
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.size is not None and self.zoom > self.fit_zoom * 1.001
+
+    def show(self, path: str | None, fitted: pygame.Surface | None = None):
+        # 프레임마다 불러도 된다. 다른 사진으로 넘어가면 맞춤 배율로 돌아간다.
+        # 원본 크기를 알기 전에는 축소본 크기를 원본 크기로 삼고, 원본을 읽으면 고친다.
+        if path != self.path:
+            self.path = path
+            self.pyramid = None
+            self.size = None
+            self.dragging = False
+            self.view_tiles.clear()
+            self._loading = None
+            with self._lock:
+                self._loaded = None
+        if self.size is None and fitted is not None:
+            self._set_size(fitted.get_size())
+            self.zoom = self.fit_zoom
+            self.center = (self.size[0] / 2, self.size[1] / 2)
+
+    def _set_size(self, size):
+        self.size = (max(1, size[0]), max(1, size[1]))
+        self.fit_zoom = min(self.area.width / self.size[0], self.area.height / self.size[1], 1.0)
+
+    def zoom_by(self, factor: float, anchor=None):
+        if self.size is None:
+            return
+        new_zoom = max(self.fit_zoom, min(max(MAX_ZOOM, self.fit_zoom), self.zoom * factor))
+        if self.pyramid is None and new_zoom > self.fit_zoom:
+            self._start_loading()
+        if anchor is not None and self.area.collidepoint(anchor):
+            # 커서 아래 원본 점이 제자리에 남도록 중앙을 옮긴다.
+            ax = anchor[0] - self.area.centerx
+            ay = anchor[1] - self.area.centery
+            px = self.center[0] + ax / self.zoom
+            py = self.center[1] + ay / self.zoom
+            self.center = (px - ax / new_zoom, py - ay / new_zoom)
+        self.zoom = new_zoom
+        self._clamp()
+
+    def pan(self, dx: float, dy: float):
+        if not self.active:
+            return
+        self.center = (self.center[0] - dx / self.zoom, self.center[1] - dy / self.zoom)
+        self._clamp()
+
+    def handle_event(self, event) -> bool:
+        # 확대/이동에 쓴 이벤트면 True를 돌려준다.
+        if self.size is None:
+            return False
+        if event.type == pygame.MOUSEWHEEL:
+            self.zoom_by(ZOOM_STEP ** event.y, pygame.mouse.get_pos())
+            return True
+        if event.type == pygame.MULTIGESTURE and event.num_fingers >= 2:
+            # 좌표는 창 기준 0~1로 온다.
+            width, height = pygame.display.get_surface().get_size()
+            self.zoom_by(1.0 + event.pinched * PINCH_SPEED, (event.x * width, event.y * height))
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.area.collidepoint(event.pos):
+            self.dragging = self.active
+            return self.dragging
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.dragging:
+            self.dragging = False
+            return True
+        if event.type == pygame.MOUSEMOTION and self.dragging:
+            self.pan(*event.rel)
+            return True
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                self.zoom_by(ZOOM_STEP)
+                return True
+            if event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                self.zoom_by(1 / ZOOM_STEP)
+                return True
+            if event.key in (pygame.K_0, pygame.K_KP0):
+                self.zoom_by(0.0)
+                return True
+        return False
+
+    def _clamp(self):
+        cx, cy = self.center
+        view_w = self.area.width / self.zoom
+        view_h = self.area.height / self.zoom
+        # 이미지가 보기보다 작으면 가운데에 두고, 크면 가장자리를 넘지 않게 한다.
+        if self.size[0] <= view_w:
+            cx = self.size[0] / 2
+        else:
+            cx = max(view_w / 2, min(self.size[0] - view_w / 2, cx))
+        if self.size[1] <= view_h:
+            cy = self.size[1] / 2
+        else:
+            cy = max(view_h / 2, min(self.size[1] - view_h / 2, cy))
+        self.center = (cx, cy)
+
+    def _start_loading(self):
+        if self._loading == self.path:
+            return
+        self._loading = path = self.path
+
+        def load():
+            try:
+                image = pygame.image.load(path)
+            except (OSError, TypeError, ValueError, pygame.error):
+                image = None
+            with self._lock:
+                if self.path == path:
+                    self._loaded = image
+
+        threading.Thread(target=load, name="album-zoom-load", daemon=True).start()
+
+    def poll(self):
+        with self._lock:
+            image, self._loaded = self._loaded, None
+        if image is None or self.pyramid is not None or self.size is None:
+            return
+        try:
+            image = image.convert()
+        except pygame.error:
+            pass
+        # 화면 배율이 그대로 남도록 축소본 기준 좌표를 원본 기준으로 옮긴다.
+        ratio = image.get_width() / self.size[0]
+        self.center = (self.center[0] * ratio, self.center[1] * ratio)
+        self.zoom /= ratio
+        self._set_size(image.get_size())
+        self._clamp()
+        self.pyramid = TilePyramid(image)
+
+    def draw(self, surface: pygame.Surface, fitted: pygame.Surface | None = None):
+        old_clip = surface.get_clip()
+        surface.set_clip(self.area)
+        if self.pyramid is None:
+            # 원본을 읽는 동안은 축소본을 늘려 보여 준다.
+            if fitted is not None:
+                self._blit_region(surface, fitted)
+        elif self.zoom > 1.0:
+            self._blit_region(surface, self.pyramid.source)
+        else:
+            surface.blits(self._visible_tiles(), doreturn=False)
+        surface.set_clip(old_clip)
+
+    def _visible_tiles(self) -> list:
+        # 배율에 맞는 단계에서 보기와 겹치는 타일만 골라 화면 크기로 줄인다.
+        # 바꾼 타일은 view_tiles에 두므로 배율이 그대로인 이동 중에는 다시 만들지 않는다.
+        pyramid = self.pyramid
+        level = pyramid.level_for(self.zoom)
+        level_zoom = self.zoom * (1 << level)
+        cx = self.center[0] / (1 << level)
+        cy = self.center[1] / (1 << level)
+        half_w = self.area.width / 2 / level_zoom
+        half_h = self.area.height / 2 / level_zoom
+        cols, rows = pyramid.tile_count(level)
+        tx0 = max(0, int((cx - half_w) // TILE))
+        ty0 = max(0, int((cy - half_h) // TILE))
+        tx1 = min(cols - 1, int((cx + half_w) // TILE))
+        ty1 = min(rows - 1, int((cy + half_h) // TILE))
+
+        blits = []
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                rect = pyramid.tile_rect(level, tx, ty)
+                # 이웃 타일 사이에 틈이 생기지 않게 양쪽 모서리를 따로 반올림한다.
+                x0 = round(self.area.centerx + (rect.left - cx) * level_zoom)
+                y0 = round(self.area.centery + (rect.top - cy) * level_zoom)
+                x1 = round(self.area.centerx + (rect.right - cx) * level_zoom)
+                y1 = round(self.area.centery + (rect.bottom - cy) * level_zoom)
+                if x1 <= x0 or y1 <= y0:
+                    continue
+                key = (level, tx, ty, x1 - x0, y1 - y0)
+                found, scaled = self.view_tiles.lookup(key)
+                if not found:
+                    scaled = pygame.transform.smoothscale(pyramid.tile(level, tx, ty), (x1 - x0, y1 - y0))
+                    self.view_tiles.put(key, scaled)
+                blits.append((scaled, (x0, y0)))
+        return blits
+
+    def _blit_region(self, surface, image):
+        # image는 원본 전체를 담은 어떤 크기의 그림이든 된다(원본 또는 축소본).
+        # 통째로 키우면 수십 MB가 되므로 보이는 영역만 잘라 한 번에 키운다.
+        # 결과가 보기 크기라 캐시하지 않는다. 확대는 픽셀이 또렷하게 보이는 scale을 쓴다.
+        scale = self.zoom * self.size[0] / image.get_width()
+        left = self.area.centerx - self.center[0] * self.zoom
+        top = self.area.centery - self.center[1] * self.zoom
+        crop = pygame.Rect(
+            int((self.area.left - left) // scale),
+            int((self.area.top - top) // scale),
+            int(self.area.width // scale) + 2,
+            int(self.area.height // scale) + 2,
+        ).clip(image.get_rect())
+        if crop.width <= 0 or crop.height <= 0:
+            return
+        size = (max(1, round(crop.width * scale)), max(1, round(crop.height * scale)))
+        region = pygame.transform.scale(image.subsurface(crop), size)
+        surface.blit(region, (round(left + crop.x * scale), round(top + crop.y * scale)))
+
+    def close(self):
+        self.show(None)
@@ -1,7 +1,8 @@
+import math
 import pygame
 import sys
 import os
-import random
+import threading
 from cat import Cat
 import state
 from game import MiniGameScreen
@@ -11,23 +12,46 @@ from album import AlbumUI
 from competition_ui import CompetitionUI
 import save
 import evolution
+import evolution_forecast
+import care_planner
 import competition
 from config import asset_path, base_path
-from items import inventory_item_from_shop_id, normalize_inventory, normalize_inventory_item
+from items import apply_item_effect, get_item_info, inventory_item_from_shop_id, normalize_inventory, normalize_inventory_item
 from pg_utils import load_font, load_image, load_sound, play_music
 from achievements import AchievementsManager, draw_toasts
 from achievements_ui import AchievementsUI
 from pathlib import Path
 from start_flow import StartFlow
 from pause_menu import PauseMenu
-from photo_mode import take_photo
+from photo_clip import FrameRing
+from photo_mode import PhotoWriter
+from particles import ParticleSystem
+from rng import STREAM_CAT, STREAM_CAT_IMAGE, STREAM_COMPETITION, STREAM_DIALOGUE, STREAM_EFFECTS, STREAM_HOUSEHOLD
+from household import CatHousehold
+from household_ui import HouseholdUI
 
 WIDTH = 400
 HEIGHT = 600
 FPS = 60
 
 BACK_IMAGE = asset_path("ui", "background.png")
+COIN_IMAGE = asset_path("ui", "coin.png")
+COIN_SIZE = 36
 FONT_PATH = asset_path("fonts", "ThinDungGeunMo.ttf")
+FONT_SIZES = {
+    "font": 18,
+    "name_font": 18,
+    "big_font": 22,
+    "panel_font": 17,
+    "tab_font": 18,
+    "stat_font": 16,
+    "hint_font": 16,
+    "coin_font": 20,
+}
+# Shift+F12는 2배, Ctrl+F12는 3배로 메인 장면을 다시 그려 찍는다.
+HD_PHOTO_SCALES = (2, 3)
+# 진화 메뉴의 예상 확률이 가정하는 돌보기 정책(evolution_forecast.CARE_POLICIES)
+EVOLUTION_FORECAST_POLICY = "evolve"
 
 INFO_X = 8
 INFO_Y = 18
@@ -68,7 +92,8 @@ CAT_IMAGE_LAYOUT_OVERRIDES = {
 
 CARE_ACTION_LABELS = ("밥", "놀기", "씻기", "잠자기", "진화")
 CARE_ACTION_KEYS = ("feed", "play", "clean", "sleep")
-MENU_ACTION_LABELS = ("설정", "미니게임", "대회", "상점", "가방", "업적", "앨범")
+CARE_ACTION_METHODS = {"feed": "feed_free", "play": "play_free", "clean": "clean", "sleep": "sleep"}
+MENU_ACTION_LABELS = ("설정", "미니게임", "대회", "상점", "가방", "업적", "앨범", "가족")
 CAT_IMAGE_ROTATE_CHANCE = 0.20
 
 CAT_CLICK_LINES = {
@@ -280,6 +305,10 @@ class Game:
 
         self.toast_text = ""
         self.toast_timer = 0.0
+        self.photo_writer = PhotoWriter()
+        self.clip_ring = FrameRing()
+        self.hd_photo = None
+        self._hd_assets = {}
         self.cat_dialogue_text = ""
         self.cat_dialogue_timer = 0.0
 
@@ -294,21 +323,15 @@ class Game:
         self.back_image = pygame.transform.scale(self.back_image, (WIDTH, HEIGHT))
         self.back_rect = self.back_image.get_rect(topleft=(0, 0))
 
-        self.coin_image = load_image(asset_path("ui", "coin.png"), size=(36, 36), smooth=True, alpha=True)
+        self.coin_image = load_image(COIN_IMAGE, size=(COIN_SIZE, COIN_SIZE), smooth=True, alpha=True)
         self.click_sound = load_sound(asset_path("sounds", "button.mp3"), volume=0.25)
 
         play_music(asset_path("sounds", "bgm.mp3"), volume=1, loops=-1)
 
     def _init_fonts(self):
         pygame.font.init()
-        self.font = load_font(FONT_PATH, 18)
-        self.name_font = load_font(FONT_PATH, 18)
-        self.big_font = load_font(FONT_PATH, 22)
-        self.panel_font = load_font(FONT_PATH, 17)
-        self.tab_font = load_font(FONT_PATH, 18)
-        self.stat_font = load_font(FONT_PATH, 16)
-        self.hint_font = load_font(FONT_PATH, 16)
-        self.coin_font = load_font(FONT_PATH, 20)
+        for name, size in FONT_SIZES.items():
+            setattr(self, name, load_font(FONT_PATH, size))
 
     def _init_achievements(self):
         try:
@@ -320,6 +343,7 @@ class Game:
 
     def _init_game_defaults(self):
         self.cat = None
+        self.household = self._new_household()
         self.panel_open = False
         self.left_panel_open = False
         self.game_over_reason = None
@@ -328,16 +352,22 @@ class Game:
         self.competition = competition.new_competition_data()
         self.scene = "MAIN"
         self.actions_used = {"feed": False, "play": False, "clean": False, "sleep": False}
+        self._forecast_key = None
+        self._forecast_line = ""
+        self._care_plan_key = None
+        self._care_plan = None
         self._cat_image_path = None
         self._cat_image = None
         self._cat_image_stage = None
         self._cat_display_image = None
         self._cat_display_body_rect = None
+        self._cat_crop = None
         self._cat_rect = None
         self._cat_click_count = 0
         if not hasattr(self.state, "minigame_used"):
             self.state.minigame_used = state.new_minigame_usage()
         self.evolve_timer = 0
+        self.evolve_particles = ParticleSystem(capacity=512, color=(255, 230, 120), radius=4, gravity=260.0)
 
         self.evolve_menu_timer = 0
 
@@ -363,7 +393,7 @@ class Game:
         if not isinstance(name, str) or not isinstance(stage, str):
             return
 
-        self.cat = Cat(name, stage, difficulty=self.difficulty, personality=self.personality)
+        self.cat = self._new_cat(name, stage)
         try:
             self.cat.hunger = state.clamp(float(cat_data.get("hunger", 50)))
             self.cat.tiredness = state.clamp(float(cat_data.get("tiredness", 20)))
@@ -376,8 +406,20 @@ class Game:
         self.inventory = normalize_inventory(data.get("inventory", {}))
         self.state.minigame_used = state.normalize_minigame_usage(data.get("minigame_used"))
         self.competition = competition.normalize_competition_data(data.get("competition"))
+        self.household = self._new_household(data.get("household"))
+        self.state.rng.restore(data.get("rng"))
         self.scene = "MAIN"
 
+    def _new_cat(self, name: str, stage: str) -> Cat:
+        return Cat(
+            name,
+            stage,
+            difficulty=self.difficulty,
+            personality=self.personality,
+            rng=self.state.rng.stream(STREAM_CAT),
+            image_rng=self.state.rng.stream(STREAM_CAT_IMAGE),
+        )
+
     def load_image(self, filename):
         image = load_image(filename, alpha=True)
         if image is None:
@@ -422,6 +464,7 @@ class Game:
             self.update(dt)
             self.draw()
 
+        self.photo_writer.close()
         pygame.quit()
         sys.exit()
 
@@ -437,7 +480,8 @@ class Game:
         if not hasattr(self.state, "minigame_used"):
             self.state.minigame_used = state.new_minigame_usage()
 
-        self.cat = Cat(name, "아기고양이", difficulty=self.difficulty, personality=self.personality)
+        self.cat = self._new_cat(name, "아기고양이")
+        self.household = self._new_household()
         self.inventory = {}
         self.competition = competition.new_competition_data()
         self.actions_used = {"feed": False, "play": False, "clean": False, "sleep": False}
@@ -463,8 +507,10 @@ class Game:
         phase = self.state.advance_time()
         if phase == state.NIGHT:
             self.cat.on_night()
+            self.household.on_night()
         else:
             self.cat.on_morning()
+            self.household.on_morning()
             self._grant_day_reward()
 
         self.actions_used = {"feed": False, "play": False, "clean": False, "sleep": False}
@@ -516,12 +562,7 @@ class Game:
         return can_evo
 
     def _consume_required_evolution_item(self, stage):
-        required_item = None
-        if stage == evolution.ADULT:
-            required_item = "고기"
-        elif stage == evolution.LION:
-            required_item = "뼈"
-
+        required_item = evolution.EVOLUTION_ITEM.get(stage)
         if required_item is None:
             return True
         if self.inventory.get(required_item, 0) <= 0:
@@ -574,6 +615,7 @@ class Game:
         self.state = state.GameState()
         self.difficulty = "normal"
         self.cat = None
+        self.household = self._new_household()
         self.panel_open = False
         self.left_panel_open = False
         self.game_over_reason = None
@@ -622,6 +664,8 @@ class Game:
             "inventory": clean_inventory,
             "minigame_used": state.normalize_minigame_usage(getattr(self.state, "minigame_used", None)),
             "competition": competition.copy_for_save(getattr(self, "competition", None)),
+            "household": self.household.to_save(),
+            "rng": self.state.rng.snapshot(),
             "cat": {
                 "name": self.cat.name,
                 "stage": self.cat.stage,
@@ -693,7 +737,13 @@ class Game:
             return {"ok": False, "message": "참가비가 부족합니다.", "competition_data": self.competition}
 
         self.state.money = money - fee
-        score = competition.roll_score(comp["id"], self.cat, self.state, self.inventory)
+        score = competition.roll_score(
+            comp["id"],
+            self.cat,
+            self.state,
+            self.inventory,
+            rng=self.state.rng.stream(STREAM_COMPETITION),
+        )
         grade = competition.grade_for_score(score, self.difficulty)
         reward = competition.reward_for_grade(comp, grade, self.difficulty)
         self.state.money += reward
@@ -731,6 +781,20 @@ class Game:
         self.left_panel_open = False
         AlbumUI(self.screen, self.play_click_sound).run()
 
+    def open_household(self):
+        self.panel_open = False
+        self.left_panel_open = False
+        HouseholdUI(
+            self.screen,
+            self.household,
+            self.difficulty,
+            self.play_click_sound,
+            on_change=lambda: save.save_game(self.make_save_data()),
+        ).run()
+
+    def _new_household(self, data=None) -> CatHousehold:
+        return CatHousehold.from_save(data, rng=self.state.rng.stream(STREAM_HOUSEHOLD))
+
     def open_evolve_menu(self):
         if not self.cat:
             return
@@ -763,6 +827,9 @@ class Game:
 
         lines = [f"현재: {stage} → 다음: {next_stage}", f"비용: {cost} 코인"]
         lines.extend(self._evolution_requirement_lines(stage))
+        forecast_line = self._evolution_forecast_line(stage)
+        if forecast_line:
+            lines.append(forecast_line)
         lines.append(f"상태: {'진화 가능' if can_evo else status_msg}")
         return {
             "next_stage": next_stage,
@@ -788,6 +855,26 @@ class Game:
             ]
         return ["조건: -"]
 
+    def _evolution_forecast_line(self, stage, policy=EVOLUTION_FORECAST_POLICY):
+        if stage not in evolution.EVOLUTION_STAT_RANGE:
+            return ""
+        used = tuple(sorted(CARE_ACTION_METHODS[key] for key, done in self.actions_used.items() if done))
+        try:
+            stats = tuple(int(getattr(self.cat, key)) for key in evolution_forecast.STAT_KEYS)
+        except (TypeError, ValueError):
+            return ""
+        key = (stats, stage, self.cat.difficulty, self.cat.personality, self.state.day, self.state.time_phase, used, policy)
+        if self._forecast_key != key:
+            horizon = max(0, evolution.EVOLUTION_DAY.get(stage, 0) - self.state.day) + 3
+            forecast = evolution_forecast.forecast_evolution(
+                self.cat, self.state.day, self.state.time_phase, policy=policy, used_actions=used, days=horizon
+            )
+            days = [f"{entry['day']}일 {entry['ready'] * 100:.0f}%" for entry in forecast if entry["day_ok"]][:2]
+            label = evolution_forecast.POLICY_LABELS.get(policy, "직접 고름")
+            self._forecast_key = key
+            self._forecast_line = f"예상({label}): {', '.join(days)}" if days else ""
+        return self._forecast_line
+
 
     def try_evolve_now(self):
         info = self.get_evolve_menu_info()
@@ -817,27 +904,10 @@ class Game:
         if not self.cat or item not in self.inventory or self.inventory[item] <= 0:
             return
 
-        used = True
-        if item == "사료":
-            self.cat.hunger = max(0, self.cat.hunger - 30)
-        elif item == "생선":
-            self.cat.hunger = max(0, self.cat.hunger - 50)
-        elif item == "츄르":
-            self.cat.hunger = max(0, self.cat.hunger - 70)
-        elif item == "강아지풀":
-            self.cat.happiness = min(state.MAX_STAT, self.cat.happiness + 20)
-        elif item == "실":
-            self.cat.happiness = min(state.MAX_STAT, self.cat.happiness + 30)
-        elif item == "낚싯대":
-            self.cat.happiness = min(state.MAX_STAT, self.cat.happiness + 50)
-        else:
-            used = False
-
-        if not used:
+        if not apply_item_effect(self.cat, item):
             return
 
         self.inventory[item] -= 1
-        self.cat._clamp_all()
         save.save_game(self.make_save_data())
 
     def on_buy_item(self, item):
@@ -934,7 +1004,7 @@ class Game:
         self.cat_dialogue_text = self._cat_dialogue_line()
         self.cat_dialogue_timer = 2.2
 
-        if random.random() < CAT_IMAGE_ROTATE_CHANCE and self.cat.rotate_image():
+        if self.state.rng.stream(STREAM_DIALOGUE).random() < CAT_IMAGE_ROTATE_CHANCE and self.cat.rotate_image():
             self._cat_image_path = None
             self._cat_image = None
             self._cat_image_stage = None
@@ -944,6 +1014,7 @@ class Game:
         return True
 
     def _cat_dialogue_line(self):
+        rng = self.state.rng.stream(STREAM_DIALOGUE)
         for stat_name, threshold, lines in CAT_NEED_LINES:
             value = getattr(self.cat, stat_name, 0)
             try:
@@ -953,13 +1024,13 @@ class Game:
 
             if stat_name in ("happiness", "cleanliness"):
                 if value <= threshold:
-                    return random.choice(lines)
+                    return rng.choice(lines)
             elif value >= threshold:
-                return random.choice(lines)
+                return rng.choice(lines)
 
         personality = state.normalize_personality(getattr(self.cat, "personality", None))
         lines = CAT_CLICK_LINES.get(personality, CAT_CLICK_LINES["default"])
-        return random.choice(lines)
+        return rng.choice(lines)
 
     def _handle_care_panel_click(self, pos):
         panel_x = WIDTH - PANEL_W - 8
@@ -968,14 +1039,13 @@ class Game:
             self.panel_open = False
             return True
 
-        actions = ("feed_free", "play_free", "clean", "sleep")
         for index, key in enumerate(CARE_ACTION_KEYS):
             if self._panel_button_rect(panel_x, index).collidepoint(pos):
                 self.play_click_sound()
                 if self.actions_used[key]:
                     return True
                 if self.cat:
-                    getattr(self.cat, actions[index])()
+                    getattr(self.cat, CARE_ACTION_METHODS[key])()
                     self.actions_used[key] = True
                     save.save_game(self.make_save_data())
                     self.check_game_over()
@@ -1004,6 +1074,7 @@ class Game:
             self.open_bag,
             self.open_achievements,
             self.open_album,
+            self.open_household,
         )
         for index, action in enumerate(actions):
             if self._panel_button_rect(panel_x, index).collidepoint(pos):
@@ -1049,7 +1120,16 @@ class Game:
             return True
 
         if event.type == pygame.KEYDOWN and event.key == pygame.K_F12:
-            self._take_photo_toast()
+            if event.mod & pygame.KMOD_CTRL:
+                self._take_hd_photo_toast(HD_PHOTO_SCALES[1])
+            elif event.mod & pygame.KMOD_SHIFT:
+                self._take_hd_photo_toast(HD_PHOTO_SCALES[0])
+            else:
+                self._take_photo_toast()
+            return True
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+            self._take_clip_toast()
             return True
 
         return False
@@ -1066,6 +1146,8 @@ class Game:
             self.request_quit = True
         elif action == "photo":
             self._take_photo_toast()
+        elif action == "photo_hd":
+            self._take_hd_photo_toast(HD_PHOTO_SCALES[0])
         elif action == "album":
             self.open_album()
 
@@ -1096,6 +1178,8 @@ class Game:
             self.handle_click_evolve_menu(event.pos)
 
     def update(self, dt: float):
+        self._poll_photo_writer()
+        self._advance_hd_photo()
         if self.toast_timer > 0.0:
             self.toast_timer = max(0.0, float(self.toast_timer) - float(dt))
         if self.cat_dialogue_timer > 0.0:
@@ -1104,22 +1188,109 @@ class Game:
         if self.paused:
             return
 
+    def _photo_meta(self):
+        if not self.cat:
+            return {"player_name": "player"}
+        return {
+            "player_name": getattr(self.cat, "name", "player") or "player",
+            "day": getattr(self.state, "day", None),
+            "stage": getattr(self.cat, "stage", None),
+            "difficulty": getattr(self.state, "difficulty", None),
+        }
+
     def _take_photo_toast(self):
+        # 픽셀만 떠서 넘기고, 저장이 끝나면 _poll_photo_writer가 토스트를 바꾼다.
         try:
-            if not self.cat:
-                path = take_photo(self.screen, player_name="player")
-            else:
-                path = take_photo(
-                    self.screen,
-                    player_name=getattr(self.cat, "name", "player") or "player",
-                    day=getattr(self.state, "day", None),
-                    stage=getattr(self.cat, "stage", None),
-                )
-            self.toast_text = f"앨범 저장됨: {os.path.basename(path)}"
+            path = self.photo_writer.capture(self.screen, **self._photo_meta())
+            self.toast_text = "사진 저장 중..." if path else "아직 앞 사진을 저장하는 중입니다"
+        except (OSError, TypeError, ValueError, pygame.error):
+            self.toast_text = "사진 저장 실패"
+        self.toast_timer = 2.5
+
+    def _take_hd_photo_toast(self, scale):
+        # 메인 장면(배경, 고양이, 상태 표시)만 scale배로 다시 그린다. 다른 장면은 보통 사진으로 찍는다.
+        if self.scene != "MAIN" or not self.cat:
+            self._take_photo_toast()
+            return
+        if self.hd_photo is not None:
+            self.toast_text = "아직 HD 사진을 준비하는 중입니다"
+        else:
+            self.hd_photo = self._hd_photo_steps(scale)
+            self.toast_text = f"HD 사진({scale}배) 준비 중..."
+        self.toast_timer = 2.5
+
+    def _hd_photo_steps(self, scale):
+        # 원본 그림을 읽어 키우는 일은 그림마다 작업 스레드에 맡기고 끝날 때까지 프레임을 넘긴다.
+        # 그림이 다 모이면 한 프레임에 같은 상태로 장면 전체를 그려 PhotoWriter에 넘긴다.
+        # 한 번 만든 그림은 _hd_assets에 남아 다음 HD 사진에서 바로 쓴다.
+        for name in ("back", "coin", "cat"):
+            key = self._scene_asset_key(name, scale)
+            if key in self._hd_assets:
+                continue
+            cat_source = None
+            if name == "cat":
+                # 고양이 그림이 바뀌었으면 예전 그림의 확대본은 버린다.
+                for stale in [k for k in self._hd_assets if k[0] == "cat" and k[1:3] != key[1:3]]:
+                    del self._hd_assets[stale]
+                if self._cat_image is not None:
+                    cropped, body_rect = self._cropped_cat_image(self._cat_image)
+                    cat_source = (cropped.copy(), body_rect)
+            result = []
+            worker = threading.Thread(
+                target=lambda: result.append(self._build_scene_asset(name, scale, cat_source)),
+                name="hd-photo-asset",
+                daemon=True,
+            )
+            worker.start()
+            while worker.is_alive():
+                yield
+            # 화면 형식으로 바꿔 두지 않으면 마지막 프레임의 blit이 몇 배 느려진다.
+            self._hd_assets[key] = self._display_format(result[0] if result else None)
+        shot = pygame.Surface((WIDTH * scale, HEIGHT * scale))
+        self._draw_game_view_base(shot, scale)
+        path = self.photo_writer.capture(shot, scale=scale, **self._photo_meta())
+        self.toast_text = "HD 사진 저장 중..." if path else "아직 앞 사진을 저장하는 중입니다"
+        self.toast_timer = 2.5
+
+    def _display_format(self, asset):
+        surface = asset[0] if isinstance(asset, tuple) else asset
+        if surface is None:
+            return asset
+        try:
+            surface = surface.convert_alpha()
+        except pygame.error:
+            return asset
+        return (surface, asset[1]) if isinstance(asset, tuple) else surface
+
+    def _advance_hd_photo(self):
+        if self.hd_photo is None:
+            return
+        if self.scene != "MAIN" or not self.cat:
+            # 준비하는 사이 장면이 바뀌면 찍지 않는다.
+            self.hd_photo = None
+            return
+        try:
+            next(self.hd_photo)
+        except StopIteration:
+            self.hd_photo = None
         except (OSError, TypeError, ValueError, pygame.error):
+            self.hd_photo = None
             self.toast_text = "사진 저장 실패"
+            self.toast_timer = 2.5
+
+    def _take_clip_toast(self):
+        path = self.photo_writer.capture_clip(self.clip_ring, **self._photo_meta())
+        self.toast_text = "움짤 저장 중..." if path else "아직 앞 사진을 저장하는 중입니다"
         self.toast_timer = 2.5
 
+    def _poll_photo_writer(self):
+        for path, error in self.photo_writer.poll():
+            if path:
+                self.toast_text = f"앨범 저장됨: {os.path.basename(path)}"
+            else:
+                self.toast_text = "사진 저장 실패"
+            self.toast_timer = 2.5
+
     def _draw_photo_toast(self):
         if self.toast_timer <= 0.0 or not self.toast_text:
             return
@@ -1166,7 +1337,7 @@ class Game:
         self.screen.blit(label, text_rect)
 
     def handle_click_evolve_menu(self, pos):
-        panel_w, panel_h = 340, 260
+        panel_w, panel_h = 340, 282
         panel_x = WIDTH // 2 - panel_w // 2
         panel_y = 170
         panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
@@ -1187,18 +1358,21 @@ class Game:
                 self.try_evolve_now()
             return
 
-    def draw_bar(self, x, y, label, value, color):
+    def draw_bar(self, x, y, label, value, color, target=None, scale=1):
+        target = self.screen if target is None else target
+        x, y = x * scale, y * scale
+        bar_w, bar_h = BAR_WIDTH * scale, BAR_HEIGHT * scale
         ratio = value / state.MAX_STAT
-        fill = int(BAR_WIDTH * ratio)
+        fill = int(bar_w * ratio)
 
-        text = self.stat_font.render(f"{label}: {int(value)}", True, (0, 0, 0))
-        self.screen.blit(text, (x, y - 14))
+        text = self._scene_font("stat_font", scale).render(f"{label}: {int(value)}", True, (0, 0, 0))
+        target.blit(text, (x, y - 14 * scale))
 
-        pygame.draw.rect(self.screen, (0, 0, 0), (x, y, BAR_WIDTH, BAR_HEIGHT), 1)
+        pygame.draw.rect(target, (0, 0, 0), (x, y, bar_w, bar_h), scale)
         pygame.draw.rect(
-            self.screen,
+            target,
             color,
-            (x + 2, y + 2, max(0, fill - 4), BAR_HEIGHT - 4)
+            (x + 2 * scale, y + 2 * scale, max(0, fill - 4 * scale), bar_h - 4 * scale)
         )
 
     def draw_game_over(self):
@@ -1282,73 +1456,149 @@ class Game:
         if include_pause and self.paused and self.pause_menu:
             self.pause_menu.draw()
         self._draw_cat_dialogue()
+        # 움짤 링 버퍼에는 사진 토스트를 빼고 담는다.
+        self.clip_ring.sample(self.screen, pygame.time.get_ticks())
         self._draw_photo_toast()
         pygame.display.flip()
 
-    def _draw_game_view_base(self):
-        self.screen.blit(self.back_image, self.back_rect)
-        self._draw_day_phase_info()
-        self._draw_money()
-        self._draw_stats()
-        self._draw_cat_sprite()
-
-    def _draw_day_phase_info(self):
+    def _draw_game_view_base(self, target=None, scale=1):
+        # target과 scale을 주면 같은 장면을 scale배 크기의 다른 Surface에 그린다(HD 사진).
+        # 좌표 상수는 400x600 기준이라 모두 scale을 곱해서 쓴다.
+        target = self.screen if target is None else target
+        back = self._scene_asset("back", scale)
+        if back is None:
+            back = pygame.transform.scale(self.back_image, target.get_size())
+        target.blit(back, (0, 0))
+        self._draw_day_phase_info(target, scale)
+        self._draw_money(target, scale)
+        self._draw_stats(target, scale)
+        self._draw_cat_sprite(target, scale)
+
+    def _draw_day_phase_info(self, target=None, scale=1):
+        target = self.screen if target is None else target
         diff_label = state.get_difficulty_label(self.difficulty)
         phase_label = "아침" if self.state.time_phase == state.MORNING else "밤"
         info = f"{self.state.day}일차 - {phase_label} ({diff_label})"
-        self.screen.blit(self.font.render(info, True, (0, 0, 0)), (INFO_X, INFO_Y))
+        target.blit(self._scene_font("font", scale).render(info, True, (0, 0, 0)), (INFO_X * scale, INFO_Y * scale))
 
-    def _draw_money(self):
+    def _draw_money(self, target=None, scale=1):
+        target = self.screen if target is None else target
         money = getattr(self.state, "money", 0)
-        if self.coin_image:
-            self.screen.blit(self.coin_image, (INFO_X, INFO_Y + 22))
-            coin_text = self.coin_font.render(f"{money}", True, (0, 0, 0))
-            self.screen.blit(coin_text, (INFO_X + 42, INFO_Y + 28))
+        coin_font = self._scene_font("coin_font", scale)
+        coin_image = self._scene_asset("coin", scale)
+        if coin_image:
+            target.blit(coin_image, (INFO_X * scale, (INFO_Y + 22) * scale))
+            coin_text = coin_font.render(f"{money}", True, (0, 0, 0))
+            target.blit(coin_text, ((INFO_X + 42) * scale, (INFO_Y + 28) * scale))
             return
 
-        coin_text = self.coin_font.render(f"🪙 {money}", True, (0, 0, 0))
-        self.screen.blit(coin_text, (INFO_X, INFO_Y + 22))
+        coin_text = coin_font.render(f"🪙 {money}", True, (0, 0, 0))
+        target.blit(coin_text, (INFO_X * scale, (INFO_Y + 22) * scale))
 
-    def _draw_stats(self):
-        self.draw_bar(STAT_X, STAT_Y_START, "배고픔", self.cat.hunger, (255, 100, 100))
-        self.draw_bar(STAT_X, STAT_Y_START + STAT_GAP, "피로", self.cat.tiredness, (100, 100, 255))
-        self.draw_bar(STAT_X, STAT_Y_START + 2 * STAT_GAP, "행복", self.cat.happiness, (100, 255, 100))
-        self.draw_bar(STAT_X, STAT_Y_START + 3 * STAT_GAP, "청결", self.cat.cleanliness, (180, 180, 180))
+    def _draw_stats(self, target=None, scale=1):
+        self.draw_bar(STAT_X, STAT_Y_START, "배고픔", self.cat.hunger, (255, 100, 100), target, scale)
+        self.draw_bar(STAT_X, STAT_Y_START + STAT_GAP, "피로", self.cat.tiredness, (100, 100, 255), target, scale)
+        self.draw_bar(STAT_X, STAT_Y_START + 2 * STAT_GAP, "행복", self.cat.happiness, (100, 255, 100), target, scale)
+        self.draw_bar(STAT_X, STAT_Y_START + 3 * STAT_GAP, "청결", self.cat.cleanliness, (180, 180, 180), target, scale)
 
-    def _draw_cat_sprite(self):
+    def _draw_cat_sprite(self, target=None, scale=1):
+        # 클릭 판정용 _cat_rect는 화면에 그릴 때만 갱신한다.
+        target = self.screen if target is None else target
+        on_screen = target is self.screen
         if not self.cat or not self.cat.image_path:
-            self._cat_rect = None
+            if on_screen:
+                self._cat_rect = None
             return
 
-        cat_stage = getattr(self.cat, "stage", None)
-        if self._cat_image_path != self.cat.image_path or self._cat_image_stage != cat_stage:
-            self._cat_image_path = self.cat.image_path
-            self._cat_image_stage = cat_stage
-            self._cat_image = load_image(self.cat.image_path, alpha=True)
-            self._cat_display_image, self._cat_display_body_rect = self._prepare_cat_display_image(self._cat_image)
+        if scale == 1:
+            cat_stage = getattr(self.cat, "stage", None)
+            if self._cat_image_path != self.cat.image_path or self._cat_image_stage != cat_stage:
+                self._cat_image_path = self.cat.image_path
+                self._cat_image_stage = cat_stage
+                self._cat_image = load_image(self.cat.image_path, alpha=True)
+                self._cat_display_image, self._cat_display_body_rect = self._prepare_cat_display_image(self._cat_image)
+            cat_img, body_rect = self._cat_display_image, self._cat_display_body_rect
+        else:
+            cat_img, body_rect = self._scene_asset("cat", scale)
 
-        cat_img = self._cat_display_image
         if cat_img is None:
-            self._cat_rect = None
+            if on_screen:
+                self._cat_rect = None
             return
 
-        cat_rect = self._cat_display_rect(cat_img)
-        self._cat_rect = cat_rect
-        self.screen.blit(cat_img, cat_rect)
-
-        name_text = self.name_font.render(f"{self.cat.name} - {self.cat.stage}", True, (0, 0, 0))
-        name_rect = name_text.get_rect(center=(WIDTH // 2, cat_rect.top - NAME_Y_OFFSET))
-        self.screen.blit(name_text, name_rect)
+        cat_rect = self._cat_display_rect(cat_img, body_rect, scale, target.get_width())
+        if on_screen:
+            self._cat_rect = cat_rect
+        target.blit(cat_img, cat_rect)
+
+        name_text = self._scene_font("name_font", scale).render(f"{self.cat.name} - {self.cat.stage}", True, (0, 0, 0))
+        name_rect = name_text.get_rect(center=(target.get_width() // 2, cat_rect.top - NAME_Y_OFFSET * scale))
+        target.blit(name_text, name_rect)
+
+    def _scene_font(self, name, scale=1):
+        if scale == 1:
+            return getattr(self, name)
+        key = ("font", name, scale)
+        font = self._hd_assets.get(key)
+        if font is None:
+            font = self._hd_assets[key] = load_font(FONT_PATH, FONT_SIZES[name] * scale)
+        return font
+
+    def _scene_asset_key(self, name, scale):
+        if name == "cat":
+            return ("cat", self._cat_image_path, self._cat_image_stage, scale)
+        return (name, scale)
+
+    def _scene_asset(self, name, scale=1):
+        if scale == 1:
+            return {"back": self.back_image, "coin": self.coin_image}[name]
+        key = self._scene_asset_key(name, scale)
+        if key not in self._hd_assets:
+            self._hd_assets[key] = self._build_scene_asset(name, scale)
+        return self._hd_assets[key]
+
+    def _build_scene_asset(self, name, scale, cat_source=None):
+        # scale배 그림은 화면용 축소본이 아니라 원본 그림에서 다시 만든다.
+        # HD 사진 작업 스레드에서 불리므로 convert 없이 읽고 줄이기만 하고,
+        # 고양이는 화면이 쓰는 Surface를 잠그지 않게 복사본(cat_source)을 받는다.
+        if name == "cat":
+            if cat_source is None:
+                return self._prepare_cat_display_image(self._cat_image, scale)
+            return self._fit_cat_image(*cat_source, scale)
+        path, size = (BACK_IMAGE, (WIDTH, HEIGHT)) if name == "back" else (COIN_IMAGE, (COIN_SIZE, COIN_SIZE))
+        size = (size[0] * scale, size[1] * scale)
+        try:
+            image = pygame.image.load(path)
+        except (OSError, TypeError, ValueError, pygame.error):
+            return None
+        try:
+            return pygame.transform.smoothscale(image, size)
+        except ValueError:
+            # smoothscale은 24/32비트만 받는다.
+            return pygame.transform.scale(image, size)
+
+    def _cropped_cat_image(self, image):
+        # 알파 연결 성분 계산은 비싸서 같은 원본이면 화면용과 HD용이 한 번 잘라 둔 것을 같이 쓴다.
+        cached = self._cat_crop
+        if cached is not None and cached[0] is image:
+            return cached[1], cached[2]
+
+        cropped = image
+        visible_rect = self._visible_alpha_rect(image)
+        if visible_rect.width > 0 and visible_rect.height > 0:
+            cropped = image.subsurface(visible_rect).copy()
+        body_rect = self._main_alpha_rect(cropped)
+        self._cat_crop = (image, cropped, body_rect)
+        return cropped, body_rect
 
-    def _prepare_cat_display_image(self, image):
+    def _prepare_cat_display_image(self, image, scale=1):
         if image is None:
             return None, None
 
-        visible_rect = self._visible_alpha_rect(image)
-        if visible_rect.width > 0 and visible_rect.height > 0:
-            image = image.subsurface(visible_rect).copy()
+        image, body_rect = self._cropped_cat_image(image)
+        return self._fit_cat_image(image, body_rect, scale)
 
-        body_rect = self._main_alpha_rect(image)
+    def _fit_cat_image(self, image, body_rect, scale=1):
         layout = self._cat_image_layout()
         max_w, max_h = layout.get("max_size", CAT_STAGE_MAX_SIZE.get(getattr(self.cat, "stage", None), (220, 220)))
         width, height = image.get_size()
@@ -1356,23 +1606,23 @@ class Game:
             return None, None
 
         area_h = layout.get("bottom", CAT_AREA_BOTTOM) - CAT_AREA_TOP
-        scale = min(
+        fit = min(
             max_w / body_rect.width,
             max_h / body_rect.height,
             CAT_AREA_WIDTH / width,
             area_h / height,
             1.0,
-        )
-        if scale >= 1.0:
+        ) * scale
+        if fit == 1.0:
             return image, body_rect
 
-        target_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        target_size = (max(1, int(width * fit)), max(1, int(height * fit)))
         display = pygame.transform.smoothscale(image, target_size)
         display_body_rect = pygame.Rect(
-            int(round(body_rect.x * scale)),
-            int(round(body_rect.y * scale)),
-            max(1, int(round(body_rect.width * scale))),
-            max(1, int(round(body_rect.height * scale))),
+            int(round(body_rect.x * fit)),
+            int(round(body_rect.y * fit)),
+            max(1, int(round(body_rect.width * fit))),
+            max(1, int(round(body_rect.height * fit))),
         )
         return display, display_body_rect
 
@@ -1411,18 +1661,23 @@ class Game:
             visible_rect.union_ip(rect)
         return visible_rect
 
-    def _cat_display_rect(self, cat_img):
+    def _cat_display_rect(self, cat_img, body_rect=None, scale=1, target_width=WIDTH):
         layout = self._cat_image_layout()
         area_bottom = layout.get("bottom", CAT_AREA_BOTTOM)
-        area = pygame.Rect((WIDTH - CAT_AREA_WIDTH) // 2, CAT_AREA_TOP, CAT_AREA_WIDTH, area_bottom - CAT_AREA_TOP)
+        area = pygame.Rect(
+            (target_width - CAT_AREA_WIDTH * scale) // 2,
+            CAT_AREA_TOP * scale,
+            CAT_AREA_WIDTH * scale,
+            (area_bottom - CAT_AREA_TOP) * scale,
+        )
         rect = cat_img.get_rect()
-        body_rect = getattr(self, "_cat_display_body_rect", None)
         if body_rect is None:
             body_rect = rect.copy()
 
         rect.x = int(round(area.centerx - body_rect.centerx))
         rect.bottom = area.bottom
-        rect.move_ip(*layout.get("offset", (0, 0)))
+        offset_x, offset_y = layout.get("offset", (0, 0))
+        rect.move_ip(offset_x * scale, offset_y * scale)
 
         if rect.top < area.top:
             rect.top = area.top
@@ -1444,6 +1699,26 @@ class Game:
         arrow = self.font.render(label, True, (0, 0, 0))
         self.screen.blit(arrow, arrow.get_rect(center=rect.center))
 
+    def _current_care_plan(self):
+        if not self.cat:
+            return None
+        cat = self.cat
+        if not care_planner.is_ready(cat.difficulty, cat.personality, cat.stage):
+            care_planner.warm_in_background(cat.difficulty, cat.personality, cat.stage)
+            return None
+
+        used = tuple(sorted(CARE_ACTION_METHODS[key] for key, done in self.actions_used.items() if done))
+        try:
+            stats = tuple(int(getattr(cat, key)) for key in evolution_forecast.STAT_KEYS)
+        except (TypeError, ValueError):
+            return None
+        items = tuple(sorted((name, count) for name, count in self.inventory.items() if count > 0))
+        key = (stats, cat.stage, cat.difficulty, cat.personality, self.state.time_phase, used, items)
+        if self._care_plan_key != key:
+            self._care_plan_key = key
+            self._care_plan = care_planner.recommend(cat, self.state.time_phase, used, dict(items))
+        return self._care_plan
+
     def _draw_care_panel(self):
         if not self.panel_open:
             self._draw_arrow_button(ARROW_RECT, "◀")
@@ -1452,13 +1727,26 @@ class Game:
         panel_x = WIDTH - PANEL_W - 8
         self.draw_button(self._panel_close_rect(panel_x), "▶ 닫기", self.panel_font)
 
+        plan = self._current_care_plan()
+        recommended = plan["care"] if plan else ()
         for index, label in enumerate(CARE_ACTION_LABELS):
             rect = self._panel_button_rect(panel_x, index)
             if index < len(CARE_ACTION_KEYS):
-                self.draw_button_state(rect, label, self.panel_font, not self.actions_used[CARE_ACTION_KEYS[index]])
+                key = CARE_ACTION_KEYS[index]
+                self.draw_button_state(rect, label, self.panel_font, not self.actions_used[key])
+                if CARE_ACTION_METHODS[key] in recommended:
+                    pygame.draw.rect(self.screen, (230, 140, 40), rect, 2)
             else:
                 self.draw_button(rect, label, self.panel_font)
 
+        if plan and plan["item"]:
+            item_name = get_item_info(plan["item"]).get("name", plan["item"])
+            hint = self.hint_font.render(f"추천: {item_name} 먼저", True, (150, 80, 20))
+            hint_rect = self._panel_button_rect(panel_x, len(CARE_ACTION_LABELS))
+            pygame.draw.rect(self.screen, (250, 240, 225), hint_rect)
+            pygame.draw.rect(self.screen, (230, 140, 40), hint_rect, 1)
+            self.screen.blit(hint, hint.get_rect(center=hint_rect.center))
+
     def _draw_menu_panel(self):
         if not self.left_panel_open:
             self._draw_arrow_button(LEFT_ARROW_RECT, "▶")
@@ -1494,7 +1782,20 @@ class Game:
     def draw_evolve(self):
         if not self.paused:
             self.evolve_timer += 1
+            if self.evolve_timer == 1:
+                self.evolve_particles.clear()
+                self.evolve_particles.burst(
+                    WIDTH // 2,
+                    250,
+                    160,
+                    self.state.rng.stream(STREAM_EFFECTS),
+                    speed=(120.0, 320.0),
+                    life=(0.9, 1.6),
+                    angle=(math.pi * 1.15, math.pi * 1.85),
+                )
+            self.evolve_particles.update(1 / 60)
         self.screen.fill((0, 0, 0))
+        self.evolve_particles.draw(self.screen)
 
         text1 = self.big_font.render("진화 성공!", True, (255, 255, 255))
         text2 = self.big_font.render(f"{self.cat.stage}", True, (255, 255, 0))
@@ -1512,7 +1813,7 @@ class Game:
         overlay.fill((0, 0, 0, 140))
         self.screen.blit(overlay, (0, 0))
 
-        panel_w, panel_h = 340, 260
+        panel_w, panel_h = 340, 282
         panel_x = WIDTH // 2 - panel_w // 2
         panel_y = 170
         panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
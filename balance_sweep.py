@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import evolution
+import simulation
+import state as game_state
+
+
+DEFAULT_RUNS = 2000
+DEFAULT_CHUNK = 250
+DEFAULT_OUTPUT = "balance_sweep.csv"
+
+CHUNK_FIELDS = (
+    "difficulty",
+    "personality",
+    "policy",
+    "chunk",
+    "seed",
+    "lives",
+    "final_money",
+    "last_days",
+    "outcomes",
+    "evolve_count",
+    "evolve_day_total",
+    "coins_in",
+    "coins_out",
+)
+COUNTER_FIELDS = ("last_days", "outcomes", "evolve_count", "evolve_day_total", "coins_in", "coins_out")
+SURVIVAL_MARKS = (7, 14, 21, 30, 45, 60)
+
+
+def chunk_seed(master_seed: int, difficulty: str, personality: str, policy: str, chunk: int, max_days: int) -> int:
+    text = f"{master_seed}:{difficulty}:{personality}:{policy}:{chunk}:{max_days}"
+    return int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+
+
+def sweep_tasks(difficulties, personalities, policies, runs: int, chunk_size: int, master_seed: int, max_days: int) -> list[dict]:
+    chunk_size = max(1, int(chunk_size))
+    tasks = []
+    for difficulty in difficulties:
+        for personality in personalities:
+            for policy in policies:
+                remaining = max(0, int(runs))
+                chunk = 0
+                while remaining > 0:
+                    size = min(chunk_size, remaining)
+                    tasks.append(
+                        {
+                            "difficulty": difficulty,
+                            "personality": personality,
+                            "policy": policy,
+                            "chunk": chunk,
+                            "runs": size,
+                            "seed": chunk_seed(master_seed, difficulty, personality, policy, chunk, max_days),
+                        }
+                    )
+                    remaining -= size
+                    chunk += 1
+    return tasks
+
+
+def task_key(row) -> tuple[str, str, str, int]:
+    return (row["difficulty"], row["personality"], row["policy"], int(row["chunk"]))
+
+
+def run_task(task: dict, max_days: int) -> tuple[dict, simulation.SimulationReport]:
+    report = simulation.run_simulations(
+        task["runs"],
+        task["difficulty"],
+        task["personality"],
+        task["policy"],
+        max_days=max_days,
+        seed=task["seed"],
+    )
+    return task, report
+
+
+def report_to_row(task: dict, report: simulation.SimulationReport) -> dict:
+    row = {
+        "difficulty": task["difficulty"],
+        "personality": task["personality"],
+        "policy": task["policy"],
+        "chunk": task["chunk"],
+        "seed": task["seed"],
+        "lives": report.lives,
+        "final_money": report.final_money,
+    }
+    for field in COUNTER_FIELDS:
+        counter = getattr(report, field)
+        row[field] = json.dumps({str(key): value for key, value in counter.items()}, ensure_ascii=False, sort_keys=True)
+    return row
+
+
+def report_from_row(row: dict, max_days: int) -> simulation.SimulationReport:
+    report = simulation.SimulationReport(max_days)
+    report.lives = int(row["lives"])
+    report.final_money = int(row["final_money"])
+    for field in COUNTER_FIELDS:
+        data = json.loads(row[field] or "{}")
+        if field == "last_days":
+            data = {int(key): value for key, value in data.items()}
+        setattr(report, field, Counter(data))
+    return report
+
+
+def load_chunks(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    try:
+        with path.open("r", encoding="utf-8", newline="") as f:
+            return [row for row in csv.DictReader(f) if all(row.get(field) for field in CHUNK_FIELDS)]
+    except (OSError, csv.Error):
+        return []
+
+
+def _ends_with_newline(path: Path) -> bool:
+    try:
+        with path.open("rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    except OSError:
+        return True
+
+
+def cell_row(cell: tuple[str, str, str], report: simulation.SimulationReport) -> dict:
+    summary = report.summary()
+    difficulty, personality, policy = cell
+    row = {
+        "difficulty": difficulty,
+        "personality": personality,
+        "policy": policy,
+        "lives": summary["lives"],
+    }
+    curve = summary["survival"]
+    for day in SURVIVAL_MARKS:
+        if day <= len(curve):
+            row[f"survival_d{day}"] = round(curve[day - 1], 4)
+    for key, value in summary["outcomes"].items():
+        row[f"outcome_{key}"] = round(value, 4)
+    for stage in evolution.EVOLUTION_ORDER[1:]:
+        row[f"evolve_{stage}"] = round(summary["evolve_rate"][stage], 4)
+        day = summary["evolve_day"].get(stage)
+        row[f"evolve_day_{stage}"] = round(day, 2) if day is not None else ""
+    row["coins_in"] = round(sum(summary["coins_in"].values()), 2)
+    row["coins_out"] = round(sum(summary["coins_out"].values()), 2)
+    row["final_money"] = round(summary["final_money"], 2)
+    return row
+
+
+def write_cells(path: Path, rows: list[dict]):
+    fields = []
+    for row in rows:
+        for key in row:
+            if key not in fields:
+                fields.append(key)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def run_sweep(
+    output: str | os.PathLike = DEFAULT_OUTPUT,
+    *,
+    difficulties=tuple(game_state.DIFFICULTY_PROFILE),
+    personalities=tuple(game_state.PERSONALITY_PROFILE),
+    policies=tuple(simulation.POLICIES),
+    runs: int = DEFAULT_RUNS,
+    chunk_size: int = DEFAULT_CHUNK,
+    max_days: int = simulation.DEFAULT_MAX_DAYS,
+    seed: int = 0,
+    workers: int | None = None,
+    progress=None,
+) -> list[dict]:
+    output = Path(output)
+    chunk_path = output.with_name(output.name + ".chunks")
+
+    tasks = sweep_tasks(difficulties, personalities, policies, runs, chunk_size, seed, max_days)
+    expected = {task_key(task): task for task in tasks}
+    done = {}
+    for row in load_chunks(chunk_path):
+        key = task_key(row)
+        task = expected.get(key)
+        if task is not None and row["seed"] == str(task["seed"]) and row["lives"] == str(task["runs"]):
+            done[key] = row
+    pending = [task for task in tasks if task_key(task) not in done]
+
+    if pending:
+        new_file = not chunk_path.exists() or not done
+        with chunk_path.open("w" if new_file else "a", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CHUNK_FIELDS)
+            if new_file:
+                writer.writeheader()
+            elif not _ends_with_newline(chunk_path):
+                f.write("\n")
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(run_task, task, max_days) for task in pending]
+                for finished, future in enumerate(as_completed(futures), start=1):
+                    task, report = future.result()
+                    row = report_to_row(task, report)
+                    writer.writerow(row)
+                    f.flush()
+                    done[task_key(task)] = row
+                    if progress is not None:
+                        progress(finished, len(pending))
+
+    cells = {}
+    for task in tasks:
+        row = done[task_key(task)]
+        cell = task_key(task)[:3]
+        report = cells.get(cell)
+        if report is None:
+            report = cells[cell] = simulation.SimulationReport(max_days)
+        report.merge(report_from_row(row, max_days))
+
+    rows = [cell_row(cell, report) for cell, report in cells.items()]
+    write_cells(output, rows)
+    return rows
+
+
+def _split(value: str, choices) -> tuple[str, ...]:
+    if not value:
+        return tuple(choices)
+    items = tuple(item.strip() for item in value.split(",") if item.strip())
+    unknown = [item for item in items if item not in choices]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"알 수 없는 값: {', '.join(unknown)}")
+    return items
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="난이도 × 성격 × 정책 밸런스 스윕")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--difficulties", default="")
+    parser.add_argument("--personalities", default="")
+    parser.add_argument("--policies", default="")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    parser.add_argument("--max-days", type=int, default=simulation.DEFAULT_MAX_DAYS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        difficulties = _split(args.difficulties, game_state.DIFFICULTY_PROFILE)
+        personalities = _split(args.personalities, game_state.PERSONALITY_PROFILE)
+        policies = _split(args.policies, simulation.POLICIES)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    started = time.perf_counter()
+
+    def progress(finished: int, total: int):
+        elapsed = time.perf_counter() - started
+        print(f"\r{finished}/{total} chunks ({elapsed:.1f}s)", end="", flush=True)
+
+    rows = run_sweep(
+        args.output,
+        difficulties=difficulties,
+        personalities=personalities,
+        policies=policies,
+        runs=args.runs,
+        chunk_size=args.chunk_size,
+        max_days=args.max_days,
+        seed=args.seed,
+        workers=args.workers,
+        progress=progress,
+    )
+    print()
+    print(f"{len(rows)} cells -> {args.output} ({time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
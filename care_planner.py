@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from functools import lru_cache
+from itertools import combinations
+from pathlib import Path
+
+import effects
+import evolution
+import state as game_state
+from evolution_forecast import STAT_KEYS, phase_kernel
+from items import ITEM_EFFECTS, normalize_inventory_item
+
+
+PLANNER_VERSION = 1
+PLANNER_DIR = Path(os.getenv("APPDATA") or str(Path.home())) / "growing-cat" / "planner"
+
+CARE_ORDER = ("clean", "play_free", "feed_free", "sleep")
+BINS = 11
+BIN_WIDTH = game_state.MAX_STAT // (BINS - 1)
+HORIZON_DAYS = 10
+WINDOW_BONUS = 2.0
+ITEM_MIN_GAIN = 1.0
+# 진화 스탯 조건이 없는 단계는 가장 가까운 단계의 범위를 목표로 삼아 건강하게 유지한다.
+TARGET_STAGE = {
+    evolution.BABY: evolution.ADULT,
+    evolution.DINO: evolution.LION,
+}
+
+# 상태는 (배고픔, 피로, 행복, 청결) 구간 번호를 평탄화한 인덱스
+STATES = BINS ** len(STAT_KEYS)
+STRIDES = {key: BINS ** (len(STAT_KEYS) - 1 - axis) for axis, key in enumerate(STAT_KEYS)}
+# 행동 조합별 축약은 앞부분이 같을수록 재사용되므로, 영향을 주는 행동이 적은 스탯부터 축약한다.
+CONTRACT_ORDER = ("cleanliness", "hunger", "tiredness", "happiness")
+
+_TABLES: dict[tuple[str, str, str], dict] = {}
+_LOCK = threading.Lock()
+# 표를 만들고 있는 작업 스레드. 빌드 중에는 _LOCK이 잡혀 있으므로 따로 잠근다.
+_PENDING: dict[tuple[str, str, str], threading.Thread] = {}
+_PENDING_LOCK = threading.Lock()
+
+
+def stat_bin(value) -> int:
+    value = max(0, min(int(value), game_state.MAX_STAT))
+    return min(BINS - 1, (value + BIN_WIDTH // 2) // BIN_WIDTH)
+
+
+BIN_VALUES = tuple(
+    tuple(v for v in range(game_state.MAX_STAT + 1) if stat_bin(v) == b) for b in range(BINS)
+)
+
+
+def stage_key(stage) -> str:
+    stage = TARGET_STAGE.get(stage, stage)
+    return stage if stage in evolution.EVOLUTION_STAT_RANGE else evolution.ADULT
+
+
+def care_subsets(available=CARE_ORDER) -> list[tuple[str, ...]]:
+    available = tuple(action for action in CARE_ORDER if action in available)
+    return [combo for size in range(len(available) + 1) for combo in combinations(available, size)]
+
+
+@lru_cache(maxsize=None)
+def _stat_actions(difficulty: str, personality: str, stat: str) -> frozenset:
+    table = effects.effect_table(difficulty, personality)
+    return frozenset(action for action in CARE_ORDER if any(key == stat for key, _, _ in table[action]))
+
+
+def _relevant(difficulty: str, personality: str, stat: str, care) -> tuple[str, ...]:
+    affects = _stat_actions(difficulty, personality, stat)
+    return tuple(action for action in care if action in affects)
+
+
+@lru_cache(maxsize=None)
+def value_row(difficulty: str, personality: str, stat: str, care: tuple[str, ...], phase_action: str, value: int) -> tuple:
+    # 정확한 시작 값에서 출발해 도착 구간별 확률로 모은 분포
+    dist = {}
+    for end, p in phase_kernel(difficulty, personality, stat, care, phase_action)[value]:
+        b = stat_bin(end)
+        dist[b] = dist.get(b, 0.0) + p
+    return tuple(sorted(dist.items()))
+
+
+@lru_cache(maxsize=None)
+def bin_kernel(difficulty: str, personality: str, stat: str, care: tuple[str, ...], phase_action: str) -> tuple:
+    rows = []
+    for values in BIN_VALUES:
+        dist = {}
+        weight = 1.0 / len(values)
+        for value in values:
+            for b, p in value_row(difficulty, personality, stat, care, phase_action, value):
+                dist[b] = dist.get(b, 0.0) + p * weight
+        rows.append(tuple(sorted(dist.items())))
+    return tuple(rows)
+
+
+def _axis_groups():
+    groups = {}
+    for stride in STRIDES.values():
+        groups[stride] = [[i for i in range(STATES) if (i // stride) % BINS == b] for b in range(BINS)]
+    return groups
+
+
+_AXIS_GROUPS = None
+
+
+def _contract(values: list[float], kernel, stride: int) -> list[float]:
+    out = [0.0] * STATES
+    for b, row in enumerate(kernel):
+        idxs = _AXIS_GROUPS[stride][b]
+        acc = [0.0] * len(idxs)
+        for b2, p in row:
+            offset = (b2 - b) * stride
+            acc = [a + p * values[i + offset] for a, i in zip(acc, idxs)]
+        for i, a in zip(idxs, acc):
+            out[i] = a
+    return out
+
+
+def _window_reward(stage: str) -> list[float]:
+    ranges = evolution.EVOLUTION_STAT_RANGE[stage]
+    # 구간 안 값 중 진화 범위에 드는 비율을 스탯별로 곱한다.
+    fractions = {
+        key: [sum(1 for v in values if low <= v <= high) / len(values) for values in BIN_VALUES]
+        for key, (low, high) in ranges.items()
+    }
+    reward = [1.0] * STATES
+    for key in STAT_KEYS:
+        stride = STRIDES[key]
+        column = fractions[key]
+        reward = [r * column[(i // stride) % BINS] for i, r in enumerate(reward)]
+    return reward
+
+
+def _backup(difficulty: str, personality: str, phase_action: str, target: list[float]) -> list[float]:
+    # 행동 조합마다 기대값을 구하고 최대값을 취한다. 같은 접두 축약은 공유한다.
+    memo = {(): target}
+    best = None
+    for care in care_subsets():
+        prefix = ()
+        values = target
+        for stat in CONTRACT_ORDER:
+            prefix = (*prefix, _relevant(difficulty, personality, stat, care))
+            if prefix not in memo:
+                kernel = bin_kernel(difficulty, personality, stat, prefix[-1], phase_action)
+                memo[prefix] = _contract(values, kernel, STRIDES[stat])
+            values = memo[prefix]
+        best = values if best is None else list(map(max, best, values))
+    return best
+
+
+def table_signature(difficulty: str, personality: str, stage: str) -> str:
+    table = effects.effect_table(difficulty, personality)
+    payload = [
+        PLANNER_VERSION,
+        BINS,
+        HORIZON_DAYS,
+        WINDOW_BONUS,
+        CARE_ORDER,
+        {action: [[key, sign, list(outcomes)] for key, sign, outcomes in rolls] for action, rolls in table.items()},
+        evolution.EVOLUTION_STAT_RANGE[stage],
+        [
+            game_state.DEATH_HUNGER_THRESHOLD,
+            game_state.DEATH_TIREDNESS_THRESHOLD,
+            game_state.RUNAWAY_HAPPINESS_THRESHOLD,
+            game_state.RUNAWAY_CLEANLINESS_THRESHOLD,
+        ],
+    ]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def build_table(difficulty: str, personality: str, stage: str) -> dict:
+    global _AXIS_GROUPS
+    if _AXIS_GROUPS is None:
+        _AXIS_GROUPS = _axis_groups()
+
+    window = [WINDOW_BONUS * r for r in _window_reward(stage)]
+    # 남은 HORIZON_DAYS일 동안 버틴 시간대 수 + 아침마다 진화 범위에 들 확률의 가중합
+    morning = [0.0] * STATES
+    night = [0.0] * STATES
+    for _ in range(HORIZON_DAYS):
+        night = _backup(difficulty, personality, "morning", [1.0 + w + v for w, v in zip(window, morning)])
+        morning = _backup(difficulty, personality, "night", [1.0 + v for v in night])
+    return {
+        "version": PLANNER_VERSION,
+        "signature": table_signature(difficulty, personality, stage),
+        "difficulty": difficulty,
+        "personality": personality,
+        "stage": stage,
+        game_state.MORNING: [round(v, 6) for v in morning],
+        game_state.NIGHT: [round(v, 6) for v in night],
+    }
+
+
+def table_path(difficulty: str, personality: str, stage: str) -> Path:
+    return PLANNER_DIR / f"{difficulty}_{personality}_stage{evolution.EVOLUTION_ORDER.index(stage)}.json"
+
+
+def _read_table(path: Path, signature: str) -> dict | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, TypeError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("signature") != signature:
+        return None
+    for phase in (game_state.MORNING, game_state.NIGHT):
+        values = data.get(phase)
+        if not isinstance(values, list) or len(values) != STATES:
+            return None
+    return data
+
+
+def _write_table(path: Path, data: dict):
+    # balance_sweep 프로세스들이 같은 표를 동시에 쓸 수 있으므로 임시 파일 이름을 프로세스/스레드마다 다르게 한다.
+    temp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp, path)
+    except OSError:
+        try:
+            temp.unlink()
+        except OSError:
+            pass
+
+
+def _table_key(difficulty, personality, stage) -> tuple[str, str, str]:
+    return (
+        game_state.normalize_difficulty(difficulty),
+        game_state.normalize_personality(personality),
+        stage_key(stage),
+    )
+
+
+def is_ready(difficulty, personality, stage) -> bool:
+    return _table_key(difficulty, personality, stage) in _TABLES
+
+
+def value_table(difficulty, personality, stage) -> dict:
+    key = _table_key(difficulty, personality, stage)
+    table = _TABLES.get(key)
+    if table is not None:
+        return table
+    with _LOCK:
+        table = _TABLES.get(key)
+        if table is None:
+            path = table_path(*key)
+            table = _read_table(path, table_signature(*key))
+            if table is None:
+                table = build_table(*key)
+                _write_table(path, table)
+            _TABLES[key] = table
+    return table
+
+
+def warm_in_background(difficulty, personality, stage) -> threading.Thread | None:
+    # 매 프레임 불러도 된다. 같은 표를 만드는 스레드가 있으면 그 스레드를 돌려준다.
+    key = _table_key(difficulty, personality, stage)
+    with _PENDING_LOCK:
+        if key in _TABLES:
+            return None
+        thread = _PENDING.get(key)
+        if thread is None:
+            thread = threading.Thread(target=_warm, args=key, name="care-planner", daemon=True)
+            _PENDING[key] = thread
+            thread.start()
+    return thread
+
+
+def _warm(difficulty, personality, stage):
+    key = (difficulty, personality, stage)
+    try:
+        value_table(*key)
+    finally:
+        with _PENDING_LOCK:
+            _PENDING.pop(key, None)
+
+
+def _q_value(difficulty, personality, phase_action, care, stats, target) -> float:
+    rows = [
+        value_row(difficulty, personality, key, _relevant(difficulty, personality, key, care), phase_action, stats[axis])
+        for axis, key in enumerate(STAT_KEYS)
+    ]
+    s0, s1, s2, s3 = (STRIDES[key] for key in STAT_KEYS)
+    total = 0.0
+    for b0, p0 in rows[0]:
+        for b1, p1 in rows[1]:
+            p01 = p0 * p1
+            base01 = b0 * s0 + b1 * s1
+            for b2, p2 in rows[2]:
+                p012 = p01 * p2
+                base012 = base01 + b2 * s2
+                for b3, p3 in rows[3]:
+                    total += p012 * p3 * target[base012 + b3 * s3]
+    return total
+
+
+@lru_cache(maxsize=65536)
+def _best_care(difficulty, personality, stage, time_phase, available, stats) -> tuple[tuple[str, ...], float]:
+    target = _arrival_values(difficulty, personality, stage, time_phase)
+    phase_action = "night" if time_phase == game_state.MORNING else "morning"
+    best, best_value = (), None
+    for care in care_subsets(available):
+        value = _q_value(difficulty, personality, phase_action, care, stats, target)
+        if best_value is None or value > best_value + 1e-9:
+            best, best_value = care, value
+    return best, best_value
+
+
+@lru_cache(maxsize=None)
+def _arrival_values(difficulty, personality, stage, time_phase) -> tuple[float, ...]:
+    table = value_table(difficulty, personality, stage)
+    if time_phase == game_state.MORNING:
+        return tuple(1.0 + v for v in table[game_state.NIGHT])
+    window = _window_reward(stage)
+    return tuple(1.0 + WINDOW_BONUS * w + v for w, v in zip(window, table[game_state.MORNING]))
+
+
+def _cat_stats(cat) -> tuple[int, ...]:
+    return tuple(max(0, min(int(getattr(cat, key)), game_state.MAX_STAT)) for key in STAT_KEYS)
+
+
+def recommend(cat, time_phase: str, used_actions=(), inventory=None) -> dict:
+    difficulty, personality, stage = _table_key(
+        getattr(cat, "difficulty", None), getattr(cat, "personality", None), getattr(cat, "stage", None)
+    )
+    phase = time_phase if time_phase in (game_state.MORNING, game_state.NIGHT) else game_state.MORNING
+    used = set(used_actions or ())
+    available = tuple(action for action in CARE_ORDER if action not in used)
+    stats = _cat_stats(cat)
+    care, value = _best_care(difficulty, personality, stage, phase, available, stats)
+
+    item = None
+    for name, amount in sorted((inventory or {}).items()):
+        effect = ITEM_EFFECTS.get(normalize_inventory_item(name))
+        if effect is None or amount <= 0:
+            continue
+        key, delta = effect
+        shifted = list(stats)
+        axis = STAT_KEYS.index(key)
+        shifted[axis] = max(0, min(shifted[axis] + delta, game_state.MAX_STAT))
+        item_care, item_value = _best_care(difficulty, personality, stage, phase, available, tuple(shifted))
+        if item_value > value + ITEM_MIN_GAIN:
+            item, care, value = name, item_care, item_value
+    return {"care": care, "item": item, "value": value}
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import state
+import effects
 import random
 import os
 
@@ -13,17 +16,60 @@ CAT_IMAGE_DIR = {
     "공룡고양이": asset_path("cats", "dino"),
 }
 
+_IMAGE_INDEX: dict[str, tuple[str, ...]] = {}
+_IMAGE_KEYS: dict[str, dict[str, int]] = {}
+_IMAGE_INDEX_READY = False
+
+
+def image_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _scan_images(folder: str) -> tuple[str, ...]:
+    try:
+        files = [
+            f for f in os.listdir(folder)
+            if (
+                not f.startswith(".")
+                and f.lower().endswith(IMAGE_EXTENSIONS)
+                and os.path.isfile(os.path.join(folder, f))
+            )
+        ]
+    except OSError:
+        return ()
+    return tuple(os.path.join(folder, f) for f in sorted(files))
+
+
+def refresh_image_index(stage: str | None = None):
+    global _IMAGE_INDEX_READY
+    stages = CAT_IMAGE_DIR if stage is None else {stage: CAT_IMAGE_DIR.get(stage)}
+    for name, folder in stages.items():
+        files = _scan_images(folder) if folder else ()
+        _IMAGE_INDEX[name] = files
+        _IMAGE_KEYS[name] = {image_key(path): index for index, path in enumerate(files)}
+    if stage is None:
+        _IMAGE_INDEX_READY = True
+
+
+def stage_images(stage: str) -> tuple[str, ...]:
+    if not _IMAGE_INDEX_READY:
+        refresh_image_index()
+    return _IMAGE_INDEX.get(stage, ())
+
+
 class Cat:
-    def __init__(self, name, stage, image_path=None, difficulty="normal", personality="energetic"):
+    def __init__(self, name, stage, image_path=None, difficulty="normal", personality="energetic", rng=None, image_rng=None):
         self.name = name
         self.stage = stage
         self.difficulty = state.normalize_difficulty(difficulty)
         self.personality = state.normalize_personality(personality)
+        self.rng = rng or random
+        self.image_rng = image_rng or self.rng
 
-        self.hunger = random.randint(25, 50)
-        self.tiredness = random.randint(5, 25)
-        self.happiness = random.randint(50, 75)
-        self.cleanliness = random.randint(30, 80)
+        self.hunger = self.rng.randint(25, 50)
+        self.tiredness = self.rng.randint(5, 25)
+        self.happiness = self.rng.randint(50, 75)
+        self.cleanliness = self.rng.randint(30, 80)
 
         self.alive = True
         self.runaway = False
@@ -31,44 +77,28 @@ class Cat:
         self.image_path = image_path or self.random_image()
 
     def available_images(self):
-        folder = CAT_IMAGE_DIR.get(self.stage)
-        if not folder:
-            return []
-
-        try:
-            files = [
-                f for f in os.listdir(folder)
-                if (
-                    not f.startswith(".")
-                    and f.lower().endswith(IMAGE_EXTENSIONS)
-                    and os.path.isfile(os.path.join(folder, f))
-                )
-            ]
-        except OSError:
-            return []
-
-        return [os.path.join(folder, f) for f in sorted(files)]
+        return list(stage_images(self.stage))
 
     def random_image(self):
-        files = self.available_images()
+        files = stage_images(self.stage)
         if not files:
             return None
-        return random.choice(files)
+        return self.image_rng.choice(files)
 
     def rotate_image(self):
-        files = self.available_images()
+        files = stage_images(self.stage)
         if len(files) <= 1:
             return False
 
-        current = os.path.normcase(os.path.abspath(self.image_path or ""))
-        candidates = [
-            path for path in files
-            if os.path.normcase(os.path.abspath(path)) != current
-        ]
-        if not candidates:
-            return False
+        current = _IMAGE_KEYS.get(self.stage, {}).get(image_key(self.image_path or ""))
+        if current is None:
+            self.image_path = self.image_rng.choice(files)
+            return True
 
-        self.image_path = random.choice(candidates)
+        index = self.image_rng.randrange(len(files) - 1)
+        if index >= current:
+            index += 1
+        self.image_path = files[index]
         return True
 
     def evolve_to(self, new_stage):
@@ -78,117 +108,36 @@ class Cat:
     def get_display_name(self):
         return f"{self.name} - {self.stage}"
 
-    def _get_personality_modifier(self, stat_type: str) -> float:
-        """성격에 따른 스탯 변화 배율 반환"""
-        prof = state.get_personality_profile(self.personality)
-        
-        # 프로필에서 해당 stat_type의 배율 가져오기
-        if stat_type in prof:
-            return prof[stat_type]
-        return 1.0
-
-    def _roll_stat_change(self, rng, difficulty_kind: str, modifier_key: str, *, inverse_modifier: bool = False) -> int:
-        value = state.rand_range(state.scaled_range(rng, self.difficulty, difficulty_kind))
-        modifier = self._get_personality_modifier(modifier_key)
-        if inverse_modifier:
-            return int(value / modifier)
-        return int(value * modifier)
+    def _apply_effect(self, action: str):
+        if not self._can_act():
+            return
+        effects.apply_outcomes(self, effects.effect_table(self.difficulty, self.personality)[action], self.rng)
 
     def on_night(self):
         if not self._can_act():
             return
-        hunger_inc = self._roll_stat_change(state.NIGHT_HUNGER_INC, "pressure", "hunger_increase")
-        tiredness_inc = self._roll_stat_change(state.NIGHT_TIREDNESS_INC, "pressure", "tiredness_increase")
-        happiness_dec = self._roll_stat_change(
-            state.NIGHT_HAPPINESS_DEC,
-            "pressure",
-            "happiness_recovery",
-            inverse_modifier=True,
-        )
-        cleanliness_dec = self._roll_stat_change(state.NIGHT_CLEANLINESS_DEC, "pressure", "cleanliness_decrease")
-        
-        self.hunger += hunger_inc
-        self.tiredness += tiredness_inc
-        self.happiness -= happiness_dec
-        self.cleanliness -= cleanliness_dec
-        self._clamp_all()
-        self._check_death()
-        self._check_runaway()
+        self._apply_effect("night")
+        self.check_death()
+        self.check_runaway()
 
     def on_morning(self):
         if not self._can_act():
             return
-        hunger_inc = self._roll_stat_change(state.MORNING_HUNGER_INC, "pressure", "hunger_increase")
-        tiredness_dec = self._roll_stat_change(state.MORNING_TIREDNESS_DEC, "recovery", "tiredness_recovery")
-        happiness_inc = self._roll_stat_change(state.MORNING_HAPPINESS_INC, "recovery", "happiness_recovery")
-        cleanliness_dec = self._roll_stat_change(state.MORNING_CLEANLINESS_DEC, "pressure", "cleanliness_decrease")
-        
-        self.hunger += hunger_inc
-        self.tiredness -= tiredness_dec
-        self.happiness += happiness_inc
-        self.cleanliness -= cleanliness_dec
-        self._clamp_all()
-        self._check_death()
-        self._check_runaway()
+        self._apply_effect("morning")
+        self.check_death()
+        self.check_runaway()
 
     def feed_free(self):
-        if not self._can_act():
-            return
-        hunger_dec = self._roll_stat_change(
-            state.FREE_FEED_HUNGER_DEC,
-            "recovery",
-            "hunger_increase",
-            inverse_modifier=True,
-        )
-        happiness_inc = self._roll_stat_change(state.FREE_FEED_HAPPINESS_INC, "recovery", "happiness_recovery")
-        
-        self.hunger -= hunger_dec
-        self.happiness += happiness_inc
-        self._clamp_all()
+        self._apply_effect("feed_free")
 
     def play_free(self):
-        if not self._can_act():
-            return
-        happiness_inc = self._roll_stat_change(state.FREE_PLAY_HAPPINESS_INC, "recovery", "happiness_recovery")
-        tiredness_inc = self._roll_stat_change(state.FREE_PLAY_TIREDNESS_INC, "pressure", "tiredness_increase")
-        hunger_inc = self._roll_stat_change(state.FREE_PLAY_HUNGER_INC, "pressure", "hunger_increase")
-        cleanliness_dec = self._roll_stat_change(state.FREE_PLAY_CLEANLINESS_DEC, "pressure", "cleanliness_decrease")
-        
-        self.happiness += happiness_inc
-        self.tiredness += tiredness_inc
-        self.hunger += hunger_inc
-        self.cleanliness -= cleanliness_dec
-        self._clamp_all()
+        self._apply_effect("play_free")
 
     def clean(self):
-        if not self._can_act():
-            return
-        cleanliness_inc = self._roll_stat_change(
-            state.CLEAN_CLEANLINESS_INC,
-            "recovery",
-            "cleanliness_decrease",
-            inverse_modifier=True,
-        )
-        happiness_dec = self._roll_stat_change(
-            state.CLEAN_HAPPINESS_DEC,
-            "pressure",
-            "happiness_recovery",
-            inverse_modifier=True,
-        )
-        
-        self.cleanliness += cleanliness_inc
-        self.happiness -= happiness_dec
-        self._clamp_all()
+        self._apply_effect("clean")
 
     def sleep(self):
-        if not self._can_act():
-            return
-        tiredness_dec = self._roll_stat_change(state.SLEEP_TIREDNESS_DEC, "recovery", "tiredness_recovery")
-        happiness_inc = self._roll_stat_change(state.SLEEP_HAPPINESS_INC, "recovery", "happiness_recovery")
-        
-        self.tiredness -= tiredness_dec
-        self.happiness += happiness_inc
-        self._clamp_all()
+        self._apply_effect("sleep")
 
     def _can_act(self):
         return self.alive and not self.runaway
@@ -199,11 +148,11 @@ class Cat:
         self.happiness = state.clamp(self.happiness)
         self.cleanliness = state.clamp(self.cleanliness)
 
-    def _check_death(self):
+    def check_death(self):
         if self.hunger >= state.DEATH_HUNGER_THRESHOLD or self.tiredness >= state.DEATH_TIREDNESS_THRESHOLD:
             self.alive = False
 
-    def _check_runaway(self):
+    def check_runaway(self):
         if (
             self.happiness <= state.RUNAWAY_HAPPINESS_THRESHOLD
             or self.cleanliness <= state.RUNAWAY_CLEANLINESS_THRESHOLD
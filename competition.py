@@ -11,6 +11,9 @@ INTERVAL_DAYS = 3
 HISTORY_LIMIT = 30
 GRADE_ORDER = ("S", "A", "B", "C")
 GRADE_RANK = {grade: index for index, grade in enumerate(GRADE_ORDER)}
+FOOD_ITEMS = ("사료", "생선", "츄르", "고기")
+TOY_ITEMS = ("강아지풀", "낚싯대", "실")
+LUCK_BONUS_RANGE = (0, 24)
 
 
 COMPETITIONS = (
@@ -60,6 +63,46 @@ COMPETITIONS = (
 
 COMPETITION_BY_ID = {comp["id"]: comp for comp in COMPETITIONS}
 
+SCORE_FEATURES = (
+    "happy",
+    "clean",
+    "hunger_ok",
+    "rested",
+    "average",
+    "stage_bonus",
+    "minigame_count",
+    "food_capped",
+    "toy_count",
+    "items_capped",
+    "random_bonus",
+)
+
+# 행마다 항의 순서가 기존 계산식의 덧셈 순서와 같아야 반올림 결과가 바뀌지 않는다.
+COMPETITION_WEIGHTS = {
+    "cute": (("happy", 0.45), ("clean", 0.35), ("hunger_ok", 0.10), ("rested", 0.10), ("stage_bonus", 1)),
+    "clean": (("clean", 0.68), ("happy", 0.14), ("rested", 0.10), ("hunger_ok", 0.08)),
+    "food": (("hunger_ok", 0.58), ("happy", 0.16), ("clean", 0.10), ("food_capped", 4.0)),
+    "hunt": (
+        ("happy", 0.26),
+        ("rested", 0.22),
+        ("hunger_ok", 0.14),
+        ("minigame_count", 12),
+        ("toy_count", 2.5),
+        ("stage_bonus", 1),
+    ),
+    "stamina": (("rested", 0.46), ("hunger_ok", 0.25), ("clean", 0.14), ("happy", 0.15), ("stage_bonus", 0.5)),
+    "luck": (("average", 0.72), ("items_capped", 2.0), ("random_bonus", 1)),
+}
+DEFAULT_WEIGHTS = (("average", 1),)
+
+
+def _compile_terms(weights) -> tuple[tuple[int, float], ...]:
+    return tuple((SCORE_FEATURES.index(name), weight) for name, weight in weights)
+
+
+COMPETITION_TERMS = {comp_id: _compile_terms(weights) for comp_id, weights in COMPETITION_WEIGHTS.items()}
+DEFAULT_TERMS = _compile_terms(DEFAULT_WEIGHTS)
+
 DIFFICULTY_THRESHOLDS = {
     game_state.DIFFICULTY_EASY: {"S": 78, "A": 62, "B": 45},
     game_state.DIFFICULTY_NORMAL: {"S": 86, "A": 70, "B": 52},
@@ -193,43 +236,87 @@ def estimate_score(comp_id: str, cat, state, inventory) -> int:
     return _score(comp_id, cat, state, inventory, random_bonus=0)
 
 
-def roll_score(comp_id: str, cat, state, inventory) -> int:
+def roll_score(comp_id: str, cat, state, inventory, rng=None) -> int:
     bonus = 0
     if comp_id == "luck":
-        bonus = random.randint(0, 24)
+        bonus = (rng or random).randint(*LUCK_BONUS_RANGE)
     return _score(comp_id, cat, state, inventory, random_bonus=bonus)
 
 
 def _score(comp_id: str, cat, state, inventory, random_bonus: int = 0) -> int:
+    return score_features(comp_id, features_for(cat, state, inventory, random_bonus=random_bonus))
+
+
+def score_context(cat, state, inventory) -> dict:
     stats = _stats(cat)
-    stage = getattr(cat, "stage", "")
-    minigame_count = sum(1 for used in getattr(state, "minigame_used", {}).values() if used)
-    food_count = _inventory_count(inventory, ("사료", "생선", "츄르", "고기"))
-    toy_count = _inventory_count(inventory, ("강아지풀", "낚싯대", "실"))
-
-    hunger_ok = 100 - stats["hunger"]
-    rested = 100 - stats["tiredness"]
-    clean = stats["cleanliness"]
-    happy = stats["happiness"]
-
-    stage_bonus = _stage_bonus(stage)
-
-    if comp_id == "cute":
-        score = happy * 0.45 + clean * 0.35 + hunger_ok * 0.10 + rested * 0.10 + stage_bonus
-    elif comp_id == "clean":
-        score = clean * 0.68 + happy * 0.14 + rested * 0.10 + hunger_ok * 0.08
-    elif comp_id == "food":
-        score = hunger_ok * 0.58 + happy * 0.16 + clean * 0.10 + min(food_count, 8) * 4.0
-    elif comp_id == "hunt":
-        score = happy * 0.26 + rested * 0.22 + hunger_ok * 0.14 + minigame_count * 12 + toy_count * 2.5 + stage_bonus
-    elif comp_id == "stamina":
-        score = rested * 0.46 + hunger_ok * 0.25 + clean * 0.14 + happy * 0.15 + stage_bonus * 0.5
-    elif comp_id == "luck":
-        avg = (happy + clean + hunger_ok + rested) / 4
-        score = avg * 0.72 + min(food_count + toy_count, 10) * 2.0 + random_bonus
-    else:
-        score = (happy + clean + hunger_ok + rested) / 4
+    return {
+        "happy": stats["happiness"],
+        "clean": stats["cleanliness"],
+        "hunger_ok": 100 - stats["hunger"],
+        "rested": 100 - stats["tiredness"],
+        "stage_bonus": _stage_bonus(getattr(cat, "stage", "")),
+        "minigame_count": sum(1 for used in getattr(state, "minigame_used", {}).values() if used),
+        "food_count": _inventory_count(inventory, FOOD_ITEMS),
+        "toy_count": _inventory_count(inventory, TOY_ITEMS),
+    }
+
+
+def features_for(cat, state, inventory, random_bonus: int = 0) -> tuple:
+    return feature_row(**score_context(cat, state, inventory), random_bonus=random_bonus)
+
+
+def feature_row(
+    *,
+    happy: float,
+    clean: float,
+    hunger_ok: float,
+    rested: float,
+    stage_bonus: int = 0,
+    minigame_count: int = 0,
+    food_count: int = 0,
+    toy_count: int = 0,
+    random_bonus: int = 0,
+) -> tuple:
+    return (
+        happy,
+        clean,
+        hunger_ok,
+        rested,
+        (happy + clean + hunger_ok + rested) / 4,
+        stage_bonus,
+        minigame_count,
+        min(food_count, 8),
+        toy_count,
+        min(food_count + toy_count, 10),
+        random_bonus,
+    )
+
+
+def score_from_values(comp_id: str, *, random_bonus: int = 0, **values) -> int:
+    return score_features(comp_id, feature_row(**values, random_bonus=random_bonus))
+
+
+def score_features(comp_id: str, features) -> int:
+    return _clamp_score(_dot(COMPETITION_TERMS.get(comp_id, DEFAULT_TERMS), features))
+
+
+def score_batch(comp_id: str, feature_rows) -> list[int]:
+    terms = COMPETITION_TERMS.get(comp_id, DEFAULT_TERMS)
+    return [_clamp_score(_dot(terms, features)) for features in feature_rows]
+
+
+def score_all(features) -> dict[str, int]:
+    return {comp["id"]: _clamp_score(_dot(COMPETITION_TERMS[comp["id"]], features)) for comp in COMPETITIONS}
+
+
+def _dot(terms, features) -> float:
+    score = 0
+    for index, weight in terms:
+        score += features[index] * weight
+    return score
+
 
+def _clamp_score(score: float) -> int:
     return max(0, min(120, int(round(score))))
 
 
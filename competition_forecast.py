@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import random
+import time
+
+import competition
+import effects
+import state as game_state
+
+
+FORECAST_SAMPLES = 20000
+FORECAST_BATCH = 1500
+# 화면에서 돌릴 때는 프레임마다 이 시간(초)만 쓰고, 그 안에서 FORECAST_STEP개씩 나눠 돌린다.
+FORECAST_FRAME_BUDGET = 0.002
+FORECAST_STEP = 100
+
+STAT_KEYS = ("hunger", "tiredness", "happiness", "cleanliness")
+
+
+def remaining_phases(day: int, time_phase: str) -> list[str]:
+    try:
+        current = max(1, int(day))
+    except (TypeError, ValueError):
+        current = 1
+    event_day = competition.event_day_for(current)
+    phase = time_phase if time_phase in (game_state.MORNING, game_state.NIGHT) else game_state.MORNING
+
+    phases = []
+    while current < event_day:
+        if phase == game_state.MORNING:
+            phase = game_state.NIGHT
+        else:
+            phase = game_state.MORNING
+            current += 1
+        phases.append(phase)
+    return phases
+
+
+class GradeForecaster:
+    def __init__(self, comp: dict, cat, state, inventory, rng=None):
+        self.comp = comp
+        self.rng = rng or random.Random()
+        self.difficulty = game_state.normalize_difficulty(getattr(state, "difficulty", None))
+        personality = getattr(cat, "personality", getattr(state, "personality", None))
+
+        self.context = competition.score_context(cat, state, inventory)
+        self.start = {
+            "hunger": 100 - self.context["hunger_ok"],
+            "tiredness": 100 - self.context["rested"],
+            "happiness": self.context["happy"],
+            "cleanliness": self.context["clean"],
+        }
+        self.phases = remaining_phases(getattr(state, "day", 1), getattr(state, "time_phase", game_state.MORNING))
+        if self.phases:
+            self.context["minigame_count"] = 0
+
+        table = effects.effect_table(self.difficulty, personality)
+        self.rolls = [table[effects.PHASE_ACTIONS[phase]] for phase in self.phases]
+        self.samples = 0
+        self.survived = 0
+        self.grade_counts = {grade: 0 for grade in competition.GRADE_ORDER}
+
+    def run(self, samples: int = FORECAST_BATCH) -> None:
+        samples = max(0, int(samples))
+        if samples <= 0:
+            return
+
+        columns = {key: [self.start[key]] * samples for key in STAT_KEYS}
+        lost = [False] * samples
+        for rolls in self.rolls:
+            for key, sign, outcomes in rolls:
+                draws = self.rng.choices(outcomes, k=samples)
+                if sign > 0:
+                    columns[key] = [min(value + delta, game_state.MAX_STAT) for value, delta in zip(columns[key], draws)]
+                else:
+                    columns[key] = [max(value - delta, 0) for value, delta in zip(columns[key], draws)]
+            lost = [
+                gone
+                or hunger >= game_state.DEATH_HUNGER_THRESHOLD
+                or tiredness >= game_state.DEATH_TIREDNESS_THRESHOLD
+                or happiness <= game_state.RUNAWAY_HAPPINESS_THRESHOLD
+                or cleanliness <= game_state.RUNAWAY_CLEANLINESS_THRESHOLD
+                for gone, hunger, tiredness, happiness, cleanliness in zip(
+                    lost,
+                    columns["hunger"],
+                    columns["tiredness"],
+                    columns["happiness"],
+                    columns["cleanliness"],
+                )
+            ]
+
+        comp_id = self.comp["id"]
+        if comp_id == "luck":
+            bonuses = self.rng.choices(range(competition.LUCK_BONUS_RANGE[0], competition.LUCK_BONUS_RANGE[1] + 1), k=samples)
+        else:
+            bonuses = [0] * samples
+
+        context = self.context
+        rows = [
+            competition.feature_row(
+                happy=happiness,
+                clean=cleanliness,
+                hunger_ok=100 - hunger,
+                rested=100 - tiredness,
+                stage_bonus=context["stage_bonus"],
+                minigame_count=context["minigame_count"],
+                food_count=context["food_count"],
+                toy_count=context["toy_count"],
+                random_bonus=bonus,
+            )
+            for gone, hunger, tiredness, happiness, cleanliness, bonus in zip(
+                lost,
+                columns["hunger"],
+                columns["tiredness"],
+                columns["happiness"],
+                columns["cleanliness"],
+                bonuses,
+            )
+            if not gone
+        ]
+        scores = competition.score_batch(comp_id, rows)
+
+        for score in scores:
+            self.grade_counts[competition.grade_for_score(score, self.difficulty)] += 1
+        self.samples += samples
+        self.survived += len(scores)
+
+    def run_for(self, budget: float = FORECAST_FRAME_BUDGET, limit: int = FORECAST_SAMPLES) -> bool:
+        # budget초가 지나거나 limit개를 채울 때까지 조금씩 돌린다. 한 번이라도 돌렸으면 True.
+        deadline = time.perf_counter() + budget
+        ran = False
+        while self.samples < limit:
+            self.run(min(FORECAST_STEP, limit - self.samples))
+            ran = True
+            if time.perf_counter() >= deadline:
+                break
+        return ran
+
+    def result(self) -> dict:
+        # 등급 확률은 대회까지 버틴 표본 기준이고, 기대 코인은 사망/가출한 표본도 보상 0으로 넣은 전체 평균이다.
+        fee = competition.entry_fee(self.comp, self.difficulty)
+        survived = max(1, self.survived)
+        probabilities = {grade: self.grade_counts[grade] / survived for grade in competition.GRADE_ORDER}
+        total_reward = sum(
+            self.grade_counts[grade] * competition.reward_for_grade(self.comp, grade, self.difficulty)
+            for grade in competition.GRADE_ORDER
+        )
+        return {
+            "samples": self.samples,
+            "survival": self.survived / self.samples if self.samples else 1.0,
+            "grades": probabilities,
+            "expected_net": (total_reward / self.samples if self.samples else 0.0) - fee,
+        }
+
+
+def forecast_grades(comp: dict, cat, state, inventory, *, samples: int = FORECAST_SAMPLES, rng=None) -> dict:
+    forecaster = GradeForecaster(comp, cat, state, inventory, rng=rng)
+    forecaster.run(samples)
+    return forecaster.result()
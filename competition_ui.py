@@ -1,6 +1,7 @@
 import pygame
 
 import competition
+import competition_forecast
 import state as game_state
 from config import asset_path
 from pg_utils import load_font
@@ -23,6 +24,8 @@ class CompetitionUI:
         self.play_click_sound = play_click_sound
         self.running = True
         self.message = ""
+        self.forecaster = None
+        self.forecast_key = None
 
         self.font = load_font(FONT_PATH, 17)
         self.big_font = load_font(FONT_PATH, 22)
@@ -80,6 +83,7 @@ class CompetitionUI:
         estimate = competition.estimate_score(comp["id"], self.cat, self.state, self.inventory)
         est_grade = competition.grade_for_score(estimate, difficulty)
         today_result = competition.latest_today_result(self.competition_data, day)
+        forecast = self._forecast(comp)
         return {
             "day": day,
             "comp": comp,
@@ -91,8 +95,28 @@ class CompetitionUI:
             "estimate": estimate,
             "est_grade": est_grade,
             "today_result": today_result,
+            "forecast": forecast,
         }
 
+    def _forecast(self, comp):
+        key = (
+            comp["id"],
+            getattr(self.state, "day", 1),
+            getattr(self.state, "time_phase", None),
+            getattr(self.state, "difficulty", None),
+            tuple(sorted(competition.score_context(self.cat, self.state, self.inventory).items())),
+        )
+        if key != self.forecast_key or self.forecaster is None:
+            self.forecast_key = key
+            self.forecaster = competition_forecast.GradeForecaster(comp, self.cat, self.state, self.inventory)
+        return self.forecaster.result() if self.forecaster.samples else None
+
+    def _advance_forecast(self):
+        # 프레임마다 2ms 안에서만 표본을 늘려 화면이 끊기지 않게 한다.
+        if self.forecaster is None:
+            return False
+        return self.forecaster.run_for()
+
     def _can_enter(self):
         ctx = self._context()
         return (
@@ -105,6 +129,8 @@ class CompetitionUI:
         self.screen.fill(BG_COLOR)
         self._draw_top()
         ctx = self._context()
+        if self._advance_forecast():
+            ctx["forecast"] = self.forecaster.result()
         self._draw_event_panel(ctx)
         self._draw_score_panel(ctx)
         self._draw_trophy_panel()
@@ -166,6 +192,14 @@ class CompetitionUI:
 
         self.screen.blit(self.small_font.render(msg, True, (90, 60, 60) if "부족" in msg else (60, 60, 60)), (rect.x + 14, rect.y + 43))
 
+        forecast = ctx["forecast"]
+        if forecast and not ctx["today_result"]:
+            grades = " ".join(f"{grade} {int(round(forecast['grades'][grade] * 100))}%" for grade in competition.GRADE_ORDER)
+            line = f"{grades} | 기대 {int(round(forecast['expected_net'])):+d}코인"
+            if forecast["survival"] < 0.995:
+                line += f" | 생존 {int(round(forecast['survival'] * 100))}%"
+            self.screen.blit(self.small_font.render(line, True, (60, 60, 90)), (rect.x + 14, rect.y + 62))
+
         enabled = self._can_enter()
         self._draw_button(self.enter_rect, "참가하기", enabled=enabled)
 
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import state as game_state
+
+
+# (스탯, 부호, 기본 범위, 난이도 배율 종류, 성격 배율 키, 배율 역수 적용)
+# 한 행동 안의 순서는 Cat이 난수를 뽑는 순서와 같아야 합니다.
+ACTION_EFFECTS = {
+    "night": (
+        ("hunger", 1, game_state.NIGHT_HUNGER_INC, "pressure", "hunger_increase", False),
+        ("tiredness", 1, game_state.NIGHT_TIREDNESS_INC, "pressure", "tiredness_increase", False),
+        ("happiness", -1, game_state.NIGHT_HAPPINESS_DEC, "pressure", "happiness_recovery", True),
+        ("cleanliness", -1, game_state.NIGHT_CLEANLINESS_DEC, "pressure", "cleanliness_decrease", False),
+    ),
+    "morning": (
+        ("hunger", 1, game_state.MORNING_HUNGER_INC, "pressure", "hunger_increase", False),
+        ("tiredness", -1, game_state.MORNING_TIREDNESS_DEC, "recovery", "tiredness_recovery", False),
+        ("happiness", 1, game_state.MORNING_HAPPINESS_INC, "recovery", "happiness_recovery", False),
+        ("cleanliness", -1, game_state.MORNING_CLEANLINESS_DEC, "pressure", "cleanliness_decrease", False),
+    ),
+    "feed_free": (
+        ("hunger", -1, game_state.FREE_FEED_HUNGER_DEC, "recovery", "hunger_increase", True),
+        ("happiness", 1, game_state.FREE_FEED_HAPPINESS_INC, "recovery", "happiness_recovery", False),
+    ),
+    "play_free": (
+        ("happiness", 1, game_state.FREE_PLAY_HAPPINESS_INC, "recovery", "happiness_recovery", False),
+        ("tiredness", 1, game_state.FREE_PLAY_TIREDNESS_INC, "pressure", "tiredness_increase", False),
+        ("hunger", 1, game_state.FREE_PLAY_HUNGER_INC, "pressure", "hunger_increase", False),
+        ("cleanliness", -1, game_state.FREE_PLAY_CLEANLINESS_DEC, "pressure", "cleanliness_decrease", False),
+    ),
+    "clean": (
+        ("cleanliness", 1, game_state.CLEAN_CLEANLINESS_INC, "recovery", "cleanliness_decrease", True),
+        ("happiness", -1, game_state.CLEAN_HAPPINESS_DEC, "pressure", "happiness_recovery", True),
+    ),
+    "sleep": (
+        ("tiredness", -1, game_state.SLEEP_TIREDNESS_DEC, "recovery", "tiredness_recovery", False),
+        ("happiness", 1, game_state.SLEEP_HAPPINESS_INC, "recovery", "happiness_recovery", False),
+    ),
+}
+
+# "필요할 때만 돌보기" 규칙. simulation의 basic 정책과 진화 예측이 같이 쓴다.
+# (행동, 기준 스탯, 기준값, 기준값 이상일 때 하는지). 목록 순서대로 돌본다.
+BASIC_CARE_RULES = (
+    ("clean", "cleanliness", 55, False),
+    ("play_free", "happiness", 55, False),
+    ("feed_free", "hunger", 45, True),
+    ("sleep", "tiredness", 45, True),
+)
+
+PHASE_ACTIONS = {
+    game_state.NIGHT: "night",
+    game_state.MORNING: "morning",
+}
+
+
+def roll_outcomes(base_range, difficulty: str | None, kind: str, personality: str | None, modifier_key: str, inverse: bool) -> tuple[int, ...]:
+    low, high = game_state.scaled_range(base_range, difficulty, kind)
+    modifier = game_state.get_personality_profile(personality).get(modifier_key, 1.0)
+    if inverse:
+        return tuple(int(value / modifier) for value in range(low, high + 1))
+    return tuple(int(value * modifier) for value in range(low, high + 1))
+
+
+def apply_outcomes(stats, rolls, rng) -> None:
+    # Cat과 시뮬레이터가 같이 쓰는 스탯 변화. rolls는 effect_table(...)[행동]이고,
+    # 행 순서대로 rng.choice로 하나씩 뽑아 더한 뒤 0~MAX_STAT로 자른다.
+    choice = rng.choice
+    max_stat = game_state.MAX_STAT
+    for key, sign, outcomes in rolls:
+        value = getattr(stats, key) + sign * choice(outcomes)
+        setattr(stats, key, 0 if value < 0 else max_stat if value > max_stat else value)
+
+
+def care_rule_fires(value, threshold, high: bool) -> bool:
+    return value >= threshold if high else value <= threshold
+
+
+@lru_cache(maxsize=None)
+def effect_table(difficulty: str | None, personality: str | None) -> dict:
+    difficulty = game_state.normalize_difficulty(difficulty)
+    personality = game_state.normalize_personality(personality)
+    return {
+        action: tuple(
+            (key, sign, roll_outcomes(base_range, difficulty, kind, personality, modifier_key, inverse))
+            for key, sign, base_range, kind, modifier_key, inverse in rolls
+        )
+        for action, rolls in ACTION_EFFECTS.items()
+    }
@@ -11,6 +11,23 @@ EVOLUTION_COST = {
     LION: 1000,
 }
 
+EVOLUTION_ITEM = {
+    ADULT: "고기",
+    LION: "뼈",
+}
+
+EVOLUTION_DAY = {
+    BABY: 7,
+    ADULT: 21,
+    LION: 35,
+}
+
+# 스탯별 허용 구간 (이상, 이하)
+EVOLUTION_STAT_RANGE = {
+    ADULT: {"happiness": (75, 100), "tiredness": (0, 25), "cleanliness": (75, 100), "hunger": (0, 25)},
+    LION: {"happiness": (80, 100), "tiredness": (0, 15), "cleanliness": (80, 100), "hunger": (0, 15)},
+}
+
 def get_next_stage(stage):
     if stage not in EVOLUTION_ORDER:
         return None
@@ -19,6 +36,11 @@ def get_next_stage(stage):
         return None
     return EVOLUTION_ORDER[idx + 1]
 
+def meets_stat_requirements(cat, stage=None):
+    ranges = EVOLUTION_STAT_RANGE.get(stage or getattr(cat, "stage", None), {})
+    return all(low <= getattr(cat, key) <= high for key, (low, high) in ranges.items())
+
+
 def can_evolve(cat, day, coin, has_meat=False, has_bone=False, cost_override=None):
     next_stage = get_next_stage(cat.stage)
     if not next_stage:
@@ -32,21 +54,21 @@ def can_evolve(cat, day, coin, has_meat=False, has_bone=False, cost_override=Non
         return False, f"코인 {cost} 필요"
 
     if cat.stage == BABY:
-        if day < 7:
-            return False, "7일 필요"
+        if day < EVOLUTION_DAY[BABY]:
+            return False, f"{EVOLUTION_DAY[BABY]}일 필요"
         return True, "진화 가능"
 
     if cat.stage == ADULT:
-        if day < 21 or not has_meat:
-            return False, "21일 + 고기 필요"
-        if cat.happiness < 75 or cat.tiredness > 25 or cat.cleanliness < 75 or cat.hunger > 25:
+        if day < EVOLUTION_DAY[ADULT] or not has_meat:
+            return False, f"{EVOLUTION_DAY[ADULT]}일 + 고기 필요"
+        if not meets_stat_requirements(cat, ADULT):
             return False, "스탯 부족"
         return True, "진화 가능"
 
     if cat.stage == LION:
-        if day < 35 or not has_bone:
-            return False, "35일 + 뼈 필요"
-        if cat.happiness < 80 or cat.tiredness > 15 or cat.cleanliness < 80 or cat.hunger > 15:
+        if day < EVOLUTION_DAY[LION] or not has_bone:
+            return False, f"{EVOLUTION_DAY[LION]}일 + 뼈 필요"
+        if not meets_stat_requirements(cat, LION):
             return False, "스탯 부족"
         return True, "진화 가능"
 
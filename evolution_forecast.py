@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import effects
+import evolution
+import state as game_state
+
+
+STAT_KEYS = ("hunger", "tiredness", "happiness", "cleanliness")
+CARE_ACTIONS = ("clean", "play_free", "feed_free", "sleep")
+# 정책은 effects.BASIC_CARE_RULES와 같은 (행동, 기준 스탯, 기준값, 이상일 때) 규칙 목록이다.
+# 기준 스탯이 None이면 매 단계 한다. 네 가지를 매번 다 하면 배고픔으로 죽으므로 기본은 "basic"이다.
+# "evolve"는 진화 스탯 범위를 노리는 정책으로, 놀기만 아껴서 배고픔이 쌓이지 않게 한다.
+CARE_POLICIES = {
+    "basic": effects.BASIC_CARE_RULES,
+    "evolve": (
+        ("clean", "cleanliness", 90, False),
+        ("play_free", "happiness", 60, False),
+        ("feed_free", "hunger", 10, True),
+        ("sleep", "tiredness", 10, True),
+    ),
+    "full": tuple((action, None, 0, True) for action in CARE_ACTIONS),
+    "none": (),
+}
+# 진화 메뉴 한 줄에 들어가도록 짧게 쓴다.
+POLICY_LABELS = {
+    "basic": "필요할 때",
+    "evolve": "놀기 절약",
+    "full": "전부 돌봄",
+    "none": "안 돌봄",
+}
+DEFAULT_POLICY = "basic"
+FORECAST_DAYS = 14
+# 이보다 작은 확률 질량은 더 퍼뜨리지 않는다.
+NEGLIGIBLE = 1e-12
+
+# 스탯마다 따로 판정되는 사망/가출 조건
+FAILURE_TESTS = {
+    "hunger": lambda value: value >= game_state.DEATH_HUNGER_THRESHOLD,
+    "tiredness": lambda value: value >= game_state.DEATH_TIREDNESS_THRESHOLD,
+    "happiness": lambda value: value <= game_state.RUNAWAY_HAPPINESS_THRESHOLD,
+    "cleanliness": lambda value: value <= game_state.RUNAWAY_CLEANLINESS_THRESHOLD,
+}
+
+
+@lru_cache(maxsize=None)
+def delta_kernel(difficulty: str, personality: str, action: str, stat: str) -> tuple[tuple[int, float], ...]:
+    for key, sign, outcomes in effects.effect_table(difficulty, personality)[action]:
+        if key == stat:
+            weight = 1.0 / len(outcomes)
+            counts = {}
+            for outcome in outcomes:
+                counts[sign * outcome] = counts.get(sign * outcome, 0) + 1
+            return tuple((delta, count * weight) for delta, count in sorted(counts.items()))
+    return ((0, 1.0),)
+
+
+@lru_cache(maxsize=None)
+def phase_kernel(difficulty: str, personality: str, stat: str, care: tuple[str, ...], phase_action: str) -> tuple:
+    # 시작 값마다 (돌보기 → 시간 경과) 후의 분포.
+    # 게임처럼 행동마다 사망/가출을 판정하고, 해당 값은 제외해 질량이 빠져나가게 한다.
+    max_stat = game_state.MAX_STAT
+    failed = FAILURE_TESTS[stat]
+    kernels = [delta_kernel(difficulty, personality, action, stat) for action in (*care, phase_action)]
+    rows = []
+    for start in range(max_stat + 1):
+        dist = {start: 1.0}
+        for kernel in kernels:
+            nxt = {}
+            for value, p in dist.items():
+                for delta, q in kernel:
+                    end = value + delta
+                    end = 0 if end < 0 else (max_stat if end > max_stat else end)
+                    if not failed(end):
+                        nxt[end] = nxt.get(end, 0.0) + p * q
+            dist = nxt
+        rows.append(tuple(sorted(dist.items())))
+    return tuple(rows)
+
+
+def _care_for(policy) -> tuple[tuple, ...]:
+    # 이름, 규칙 목록, 또는 매번 할 행동 이름 목록을 받는다.
+    if isinstance(policy, str):
+        return CARE_POLICIES.get(policy, CARE_POLICIES[DEFAULT_POLICY])
+    return tuple(rule if isinstance(rule, tuple) else (rule, None, 0, True) for rule in policy or ())
+
+
+@lru_cache(maxsize=None)
+def _affects(action: str, stat: str) -> bool:
+    return any(key == stat for key, *_ in effects.ACTION_EFFECTS[action])
+
+
+def _fire_chance(dist: dict[int, float], rule) -> float:
+    # 살아 있다는 조건에서 기준 스탯이 규칙을 만족할 확률
+    _, _, threshold, high = rule
+    total = sum(dist.values())
+    if total <= 0:
+        return 0.0
+    return sum(p for value, p in dist.items() if effects.care_rule_fires(value, threshold, high)) / total
+
+
+def _care_step(dists, key, rules, difficulty, personality, phase_action) -> dict[int, float]:
+    # key 스탯의 (돌보기 → 시간 경과) 한 단계. 자기 값을 기준으로 하는 규칙은 값마다 정확히 가르고,
+    # 다른 스탯을 기준으로 하는 규칙은 스탯끼리 독립이라고 보고 켜질 확률로 섞는다.
+    relevant = [rule for rule in rules if _affects(rule[0], key)]
+    order = [rule[0] for rule in relevant]
+    own = [rule for rule in relevant if rule[1] == key]
+    combos = [((), 1.0)]
+    for rule in relevant:
+        if rule[1] == key:
+            continue
+        chance = 1.0 if rule[1] is None else _fire_chance(dists[rule[1]], rule)
+        nxt = []
+        for fired, weight in combos:
+            if chance > 0.0:
+                nxt.append((fired + (rule[0],), weight * chance))
+            if chance < 1.0:
+                nxt.append((fired, weight * (1.0 - chance)))
+        combos = nxt
+
+    kernels = {}
+    result = [0.0] * (game_state.MAX_STAT + 1)
+    for value, p in dists[key].items():
+        if p < NEGLIGIBLE:
+            continue
+        own_fired = frozenset(rule[0] for rule in own if effects.care_rule_fires(value, rule[2], rule[3]))
+        for fired, weight in combos:
+            rows = kernels.get((own_fired, fired))
+            if rows is None:
+                chosen = own_fired.union(fired)
+                care = tuple(action for action in order if action in chosen)
+                rows = kernels[own_fired, fired] = phase_kernel(difficulty, personality, key, care, phase_action)
+            pw = p * weight
+            for end, q in rows[value]:
+                result[end] += pw * q
+    return {value: p for value, p in enumerate(result) if p > 0.0}
+
+
+def forecast_evolution(
+    cat,
+    day: int,
+    time_phase: str,
+    *,
+    policy=DEFAULT_POLICY,
+    used_actions=(),
+    days: int = FORECAST_DAYS,
+) -> list[dict]:
+    stage = getattr(cat, "stage", None)
+    ranges = evolution.EVOLUTION_STAT_RANGE.get(stage)
+    if ranges is None:
+        return []
+
+    difficulty = game_state.normalize_difficulty(getattr(cat, "difficulty", None))
+    personality = game_state.normalize_personality(getattr(cat, "personality", None))
+    care = _care_for(policy)
+    used = set(used_actions)
+    first_care = tuple(rule for rule in care if rule[0] not in used)
+    required_day = evolution.EVOLUTION_DAY.get(stage, 0)
+
+    dists = {}
+    for key in STAT_KEYS:
+        try:
+            value = int(getattr(cat, key))
+        except (TypeError, ValueError):
+            value = 0
+        dists[key] = {max(0, min(value, game_state.MAX_STAT)): 1.0}
+
+    current_day = max(1, int(day))
+    phase = time_phase if time_phase in (game_state.MORNING, game_state.NIGHT) else game_state.MORNING
+    pending_care = first_care
+    results = []
+    while len(results) < max(0, int(days)):
+        if phase == game_state.MORNING:
+            next_phase, phase_action = game_state.NIGHT, "night"
+        else:
+            next_phase, phase_action = game_state.MORNING, "morning"
+        # 규칙은 돌보기 전 값으로 판정하므로 모든 스탯을 이전 분포에서 계산한 뒤 바꾼다.
+        dists = {
+            key: _care_step(dists, key, pending_care, difficulty, personality, phase_action)
+            for key in STAT_KEYS
+        }
+        phase = next_phase
+        pending_care = care
+
+        if phase != game_state.MORNING:
+            continue
+        current_day += 1
+        alive = 1.0
+        ready = 1.0
+        for key in STAT_KEYS:
+            low, high = ranges[key]
+            dist = dists[key]
+            alive *= sum(dist.values())
+            ready *= sum(p for value, p in dist.items() if low <= value <= high)
+        results.append(
+            {
+                "day": current_day,
+                "alive": alive,
+                "ready": ready,
+                "day_ok": current_day >= required_day,
+            }
+        )
+    return results
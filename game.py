@@ -1,10 +1,8 @@
 import pygame
 import sys
 import state as game_state
-from minigames.memory_game import MemoryGame
-from minigames.cat_run import CatRunGame
-from minigames.cat_follow import CatFollowGame
-from minigames.laser_chase import run_laser_chase
+from rng import minigame_stream
+from minigames import replay
 
 from config import asset_path
 from pg_utils import load_font
@@ -32,7 +30,9 @@ class MiniGameScreen:
         self.card_memory = pygame.Rect(40, 220, 320, 90)
         self.card_footsteps = pygame.Rect(40, 320, 320, 90)
         self.card_laser = pygame.Rect(40, 420, 320, 90)
+        self.btn_laser_mode = pygame.Rect(236, 466, 112, 32)
         self.btn_start = pygame.Rect(260, 525, 110, 36)
+        self.laser_multi = False
 
     def run(self):
         while self.running:
@@ -62,6 +62,10 @@ class MiniGameScreen:
         if self.card_footsteps.collidepoint(pos):
             self.selected = "footsteps"
             return
+        if self.btn_laser_mode.collidepoint(pos):
+            self.laser_multi = not self.laser_multi
+            self.selected = "laser"
+            return
         if self.card_laser.collidepoint(pos):
             self.selected = "laser"
             return
@@ -95,17 +99,20 @@ class MiniGameScreen:
             getattr(self.state, "minigame_used", None)
         )
 
+    def _minigame_seed(self, minigame_id):
+        service = getattr(self.state, "rng", None)
+        if service is None:
+            return None
+        return service.stream(minigame_stream(minigame_id)).getrandbits(64)
+
     def _run_minigame(self, minigame_id):
-        if minigame_id == "jump":
-            return CatRunGame(self.screen, self.state).run()
-        if minigame_id == "memory":
-            return MemoryGame(self.screen, self.state).run()
-        if minigame_id == "footsteps":
-            return CatFollowGame(self.screen, self.state).run()
-        if minigame_id == "laser":
-            difficulty = getattr(self.state, "difficulty", "normal")
-            return run_laser_chase(self.screen, difficulty=difficulty)
-        return None
+        seed = self._minigame_seed(minigame_id)
+        if minigame_id == "laser" and self.laser_multi:
+            # 사용 기록과 시드 스트림은 "laser"를 그대로 쓰고 리플레이에만 모드를 남긴다.
+            minigame_id = "laser_multi"
+        if seed is not None and replay.recording_enabled():
+            return replay.play_and_record(minigame_id, self.screen, self.state, seed=seed)
+        return replay.play(minigame_id, self.screen, self.state, seed=seed)
 
     def _apply_minigame_result(self, result, *, win_on_positive_coins=False):
         if not isinstance(result, dict):
@@ -168,6 +175,11 @@ class MiniGameScreen:
         self.draw_card(self.card_memory, "메모리 게임", self.selected == "memory", used_memory)
         self.draw_card(self.card_footsteps, "고양이 따라가기", self.selected == "footsteps", used_footsteps)
         self.draw_card(self.card_laser, "레이저 포인터", self.selected == "laser", used_laser)
+        mode_color = (250, 210, 170) if self.laser_multi else (240, 240, 240)
+        pygame.draw.rect(self.screen, mode_color, self.btn_laser_mode)
+        pygame.draw.rect(self.screen, (0, 0, 0), self.btn_laser_mode, 1)
+        mode_text = self.font.render("여러 개" if self.laser_multi else "하나", True, (0, 0, 0))
+        self.screen.blit(mode_text, mode_text.get_rect(center=self.btn_laser_mode.center))
 
         pygame.draw.rect(self.screen, (200, 200, 200), self.btn_start)
         pygame.draw.rect(self.screen, (0, 0, 0), self.btn_start, 1)
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import random
+from array import array
+
+import effects
+import evolution
+import state as game_state
+from cat import stage_images
+
+
+STAT_KEYS = ("hunger", "tiredness", "happiness", "cleanliness")
+CARE_ACTIONS = ("feed_free", "play_free", "clean", "sleep")
+COLUMN_KEYS = (*STAT_KEYS, "stage", "difficulty", "personality", "image", "alive", "runaway")
+STAGES = tuple(evolution.EVOLUTION_ORDER)
+DIFFICULTIES = tuple(game_state.DIFFICULTY_PROFILE)
+PERSONALITIES = tuple(game_state.PERSONALITY_PROFILE)
+MAX_HOUSEHOLD = 48
+
+INITIAL_STAT_RANGES = {
+    "hunger": (25, 50),
+    "tiredness": (5, 25),
+    "happiness": (50, 75),
+    "cleanliness": (30, 80),
+}
+
+
+def _index(values: tuple[str, ...], value, default: int = 0) -> int:
+    try:
+        return values.index(value)
+    except ValueError:
+        return default
+
+
+class CatHousehold:
+    def __init__(self, rng=None):
+        self.rng = rng or random
+        self.names: list[str] = []
+        self.hunger = array("i")
+        self.tiredness = array("i")
+        self.happiness = array("i")
+        self.cleanliness = array("i")
+        self.stage = array("b")
+        self.difficulty = array("b")
+        self.personality = array("b")
+        self.image = array("b")
+        self.alive = array("b")
+        self.runaway = array("b")
+        self.care_used: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(
+        self,
+        name: str,
+        stage: str = evolution.BABY,
+        difficulty: str | None = None,
+        personality: str | None = None,
+        stats: dict | None = None,
+        *,
+        alive: bool = True,
+        runaway: bool = False,
+        image: int | None = None,
+    ) -> int:
+        stage_index = _index(STAGES, stage)
+        self.names.append(str(name))
+        self.stage.append(stage_index)
+        self.difficulty.append(_index(DIFFICULTIES, game_state.normalize_difficulty(difficulty)))
+        self.personality.append(_index(PERSONALITIES, game_state.normalize_personality(personality)))
+        for key in STAT_KEYS:
+            if stats is not None and key in stats:
+                value = game_state.clamp(int(stats[key]))
+            else:
+                value = self.rng.randint(*INITIAL_STAT_RANGES[key])
+            getattr(self, key).append(value)
+
+        images = stage_images(STAGES[stage_index])
+        if image is None:
+            image = self.rng.randrange(len(images)) if images else 0
+        self.image.append(max(0, min(int(image), 127)))
+        self.alive.append(1 if alive else 0)
+        self.runaway.append(1 if runaway else 0)
+        return len(self.names) - 1
+
+    def adopt(self, difficulty: str | None, name: str | None = None) -> str | None:
+        if len(self) >= MAX_HOUSEHOLD:
+            return None
+        name = name or f"냥이{len(self) + 1}"
+        self.add(name, evolution.BABY, difficulty, self.rng.choice(PERSONALITIES))
+        return name
+
+    def remove_lost(self) -> int:
+        keep = [i for i in range(len(self)) if self.alive[i] and not self.runaway[i]]
+        removed = len(self) - len(keep)
+        if removed:
+            self.names = [self.names[i] for i in keep]
+            for key in COLUMN_KEYS:
+                column = getattr(self, key)
+                setattr(self, key, array(column.typecode, (column[i] for i in keep)))
+        return removed
+
+    def active_indices(self) -> list[int]:
+        alive = self.alive
+        runaway = self.runaway
+        return [i for i in range(len(self.names)) if alive[i] and not runaway[i]]
+
+    def _groups(self, indices) -> dict[tuple[int, int], list[int]]:
+        groups = {}
+        difficulty = self.difficulty
+        personality = self.personality
+        for i in indices:
+            groups.setdefault((difficulty[i], personality[i]), []).append(i)
+        return groups
+
+    def apply_effect(self, action: str, indices=None):
+        if indices is None:
+            indices = self.active_indices()
+        choices = self.rng.choices
+        max_stat = game_state.MAX_STAT
+        for (d, p), members in self._groups(indices).items():
+            for key, sign, outcomes in effects.effect_table(DIFFICULTIES[d], PERSONALITIES[p])[action]:
+                column = getattr(self, key)
+                for i, delta in zip(members, choices(outcomes, k=len(members))):
+                    value = column[i] + sign * delta
+                    column[i] = 0 if value < 0 else (max_stat if value > max_stat else value)
+
+    def care_all(self, action: str) -> bool:
+        if action not in CARE_ACTIONS or action in self.care_used:
+            return False
+        self.apply_effect(action)
+        self.care_used.add(action)
+        return True
+
+    def on_night(self) -> list[int]:
+        return self._advance_phase("night")
+
+    def on_morning(self) -> list[int]:
+        return self._advance_phase("morning")
+
+    def _advance_phase(self, action: str) -> list[int]:
+        indices = self.active_indices()
+        self.apply_effect(action, indices)
+        self.care_used = set()
+        return self._update_masks(indices)
+
+    def _update_masks(self, indices) -> list[int]:
+        hunger = self.hunger
+        tiredness = self.tiredness
+        happiness = self.happiness
+        cleanliness = self.cleanliness
+        dead = [
+            i for i in indices
+            if hunger[i] >= game_state.DEATH_HUNGER_THRESHOLD or tiredness[i] >= game_state.DEATH_TIREDNESS_THRESHOLD
+        ]
+        gone = [
+            i for i in indices
+            if happiness[i] <= game_state.RUNAWAY_HAPPINESS_THRESHOLD
+            or cleanliness[i] <= game_state.RUNAWAY_CLEANLINESS_THRESHOLD
+        ]
+        for i in dead:
+            self.alive[i] = 0
+        for i in gone:
+            self.runaway[i] = 1
+        return sorted(set(dead) | set(gone))
+
+    def status(self, i: int) -> str:
+        if not self.alive[i]:
+            return "DEAD"
+        if self.runaway[i]:
+            return "RUNAWAY"
+        return "OK"
+
+    def image_path(self, i: int) -> str | None:
+        images = stage_images(STAGES[self.stage[i]])
+        if not images:
+            return None
+        return images[self.image[i] % len(images)]
+
+    def to_save(self) -> dict:
+        return {
+            "names": list(self.names),
+            "stage": [STAGES[i] for i in self.stage],
+            "difficulty": [DIFFICULTIES[i] for i in self.difficulty],
+            "personality": [PERSONALITIES[i] for i in self.personality],
+            "image": list(self.image),
+            **{key: list(getattr(self, key)) for key in STAT_KEYS},
+            "alive": list(self.alive),
+            "runaway": list(self.runaway),
+            "care_used": sorted(self.care_used),
+        }
+
+    @classmethod
+    def from_save(cls, data, rng=None) -> "CatHousehold":
+        household = cls(rng=rng)
+        if not isinstance(data, dict):
+            return household
+
+        names = data.get("names")
+        if not isinstance(names, list):
+            return household
+
+        def column(key, default):
+            values = data.get(key)
+            if not isinstance(values, list) or len(values) != len(names):
+                return [default] * len(names)
+            return values
+
+        stages = column("stage", evolution.BABY)
+        difficulties = column("difficulty", game_state.DIFFICULTY_NORMAL)
+        personalities = column("personality", game_state.PERSONALITY_ENERGETIC)
+        images = column("image", 0)
+        stats = {key: column(key, 50) for key in STAT_KEYS}
+        alive = column("alive", 1)
+        runaway = column("runaway", 0)
+
+        for i, name in enumerate(names[:MAX_HOUSEHOLD]):
+            try:
+                household.add(
+                    str(name),
+                    stages[i] if stages[i] in STAGES else evolution.BABY,
+                    difficulties[i],
+                    personalities[i],
+                    {key: int(stats[key][i]) for key in STAT_KEYS},
+                    alive=bool(alive[i]),
+                    runaway=bool(runaway[i]),
+                    image=int(images[i]),
+                )
+            except (TypeError, ValueError):
+                continue
+
+        care_used = data.get("care_used")
+        if isinstance(care_used, list):
+            household.care_used = {action for action in care_used if action in CARE_ACTIONS}
+        return household
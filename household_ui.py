@@ -0,0 +1,216 @@
+import pygame
+
+import state as game_state
+from config import asset_path
+from household import CARE_ACTIONS, MAX_HOUSEHOLD, PERSONALITIES
+from pg_utils import load_font, load_image
+
+
+BG_COLOR = (245, 245, 245)
+PANEL_COLOR = (230, 230, 230)
+BORDER = (0, 0, 0)
+FONT_PATH = asset_path("fonts", "ThinDungGeunMo.ttf")
+
+CARE_LABELS = ("밥", "놀기", "씻기", "잠자기")
+STAT_BARS = (
+    ("hunger", "배고픔", (255, 100, 100)),
+    ("tiredness", "피로", (100, 100, 255)),
+    ("happiness", "행복", (100, 255, 100)),
+    ("cleanliness", "청결", (180, 180, 180)),
+)
+STATUS_LABELS = {"DEAD": "무지개다리", "RUNAWAY": "가출"}
+
+
+class HouseholdUI:
+    def __init__(self, screen, household, difficulty, play_click_sound=None, on_change=None):
+        self.screen = screen
+        self.household = household
+        self.difficulty = difficulty
+        self.on_change = on_change
+        self.play_click_sound = play_click_sound
+        self.running = True
+        self.scroll = 0
+        self.message = ""
+
+        self.font = load_font(FONT_PATH, 17)
+        self.big_font = load_font(FONT_PATH, 22)
+        self.small_font = load_font(FONT_PATH, 13)
+
+        self.close_rect = pygame.Rect(360, 10, 30, 30)
+        self.adopt_rect = pygame.Rect(20, 84, 84, 30)
+        self.cleanup_rect = pygame.Rect(112, 84, 84, 30)
+        self.care_rects = [pygame.Rect(20 + i * 92, 122, 84, 30) for i in range(len(CARE_ACTIONS))]
+
+        self.list_top = 164
+        self.row_h = 70
+        self.thumb_size = (48, 48)
+        self.thumb_cache = {}
+
+    def run(self):
+        clock = pygame.time.Clock()
+        while self.running:
+            clock.tick(60)
+            self.handle_events()
+            self.draw()
+
+    def _click(self):
+        if self.play_click_sound:
+            self.play_click_sound()
+
+    def _changed(self):
+        if self.on_change:
+            self.on_change()
+
+    def _view_h(self):
+        return self.screen.get_height() - self.list_top - 10
+
+    def _max_scroll(self):
+        return max(0, len(self.household) * self.row_h - self._view_h())
+
+    def _scroll_by(self, delta):
+        self.scroll = max(0, min(int(self.scroll) + int(delta), self._max_scroll()))
+
+    def visible_range(self) -> range:
+        first = max(0, int(self.scroll) // self.row_h)
+        last = min(len(self.household), (int(self.scroll) + self._view_h()) // self.row_h + 1)
+        return range(first, last)
+
+    def handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                self.running = False
+            elif event.type == pygame.MOUSEWHEEL:
+                self._scroll_by(-event.y * 42)
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self._handle_mouse_down(event)
+
+    def _handle_mouse_down(self, event):
+        if event.button == 4:
+            self._scroll_by(-42)
+            return
+        if event.button == 5:
+            self._scroll_by(42)
+            return
+        if event.button != 1:
+            return
+
+        if self.close_rect.collidepoint(event.pos):
+            self._click()
+            self.running = False
+            return
+
+        if self.adopt_rect.collidepoint(event.pos):
+            self._click()
+            if len(self.household) >= MAX_HOUSEHOLD:
+                self.message = f"최대 {MAX_HOUSEHOLD}마리까지 키울 수 있습니다."
+                return
+            name = self.household.adopt(self.difficulty)
+            self.message = f"{name} 입양!" if name else ""
+            self._changed()
+            return
+
+        if self.cleanup_rect.collidepoint(event.pos):
+            self._click()
+            removed = self.household.remove_lost()
+            self.scroll = min(self.scroll, self._max_scroll())
+            self.message = f"{removed}마리 정리" if removed else "정리할 고양이가 없습니다."
+            if removed:
+                self._changed()
+            return
+
+        for action, label, rect in zip(CARE_ACTIONS, CARE_LABELS, self.care_rects):
+            if rect.collidepoint(event.pos):
+                self._click()
+                if self.household.care_all(action):
+                    self.message = f"모두 {label} 완료"
+                    self._changed()
+                else:
+                    self.message = "이번 시간에는 이미 했습니다."
+                return
+
+    def _thumbnail(self, path):
+        if path in self.thumb_cache:
+            return self.thumb_cache[path]
+        thumb = load_image(path, size=self.thumb_size, smooth=True, alpha=True) if path else None
+        self.thumb_cache[path] = thumb
+        return thumb
+
+    def draw_button(self, rect, text, *, enabled=True):
+        color = PANEL_COLOR if enabled else (215, 215, 215)
+        text_color = (0, 0, 0) if enabled else (130, 130, 130)
+        pygame.draw.rect(self.screen, color, rect)
+        pygame.draw.rect(self.screen, BORDER, rect, 1)
+        label = self.font.render(text, True, text_color)
+        self.screen.blit(label, label.get_rect(center=rect.center))
+
+    def draw_top(self):
+        title = self.big_font.render("가족", True, (0, 0, 0))
+        self.screen.blit(title, (20, 20))
+
+        alive = len(self.household.active_indices())
+        count = self.font.render(f"{alive}/{len(self.household)}마리", True, (70, 70, 70))
+        self.screen.blit(count, (20, 52))
+        if self.message:
+            msg = self.small_font.render(self.message, True, (150, 55, 55))
+            self.screen.blit(msg, (206, 92))
+
+        self.draw_button(self.close_rect, "X")
+        self.draw_button(self.adopt_rect, "입양", enabled=len(self.household) < MAX_HOUSEHOLD)
+        self.draw_button(self.cleanup_rect, "정리")
+        for action, label, rect in zip(CARE_ACTIONS, CARE_LABELS, self.care_rects):
+            self.draw_button(rect, label, enabled=action not in self.household.care_used)
+
+    def draw_row(self, index, rect):
+        household = self.household
+        status = household.status(index)
+        pygame.draw.rect(self.screen, (252, 252, 252) if status == "OK" else (225, 225, 225), rect)
+        pygame.draw.rect(self.screen, BORDER, rect, 1)
+
+        thumb = self._thumbnail(household.image_path(index))
+        if thumb is not None:
+            self.screen.blit(thumb, (rect.x + 6, rect.y + 9))
+
+        personality = game_state.get_personality_label(PERSONALITIES[household.personality[index]])
+        name = self.font.render(household.names[index], True, (0, 0, 0))
+        self.screen.blit(name, (rect.x + 62, rect.y + 6))
+        info = STATUS_LABELS.get(status, personality)
+        info_text = self.small_font.render(info, True, (120, 60, 60) if status != "OK" else (90, 90, 90))
+        self.screen.blit(info_text, (rect.x + 62, rect.y + 34))
+
+        bar_x = rect.x + 170
+        for row, (key, label, color) in enumerate(STAT_BARS):
+            value = getattr(household, key)[index]
+            y = rect.y + 8 + row * 15
+            text = self.small_font.render(label, True, (60, 60, 60))
+            self.screen.blit(text, (bar_x, y - 4))
+            bar = pygame.Rect(bar_x + 48, y, 130, 8)
+            pygame.draw.rect(self.screen, BORDER, bar, 1)
+            fill = int((bar.w - 2) * value / game_state.MAX_STAT)
+            if fill > 0:
+                pygame.draw.rect(self.screen, color, (bar.x + 1, bar.y + 1, fill, bar.h - 2))
+
+    def draw_list(self):
+        if not len(self.household):
+            msg = self.font.render("아직 함께 사는 고양이가 없습니다.", True, (70, 70, 70))
+            self.screen.blit(msg, msg.get_rect(center=(200, 320)))
+            return
+
+        screen_w, screen_h = self.screen.get_size()
+        list_rect = pygame.Rect(0, self.list_top, screen_w, screen_h - self.list_top)
+        old_clip = self.screen.get_clip()
+        self.screen.set_clip(list_rect)
+
+        y0 = self.list_top - int(self.scroll)
+        for index in self.visible_range():
+            rect = pygame.Rect(12, y0 + index * self.row_h, screen_w - 24, self.row_h - 4)
+            self.draw_row(index, rect)
+
+        self.screen.set_clip(old_clip)
+
+    def draw(self):
+        self.screen.fill(BG_COLOR)
+        self.draw_top()
+        self.draw_list()
+        pygame.display.flip()
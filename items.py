@@ -40,6 +40,15 @@ SHOP_ID_TO_INVENTORY_ID = {
     "bone": "뼈",
 }
 
+ITEM_EFFECTS = {
+    "사료": ("hunger", -30),
+    "생선": ("hunger", -50),
+    "츄르": ("hunger", -70),
+    "강아지풀": ("happiness", 20),
+    "실": ("happiness", 30),
+    "낚싯대": ("happiness", 50),
+}
+
 ITEM_ALIASES = {
     **SHOP_ID_TO_INVENTORY_ID,
     "밥": "사료",
@@ -84,3 +93,21 @@ def inventory_item_from_shop_id(item_id: str) -> str | None:
 
 def get_item_info(item_id: str) -> dict:
     return ITEM_INFO.get(normalize_inventory_item(item_id), {})
+
+
+def get_shop_item(item_id: str) -> dict | None:
+    for items in SHOP_CATEGORIES.values():
+        for item in items:
+            if item["id"] == item_id:
+                return dict(item)
+    return None
+
+
+def apply_item_effect(cat, item_id: str) -> bool:
+    effect = ITEM_EFFECTS.get(normalize_inventory_item(item_id))
+    if effect is None:
+        return False
+    stat, delta = effect
+    setattr(cat, stat, getattr(cat, stat) + delta)
+    cat._clamp_all()
+    return True
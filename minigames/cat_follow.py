@@ -5,19 +5,21 @@ import pygame
 from config import asset_path
 from pg_utils import load_font, load_image, solid_surface
 import state as game_state
+from minigames.driver import LiveDriver
 
 FONT_PATH = asset_path("fonts", "ThinDungGeunMo.ttf")
 ASSET_DIR = asset_path("minigames", "cat_follow")
 
 
 class CatFollowGame:
-    def __init__(self, screen: pygame.Surface, state=None, ach=None):
+    def __init__(self, screen: pygame.Surface, state=None, ach=None, rng=None, driver=None):
         self.screen = screen
         self.state = state
         self.ach = ach
+        self.rng = rng or random
+        self.driver = driver or LiveDriver()
         self.difficulty = game_state.normalize_difficulty(getattr(state, "difficulty", None))
         self.balance = game_state.get_minigame_profile(self.difficulty, "footsteps")
-        self.clock = pygame.time.Clock()
         self.running = True
 
         self.font = load_font(FONT_PATH, 22)
@@ -69,7 +71,7 @@ class CatFollowGame:
 
     def _new_sequence(self, length: int):
         g = self.grid
-        return [(random.randrange(g), random.randrange(g)) for _ in range(length)]
+        return [(self.rng.randrange(g), self.rng.randrange(g)) for _ in range(length)]
 
     def _sequence_length_for_round(self, round_idx: int):
         start_len = getattr(self, "start_len", getattr(self, "seq_len", 1))
@@ -123,11 +125,11 @@ class CatFollowGame:
             self.ach.on_event("minigame_played")
 
         while self.running:
-            dt = self.clock.tick(60) / 1000.0
+            dt = self.driver.tick(60) / 1000.0
             w, h, tile, gx, gy, ui_offset_y = self._build_layout()
             self._ensure_scaled_cat(tile)
 
-            for event in pygame.event.get():
+            for event in self.driver.get_events():
                 if not self._handle_event(event, tile, gx, gy):
                     break
 
@@ -242,7 +244,7 @@ class CatFollowGame:
         self._draw_phase_hint(w, h)
         if self.phase == "RESULT":
             self._draw_result_overlay(w, h)
-        pygame.display.flip()
+        self.driver.flip()
 
     def _draw_header(self, w, h, ui_offset_y):
         title = self.font_big.render("고양이 따라가기", True, (255, 255, 255))
@@ -1,10 +1,13 @@
+import math
 import pygame
 import random
 import sys
+from collections import deque
 
 from config import asset_path
 from pg_utils import load_font, load_image, solid_surface
 import state as game_state
+from minigames.driver import LiveDriver
 
 FONT_PATH = asset_path("fonts", "ThinDungGeunMo.ttf")
 
@@ -12,25 +15,100 @@ WIDTH, HEIGHT = 400, 600
 FPS = 60
 GROUND_Y = 450
 
+# 물리는 항상 1/60초 고정 간격으로 진행하고, 그리기는 남은 시간 비율로 보간한다.
+STEP_MS = 1000 / FPS
+MAX_STEPS_PER_FRAME = 8
+
+CAT_SIZE = (48, 48)
+OBSTACLES = (
+    ("orange.png", (25, 25), (255, 150, 0)),
+    ("lemon.png", (40, 35), (255, 200, 0)),
+    ("water.png", (60, 30), (0, 150, 255)),
+)
+
+
+def pixel_step(speed: float) -> int:
+    # 장애물이 한 스텝에 움직이는 픽셀 수. 예전에 정수 Rect의 x에서 speed를 빼던 것과 같게
+    # 가장 가까운 정수로 맞춘다(pygame은 양수 좌표의 .5를 올리므로 이동량은 .5를 내린다).
+    return math.ceil(speed - 0.5)
+
+
+class ObstacleTrack:
+    # 장애물은 같은 속도로 흐르므로 월드 좌표로 저장하고 스크롤 값만 움직인다.
+    # 생성 순서 = 왼쪽부터의 순서라서 앞에서만 빠지고, 충돌/그리기는 필요한 앞부분만 본다.
+    def __init__(self):
+        self.live = deque()
+        self.free = []
+        self.scroll = 0.0
+
+    def __len__(self) -> int:
+        return len(self.live)
+
+    def __iter__(self):
+        for entry in self.live:
+            yield entry[0], self._sync(entry)
+
+    def _sync(self, entry):
+        rect = entry[2]
+        rect.x = int(entry[1] - self.scroll)
+        return rect
+
+    def spawn(self, kind: int, size, midbottom):
+        rect = self.free.pop() if self.free else pygame.Rect(0, 0, 0, 0)
+        rect.size = size
+        rect.midbottom = midbottom
+        self.live.append([kind, rect.x + self.scroll, rect])
+
+    def advance(self, dx: float) -> int:
+        self.scroll += dx
+        retired = 0
+        live = self.live
+        while live and live[0][1] + live[0][2].width - self.scroll < 0:
+            self.free.append(live.popleft()[2])
+            retired += 1
+        return retired
+
+    def overlapping(self, left: float, right: float):
+        for entry in self.live:
+            x = entry[1] - self.scroll
+            if x >= right:
+                break
+            if x + entry[2].width > left:
+                yield entry[0], self._sync(entry)
+
+    def clear(self):
+        while self.live:
+            self.free.append(self.live.pop()[2])
+
 
 class CatRunGame:
-    def __init__(self, screen, state=None, on_game_end=None):
+    def __init__(self, screen, state=None, on_game_end=None, rng=None, driver=None, pixel_collision=False):
         self.screen = screen
         self.state = state
+        self.rng = rng or random
+        self.driver = driver or LiveDriver()
         self.difficulty = game_state.normalize_difficulty(getattr(state, "difficulty", None))
         self.balance = game_state.get_minigame_profile(self.difficulty, "jump")
         self.on_game_end = on_game_end
-        self.clock = pygame.time.Clock()
         self.running = True
-
-        self.font = load_font(FONT_PATH, 18)
-        self._load_assets()
+        self.pixel_collision = bool(pixel_collision) and screen is not None
+
+        # screen 없이 만들면 이미지 없이 물리만 도는 헤드리스 모드
+        self.headless = screen is None
+        if self.headless:
+            self.font = None
+            self.obstacle_imgs = [None] * len(OBSTACLES)
+        else:
+            self.font = load_font(FONT_PATH, 18)
+            self._load_assets()
         self._init_world()
         self._init_player()
         self._init_obstacles()
 
         self.distance = 0.0
         self.score = 0
+        self.steps = 0
+        self.accumulator = 0.0
 
     def _load_assets(self):
         self.bg = load_image(
@@ -42,34 +120,23 @@ class CatRunGame:
 
         self.cat_img = load_image(
             asset_path("minigames", "cat_run", "cat.png"),
-            size=(48, 48),
+            size=CAT_SIZE,
             smooth=False,
             alpha=True,
-        ) or solid_surface((48, 48), (255, 200, 100), alpha=True)
+        ) or solid_surface(CAT_SIZE, (255, 200, 100), alpha=True)
 
         self.obstacle_imgs = [
             load_image(
-                asset_path("minigames", "cat_run", "orange.png"),
-                size=(25, 25),
+                asset_path("minigames", "cat_run", filename),
+                size=size,
                 smooth=False,
                 alpha=True,
             )
-            or solid_surface((25, 25), (255, 150, 0), alpha=True),
-            load_image(
-                asset_path("minigames", "cat_run", "lemon.png"),
-                size=(40, 35),
-                smooth=False,
-                alpha=True,
-            )
-            or solid_surface((40, 35), (255, 200, 0), alpha=True),
-            load_image(
-                asset_path("minigames", "cat_run", "water.png"),
-                size=(60, 30),
-                smooth=False,
-                alpha=True,
-            )
-            or solid_surface((60, 30), (0, 150, 255), alpha=True),
+            or solid_surface(size, color, alpha=True)
+            for filename, size, color in OBSTACLES
         ]
+        self.cat_mask = pygame.mask.from_surface(self.cat_img)
+        self.obstacle_masks = [pygame.mask.from_surface(img) for img in self.obstacle_imgs]
 
     def _init_world(self):
         self.bg_x1 = 0
@@ -79,6 +146,8 @@ class CatRunGame:
     def _init_player(self):
         self.cat_x = 60
         self.cat_y = GROUND_Y
+        self.prev_cat_y = GROUND_Y
+        self.cat_rect = pygame.Rect((self.cat_x, self.cat_y), CAT_SIZE)
         self.cat_vel_y = 0
         self.gravity = 0.8
         self.jump_power = -15
@@ -87,7 +156,9 @@ class CatRunGame:
         self.max_jumps = 2
 
     def _init_obstacles(self):
-        self.obstacles = []
+        self.obstacles = ObstacleTrack()
+        self.obstacle_kinds = [(index, size) for index, (_, size, _) in enumerate(OBSTACLES)]
+        self.last_obstacle_shift = 0.0
         self.base_obstacle_speed = float(self.balance["base_speed"])
         self.obstacle_speed_step = float(self.balance["speed_step"])
         self.obstacle_speed = self.base_obstacle_speed
@@ -123,19 +194,43 @@ class CatRunGame:
         self.max_spawn_meters = max(self.min_spawn_meters + 6, self.base_max_spawn_meters - meter_drop)
 
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.driver.get_events():
             if event.type == pygame.QUIT:
                 self.running = False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                 if event.key == pygame.K_SPACE:
-                    if self.jump_count < self.max_jumps:
-                        self.cat_vel_y = self.jump_power
-                        self.on_ground = False
-                        self.jump_count += 1
+                    self.jump()
+
+    def jump(self) -> bool:
+        if self.jump_count >= self.max_jumps:
+            return False
+        self.cat_vel_y = self.jump_power
+        self.on_ground = False
+        self.jump_count += 1
+        return True
+
+    def advance(self, dt_ms: float) -> int:
+        # 느린 프레임은 여러 스텝으로 따라잡되, 너무 밀리면 버려서 멈춤을 막는다.
+        self.accumulator = min(self.accumulator + dt_ms, STEP_MS * MAX_STEPS_PER_FRAME)
+        steps = 0
+        while self.running and self.accumulator >= STEP_MS:
+            self.update()
+            self.accumulator -= STEP_MS
+            steps += 1
+        return steps
+
+    def step(self, n: int = 1) -> bool:
+        for _ in range(max(0, int(n))):
+            if not self.running:
+                break
+            self.update()
+        return self.running
 
     def update(self):
+        self.steps += 1
+        self.prev_cat_y = self.cat_y
         self.bg_x1 -= self.bg_speed
         self.bg_x2 -= self.bg_speed
         if self.bg_x1 <= -WIDTH:
@@ -154,31 +249,46 @@ class CatRunGame:
             self.on_ground = True
             self.jump_count = 0
 
-        cat_rect = pygame.Rect(self.cat_x, self.cat_y, 48, 48)
         self.spawn_timer += 1
         if self.spawn_timer >= self.next_spawn_frames:
             self.spawn_timer = 0
-            img = random.choice(self.obstacle_imgs)
-            rect = img.get_rect(midbottom=(WIDTH + 40, GROUND_Y + 48))
-            self.obstacles.append((img, rect))
+            kind, size = self.rng.choice(self.obstacle_kinds)
+            self.obstacles.spawn(kind, size, (WIDTH + 40, GROUND_Y + 48))
             self.next_spawn_frames = self._compute_next_spawn_frames()
-        for obs in self.obstacles[:]:
-            obs[1].x -= self.obstacle_speed
-            if obs[1].right < 0:
-                self.obstacles.remove(obs)
-                self.score += 1
-
-            if cat_rect.colliderect(obs[1]):
-                self.running = False
+        self.last_obstacle_shift = pixel_step(self.obstacle_speed)
+        self.score += self.obstacles.advance(self.last_obstacle_shift)
+
+        if self.hits_obstacle():
+            self.running = False
+
+    def hits_obstacle(self) -> bool:
+        cat_rect = self.cat_rect
+        cat_rect.y = int(self.cat_y)
+        for kind, rect in self.obstacles.overlapping(cat_rect.left, cat_rect.right):
+            if not cat_rect.colliderect(rect):
+                continue
+            if not self.pixel_collision:
+                return True
+            offset = (rect.x - cat_rect.x, rect.y - cat_rect.y)
+            if self.cat_mask.overlap(self.obstacle_masks[kind], offset):
+                return True
+        return False
 
     def draw(self):
-        self.screen.blit(self.bg, (self.bg_x1, 0))
-        self.screen.blit(self.bg, (self.bg_x2, 0))
+        # 마지막 스텝 이후 흐른 비율만큼 직전 위치에서 현재 위치로 보간
+        back = 1.0 - self.accumulator / STEP_MS
+        # 두 장은 늘 WIDTH만큼 떨어져 있으므로 WIDTH로 나눈 나머지 자리에 이어 붙인다.
+        # bg_x를 WIDTH로 되감은 스텝에서도 보간 위치가 화면 밖으로 튀지 않는다.
+        bg_x = (self.bg_x1 + self.bg_speed * back) % WIDTH
+        self.screen.blit(self.bg, (bg_x - WIDTH, 0))
+        self.screen.blit(self.bg, (bg_x, 0))
 
-        self.screen.blit(self.cat_img, (self.cat_x, self.cat_y))
+        cat_y = self.cat_y + (self.prev_cat_y - self.cat_y) * back
+        self.screen.blit(self.cat_img, (self.cat_x, cat_y))
 
-        for obs in self.obstacles:
-            self.screen.blit(obs[0], obs[1])
+        shift = self.last_obstacle_shift * back
+        for kind, rect in self.obstacles.overlapping(-shift, WIDTH):
+            self.screen.blit(self.obstacle_imgs[kind], (rect.x + shift, rect.y))
 
         distance_text = self.font.render(f"{int(self.distance)}m", True, (0, 0, 0))
         self.screen.blit(distance_text, (10, 10))
@@ -186,13 +296,13 @@ class CatRunGame:
         speed_text = self.font.render(f"Speed: {self.obstacle_speed:.1f}", True, (0, 0, 0))
         self.screen.blit(speed_text, (10, 30))
 
-        pygame.display.flip()
+        self.driver.flip()
 
     def run(self):
         while self.running:
-            self.clock.tick(FPS)
+            dt = self.driver.tick(FPS)
             self.handle_events()
-            self.update()
+            self.advance(dt)
             self.draw()
 
         return self.get_reward()
@@ -203,7 +313,7 @@ class CatRunGame:
         return {"distance": distance_int, "coins": coin_reward}
 
     def _compute_next_spawn_frames(self):
-        meters = random.randint(self.min_spawn_meters, self.max_spawn_meters)
+        meters = self.rng.randint(self.min_spawn_meters, self.max_spawn_meters)
         speed = max(0.1, self.obstacle_speed)
         frames = int((meters * self.pixels_per_meter) / speed)
         return max(10, min(int(getattr(self, "spawn_delay", frames)), frames))
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import time
+
+import pygame
+
+
+RECORDED_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
+
+def encode_event(event) -> list | None:
+    if event.type == pygame.QUIT:
+        return ["q"]
+    if event.type == pygame.KEYDOWN:
+        return ["k", int(event.key)]
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        x, y = event.pos
+        return ["m", int(x), int(y), int(getattr(event, "button", 1))]
+    return None
+
+
+def decode_event(data):
+    kind = data[0]
+    if kind == "q":
+        return pygame.event.Event(pygame.QUIT)
+    if kind == "k":
+        return pygame.event.Event(pygame.KEYDOWN, key=int(data[1]), mod=0, unicode="")
+    if kind == "m":
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(int(data[1]), int(data[2])), button=int(data[3]))
+    return None
+
+
+class LiveDriver:
+    def __init__(self):
+        self.clock = pygame.time.Clock()
+        self.frame = 0
+        self.elapsed_ms = 0
+
+    def tick(self, fps: int) -> int:
+        ms = self.clock.tick(fps)
+        self.frame += 1
+        self.elapsed_ms += ms
+        return ms
+
+    def get_events(self) -> list:
+        return pygame.event.get()
+
+    def get_ticks(self) -> int:
+        return self.elapsed_ms
+
+    def flip(self):
+        pygame.display.flip()
+
+
+class RecordingDriver(LiveDriver):
+    def __init__(self):
+        super().__init__()
+        self.dts = []
+        self.events = []
+
+    def tick(self, fps: int) -> int:
+        ms = super().tick(fps)
+        self.dts.append(ms)
+        return ms
+
+    def get_events(self) -> list:
+        events = super().get_events()
+        for event in events:
+            if event.type in RECORDED_EVENT_TYPES:
+                encoded = encode_event(event)
+                if encoded is not None:
+                    self.events.append([self.frame, *encoded])
+        return events
+
+
+class ReplayDriver:
+    def __init__(self, dts, events, *, present: bool = True):
+        self.dts = list(dts)
+        self.frame = 0
+        self.elapsed_ms = 0
+        self.present = present
+        self.overrun = False
+        self._events = {}
+        for item in events:
+            self._events.setdefault(int(item[0]), []).append(item[1:])
+
+        self.frame_times = []
+        self.flip_times = []
+        self._frame_started = None
+
+    def tick(self, fps: int) -> int:
+        now = time.perf_counter()
+        if self._frame_started is not None:
+            self.frame_times.append(now - self._frame_started)
+        if self.frame < len(self.dts):
+            ms = int(self.dts[self.frame])
+        else:
+            ms = int(round(1000 / max(1, fps)))
+            self.overrun = True
+        self.frame += 1
+        self.elapsed_ms += ms
+        self._frame_started = time.perf_counter()
+        return ms
+
+    def get_events(self) -> list:
+        if self.frame > len(self.dts):
+            return [pygame.event.Event(pygame.QUIT)]
+        events = [decode_event(data) for data in self._events.get(self.frame, ())]
+        return [event for event in events if event is not None]
+
+    def get_ticks(self) -> int:
+        return self.elapsed_ms
+
+    def finish(self):
+        if self._frame_started is not None:
+            self.frame_times.append(time.perf_counter() - self._frame_started)
+            self._frame_started = None
+
+    def flip(self):
+        if not self.present:
+            return
+        started = time.perf_counter()
+        pygame.display.flip()
+        self.flip_times.append(time.perf_counter() - started)
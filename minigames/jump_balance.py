@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from types import SimpleNamespace
+
+import state as game_state
+from minigames.cat_run import CAT_SIZE, FPS, GROUND_Y, WIDTH, CatRunGame
+
+
+DEFAULT_RUNS = 200
+DEFAULT_MAX_SECONDS = 600
+DEFAULT_LEAD_STEPS = 7
+
+
+def lead_bot(lead_steps: int = DEFAULT_LEAD_STEPS):
+    # 가장 가까운 장애물까지 lead_steps 스텝 안에 닿으면 땅에서 점프
+    def bot(game: CatRunGame):
+        if not game.on_ground:
+            return
+        cat_right = game.cat_x + CAT_SIZE[0]
+        reach = game.obstacle_speed * lead_steps
+        for _, rect in game.obstacles:
+            gap = rect.left - cat_right
+            if gap >= 0:
+                if gap <= reach:
+                    game.jump()
+                return
+
+    return bot
+
+
+def bench_obstacles(counts=(10, 100, 1000, 5000), steps: int = 2000, spacing: int = 90) -> list[dict]:
+    # 살아 있는 장애물 수만 바꿔 가며 스텝당 비용을 잰다. 충돌로 끝나도 계속 돌린다.
+    rows = []
+    for count in counts:
+        game = CatRunGame(None, SimpleNamespace(difficulty=game_state.DIFFICULTY_NORMAL), rng=random.Random(0))
+        game.next_spawn_frames = float("inf")
+        for index in range(count):
+            game.obstacles.spawn(0, (25, 25), (WIDTH + 40 + index * spacing, GROUND_Y + 48))
+        started = time.perf_counter()
+        for _ in range(steps):
+            game.update()
+        elapsed = time.perf_counter() - started
+        rows.append({"obstacles": count, "live_after": len(game.obstacles), "step_us": elapsed / steps * 1e6})
+    return rows
+
+
+def play_headless(difficulty: str, *, seed: int, bot=None, max_seconds: float = DEFAULT_MAX_SECONDS) -> dict:
+    game = CatRunGame(None, SimpleNamespace(difficulty=difficulty), rng=random.Random(seed))
+    bot = bot or lead_bot()
+    max_steps = int(max_seconds * FPS)
+    while game.running and game.steps < max_steps:
+        bot(game)
+        game.step()
+    return {**game.get_reward(), "seconds": game.steps / FPS, "score": game.score}
+
+
+def run_balance(difficulty: str, runs: int, *, seed: int = 0, lead_steps: int = DEFAULT_LEAD_STEPS, max_seconds: float = DEFAULT_MAX_SECONDS) -> dict:
+    bot = lead_bot(lead_steps)
+    results = [
+        play_headless(difficulty, seed=seed * 1_000_003 + index, bot=bot, max_seconds=max_seconds)
+        for index in range(max(0, int(runs)))
+    ]
+    if not results:
+        return {"runs": 0}
+    distances = sorted(result["distance"] for result in results)
+    return {
+        "runs": len(results),
+        "seconds": sum(result["seconds"] for result in results),
+        "distance_mean": statistics.fmean(distances),
+        "distance_p50": distances[len(distances) // 2],
+        "distance_p90": distances[min(len(distances) - 1, int(len(distances) * 0.9))],
+        "coins_mean": statistics.fmean(result["coins"] for result in results),
+        "timeouts": sum(1 for result in results if result["seconds"] >= max_seconds),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="점프 미니게임 헤드리스 밸런스 측정")
+    parser.add_argument("--difficulty", default="", help="쉼표로 구분, 비우면 전체")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--lead-steps", type=int, default=DEFAULT_LEAD_STEPS)
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS)
+    parser.add_argument("--bench", action="store_true", help="장애물 수별 스텝 비용 측정")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        for row in bench_obstacles():
+            print(f"{row['obstacles']:>6} obstacles: {row['step_us']:.2f}us/step ({row['live_after']} live after)")
+        return
+
+    difficulties = [d for d in args.difficulty.split(",") if d] or list(game_state.DIFFICULTY_PROFILE)
+    for difficulty in difficulties:
+        started = time.perf_counter()
+        summary = run_balance(
+            difficulty,
+            args.runs,
+            seed=args.seed,
+            lead_steps=args.lead_steps,
+            max_seconds=args.max_seconds,
+        )
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        if not summary["runs"]:
+            continue
+        print(
+            f"{difficulty}: {summary['runs']} runs, distance mean {summary['distance_mean']:.0f}m "
+            f"p50 {summary['distance_p50']}m p90 {summary['distance_p90']}m, "
+            f"coins {summary['coins_mean']:.1f}, timeouts {summary['timeouts']} "
+            f"({summary['seconds'] / elapsed:.0f} sim s/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 import random
 import math
+from functools import lru_cache
+
 import pygame
 
 import state as game_state
+from minigames.driver import LiveDriver
+from particles import ParticleSystem
 
 
 def _get_font(size: int) -> pygame.font.Font:
@@ -43,47 +47,101 @@ def _laser_settings(difficulty: str | None = "normal") -> dict:
         "max_speed": float(profile["max_speed"]),
         "combo_grace": float(profile["combo_grace"]),
         "miss_penalty": int(profile["miss_penalty"]),
+        "multi_targets": max(1, int(profile.get("multi_targets", 4))),
+        "multi_max_targets": max(1, int(profile.get("multi_max_targets", 8))),
+        "multi_spawn_every": max(1, int(profile.get("multi_spawn_every", 5))),
+        "multi_target_score": int(profile.get("multi_target_score", profile["target_score"])),
+        "multi_speed_spread": min(0.9, max(0.0, float(profile.get("multi_speed_spread", 0.0)))),
+        "multi_radius_spread": min(0.9, max(0.0, float(profile.get("multi_radius_spread", 0.0)))),
     }
 
 
-def _spawn_hit_particles(particles, px, py, n=10):
-    for _ in range(n):
-        angle = random.uniform(0, math.tau)
-        speed = random.uniform(140.0, 360.0)
-        particles.append([
-            px,
-            py,
-            math.cos(angle) * speed,
-            math.sin(angle) * speed,
-            random.uniform(0.25, 0.45),
-        ])
-
-
-def _update_particles(particles, dt: float):
-    for particle in particles:
-        particle[0] += particle[2] * dt
-        particle[1] += particle[3] * dt
-        particle[4] -= dt
-    particles[:] = [particle for particle in particles if particle[4] > 0]
-
-
-def _draw_hud(screen, font, score, target_score, time_left, best_combo):
+PARTICLE_FADE = 0.45
+
+
+def _spawn_hit_particles(particles: ParticleSystem, px, py, n=10, rng=random):
+    particles.burst(px, py, n, rng, speed=(140.0, 360.0), life=(0.25, PARTICLE_FADE), fade=PARTICLE_FADE)
+
+
+class LaserTargets:
+    # 레이저마다 위치·속도·반지름을 병렬 리스트에 두고, 이동·벽 반사·클릭 판정을
+    # 리스트 컴프리헨션 한 번씩으로 전체에 적용한다. 단일 모드는 길이 1로 같은 경로를 탄다.
+    def __init__(self):
+        self.x: list[float] = []
+        self.y: list[float] = []
+        self.vx: list[float] = []
+        self.vy: list[float] = []
+        self.radius: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def spawn(self, rng, width, height, speed: float, radius: int):
+        x = rng.uniform(width * 0.25, width * 0.75)
+        y = rng.uniform(height * 0.30, height * 0.70)
+        angle = rng.uniform(0, math.tau)
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(math.cos(angle) * speed)
+        self.vy.append(math.sin(angle) * speed)
+        self.radius.append(int(radius))
+
+    def step(self, dt: float, width, height):
+        radius = self.radius
+        xs = [x + vx * dt for x, vx in zip(self.x, self.vx)]
+        ys = [y + vy * dt for y, vy in zip(self.y, self.vy)]
+        self.vx = [abs(v) if x - r < 0 else (-abs(v) if x + r > width else v) for x, v, r in zip(xs, self.vx, radius)]
+        self.x = [r if x - r < 0 else (width - r if x + r > width else x) for x, r in zip(xs, radius)]
+        self.vy = [abs(v) if y - r < 0 else (-abs(v) if y + r > height else v) for y, v, r in zip(ys, self.vy, radius)]
+        self.y = [r if y - r < 0 else (height - r if y + r > height else y) for y, r in zip(ys, radius)]
+
+    def hit_test(self, mx, my) -> int:
+        # 겹친 레이저가 여럿이면 반지름 대비 가장 중심에 가까운 것을 맞힌 것으로 본다.
+        hits = [
+            (d2 / max(1, r * r), i)
+            for i, (x, y, r) in enumerate(zip(self.x, self.y, self.radius))
+            if (d2 := (mx - x) * (mx - x) + (my - y) * (my - y)) <= r * r
+        ]
+        return min(hits)[1] if hits else -1
+
+    def boost(self, index: int, rng, max_speed: float, min_radius: int, shrink: bool):
+        vx = self.vx[index]
+        vy = self.vy[index]
+        speed = min(max_speed, math.hypot(vx, vy) + 35.0)
+        if shrink:
+            self.radius[index] = max(min_radius, self.radius[index] - 1)
+
+        jitter = rng.uniform(-0.25, 0.25)
+        ang = math.atan2(vy, vx) + jitter
+        self.vx[index] = math.cos(ang) * speed
+        self.vy[index] = math.sin(ang) * speed
+
+    def draw(self, screen):
+        screen.blits(
+            [(_target_sprite(r), (int(x) - r, int(y) - r)) for x, y, r in zip(self.x, self.y, self.radius)],
+            doreturn=False,
+        )
+
+
+def _draw_hud(screen, font, score, target_score, time_left, best_combo, targets=1):
     hud1 = font.render(f"SCORE {score}/{target_score}", True, (230, 230, 230))
-    hud2 = font.render(f"TIME {time_left:0.1f}s   COMBO x{best_combo}", True, (230, 230, 230))
+    text = f"TIME {time_left:0.1f}s   COMBO x{best_combo}"
+    if targets > 1:
+        text += f"   LASER {targets}"
+    hud2 = font.render(text, True, (230, 230, 230))
     screen.blit(hud1, (16, 12))
     screen.blit(hud2, (16, 12 + hud1.get_height() + 4))
 
 
-def _draw_particles(screen, particles):
-    for px, py, _, __, life in particles:
-        alpha = max(0, min(255, int(255 * (life / 0.45))))
-        pygame.draw.circle(screen, (255, 220, 220, alpha), (int(px), int(py)), 3)
-
-
-def _draw_target(screen, x, y, radius):
-    pygame.draw.circle(screen, (255, 60, 60), (int(x), int(y)), int(radius))
-    pygame.draw.circle(screen, (0, 0, 0), (int(x), int(y)), int(radius), 2)
-    pygame.draw.circle(screen, (255, 200, 200), (int(x), int(y)), max(3, int(radius * 0.22)))
+@lru_cache(maxsize=128)
+def _target_sprite(radius: int) -> pygame.Surface:
+    radius = int(radius)
+    surf = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+    center = (radius, radius)
+    pygame.draw.circle(surf, (255, 60, 60), center, radius)
+    pygame.draw.circle(surf, (0, 0, 0), center, radius, 2)
+    pygame.draw.circle(surf, (255, 200, 200), center, max(3, int(radius * 0.22)))
+    return surf
 
 
 def _draw_toast(screen, font, text, screen_h):
@@ -111,18 +169,25 @@ def _draw_result(screen, fonts, screen_w, screen_h, won, score):
     screen.blit(hint, hint.get_rect(center=(screen_w // 2, int(screen_h * 0.66))))
 
 
-def run_laser_chase(screen: pygame.Surface, ach=None, difficulty: str | None = "normal") -> dict:
+def run_laser_chase(
+    screen: pygame.Surface,
+    ach=None,
+    difficulty: str | None = "normal",
+    rng=None,
+    driver=None,
+    multi: bool = False,
+) -> dict:
     if not pygame.font.get_init():
         pygame.font.init()
 
-    clock = pygame.time.Clock()
+    driver = driver or LiveDriver()
     W, H = screen.get_size()
     fonts = _get_laser_fonts(H)
     settings = _laser_settings(difficulty)
 
     TIME_LIMIT = settings["time_limit"]
 
-    TARGET_SCORE = settings["target_score"]
+    TARGET_SCORE = settings["multi_target_score"] if multi else settings["target_score"]
 
     BASE_RADIUS = settings["base_radius"]
     MIN_RADIUS = settings["min_radius"]
@@ -134,18 +199,32 @@ def run_laser_chase(screen: pygame.Surface, ach=None, difficulty: str | None = "
 
     MISS_PENALTY = settings["miss_penalty"]
 
-    x = random.uniform(W * 0.25, W * 0.75)
-    y = random.uniform(H * 0.30, H * 0.70)
+    # 여러 개 모드: 명중 SPAWN_EVERY번마다 하나씩 늘어나 MAX_TARGETS에서 멈춘다.
+    START_TARGETS = settings["multi_targets"] if multi else 1
+    MAX_TARGETS = max(START_TARGETS, settings["multi_max_targets"]) if multi else 1
+    SPAWN_EVERY = settings["multi_spawn_every"]
+    SPEED_SPREAD = settings["multi_speed_spread"] if multi else 0.0
+    RADIUS_SPREAD = settings["multi_radius_spread"] if multi else 0.0
+
+    rng = rng or random
+    targets = LaserTargets()
 
-    angle = random.uniform(0, math.tau)
-    vx = math.cos(angle) * BASE_SPEED
-    vy = math.sin(angle) * BASE_SPEED
+    def spawn_target():
+        speed = BASE_SPEED
+        radius = BASE_RADIUS
+        if SPEED_SPREAD:
+            speed *= rng.uniform(1.0 - SPEED_SPREAD, 1.0 + SPEED_SPREAD)
+        if RADIUS_SPREAD:
+            radius = max(MIN_RADIUS, round(BASE_RADIUS * rng.uniform(1.0 - RADIUS_SPREAD, 1.0 + RADIUS_SPREAD)))
+        targets.spawn(rng, W, H, speed, radius)
 
-    radius = BASE_RADIUS
+    for _ in range(START_TARGETS):
+        spawn_target()
 
     score = 0
     combo = 0
     best_combo = 0
+    hit_count = 0
     time_left = TIME_LIMIT
 
     combo_timer = 0.0
@@ -156,15 +235,15 @@ def run_laser_chase(screen: pygame.Surface, ach=None, difficulty: str | None = "
     phase = "PLAY"
     won = False
 
-    particles = []
+    particles = ParticleSystem(color=(255, 220, 220), radius=3)
 
     running = True
     while running:
-        dt = clock.tick(60) / 1000.0
+        dt = driver.tick(60) / 1000.0
         W, H = screen.get_size()
         fonts = _get_laser_fonts(H)
 
-        for event in pygame.event.get():
+        for event in driver.get_events():
             if event.type == pygame.QUIT:
                 return {"won": False, "score": score, "coins": 0}
 
@@ -180,11 +259,9 @@ def run_laser_chase(screen: pygame.Surface, ach=None, difficulty: str | None = "
             if phase == "PLAY":
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     mx, my = event.pos
-                    dx = mx - x
-                    dy = my - y
-                    hit = (dx * dx + dy * dy) <= (radius * radius)
+                    index = targets.hit_test(mx, my)
 
-                    if hit:
+                    if index >= 0:
                         if combo_timer > 0:
                             combo += 1
                         else:
@@ -192,6 +269,11 @@ def run_laser_chase(screen: pygame.Surface, ach=None, difficulty: str | None = "
                         best_combo = max(best_combo, combo)
                         combo_timer = COMBO_GRACE
 
+                        x = targets.x[index]
+                        y = targets.y[index]
+                        radius = targets.radius[index]
+                        dx = mx - x
+                        dy = my - y
                         dist = math.sqrt(dx * dx + dy * dy)
                         accuracy = max(0.0, 1.0 - (dist / max(1.0, radius)))
                         gained = 34 + int(combo * 5) + int(accuracy * 16)
@@ -200,17 +282,13 @@ def run_laser_chase(screen: pygame.Surface, ach=None, difficulty: str | None = "
                         toast_text = f"+{gained}  (콤보 x{combo})"
                         toast_timer = 0.8
 
-                        _spawn_hit_particles(particles, x, y, n=12)
+                        _spawn_hit_particles(particles, x, y, n=12, rng=rng)
 
-                        speed = math.hypot(vx, vy)
-                        speed = min(MAX_SPEED, speed + 35.0)
-                        if combo >= 2:
-                            radius = max(MIN_RADIUS, radius - 1)
+                        targets.boost(index, rng, MAX_SPEED, MIN_RADIUS, combo >= 2)
 
-                        jitter = random.uniform(-0.25, 0.25)
-                        ang = math.atan2(vy, vx) + jitter
-                        vx = math.cos(ang) * speed
-                        vy = math.sin(ang) * speed
+                        hit_count += 1
+                        if len(targets) < MAX_TARGETS and hit_count % SPAWN_EVERY == 0:
+                            spawn_target()
 
                     else:
                         if MISS_PENALTY > 0:
@@ -233,22 +311,7 @@ def run_laser_chase(screen: pygame.Surface, ach=None, difficulty: str | None = "
                     combo_timer = 0
                     combo = 0
 
-            x += vx * dt
-            y += vy * dt
-
-            if x - radius < 0:
-                x = radius
-                vx = abs(vx)
-            elif x + radius > W:
-                x = W - radius
-                vx = -abs(vx)
-
-            if y - radius < 0:
-                y = radius
-                vy = abs(vy)
-            elif y + radius > H:
-                y = H - radius
-                vy = -abs(vy)
+            targets.step(dt, W, H)
 
             if toast_timer > 0:
                 toast_timer -= dt
@@ -256,19 +319,19 @@ def run_laser_chase(screen: pygame.Surface, ach=None, difficulty: str | None = "
                     toast_timer = 0
                     toast_text = ""
 
-            _update_particles(particles, dt)
+            particles.update(dt)
 
         screen.fill((18, 18, 22))
-        _draw_hud(screen, fonts["hud"], score, TARGET_SCORE, time_left, best_combo)
-        _draw_particles(screen, particles)
-        _draw_target(screen, x, y, radius)
+        _draw_hud(screen, fonts["hud"], score, TARGET_SCORE, time_left, best_combo, len(targets))
+        particles.draw(screen)
+        targets.draw(screen)
         if toast_timer > 0 and toast_text:
             _draw_toast(screen, fonts["hud"], toast_text, H)
 
         if phase == "RESULT":
             _draw_result(screen, fonts, W, H, won, score)
 
-        pygame.display.flip()
+        driver.flip()
 
     coins = _coins_from_score(score, won)
     return {"won": won, "score": score, "coins": coins}
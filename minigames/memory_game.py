@@ -4,6 +4,7 @@ import random
 from config import asset_path
 from pg_utils import load_font, load_image, solid_surface
 import state as game_state
+from minigames.driver import LiveDriver
 
 WIDTH = 400
 HEIGHT = 600
@@ -11,15 +12,15 @@ HEIGHT = 600
 GRID_COLS = 4
 GRID_ROWS = 4
 FONT_PATH = asset_path("fonts", "ThinDungGeunMo.ttf")
-MISMATCH_EVENT = pygame.USEREVENT + 1
 
 class MemoryGame:
-    def __init__(self, screen, state):
+    def __init__(self, screen, state, rng=None, driver=None):
         self.screen = screen
         self.state = state
+        self.rng = rng or random
+        self.driver = driver or LiveDriver()
         self.difficulty = game_state.normalize_difficulty(getattr(state, "difficulty", None))
         self.balance = game_state.get_minigame_profile(self.difficulty, "memory")
-        self.clock = pygame.time.Clock()
         self.running = True
 
         self.font = load_font(FONT_PATH, 22)
@@ -30,6 +31,7 @@ class MemoryGame:
         self.second = None
         self.lock = False
         self.fail_count = 0
+        self.mismatch_end_ms = None
 
         self.board_margin_x = 20
         self.board_top = 140
@@ -67,7 +69,7 @@ class MemoryGame:
 
     def load_cards(self):
         all_ids = list(range(1, 17))
-        chosen = random.sample(all_ids, 8)
+        chosen = self.rng.sample(all_ids, 8)
 
         colors = [
             (255, 100, 100), (100, 255, 100), (100, 100, 255), (255, 255, 100),
@@ -84,7 +86,7 @@ class MemoryGame:
             ) or solid_surface((self.card_size, self.card_size), colors[idx % len(colors)])
 
         ids = chosen * 2
-        random.shuffle(ids)
+        self.rng.shuffle(ids)
 
         self.cards.clear()
         for i, cid in enumerate(ids):
@@ -99,7 +101,7 @@ class MemoryGame:
                 "matched": False
             })
 
-        now = pygame.time.get_ticks()
+        now = self.driver.get_ticks()
         self.reveal_end_ms = now + self.preview_ms
 
     def handle_click(self, pos):
@@ -130,13 +132,7 @@ class MemoryGame:
         else:
             self.lock = True
             self.fail_count += 1
-            self._set_mismatch_timer(getattr(self, "mismatch_ms", 700))
-
-    def _set_mismatch_timer(self, milliseconds: int):
-        try:
-            pygame.time.set_timer(MISMATCH_EVENT, milliseconds)
-        except pygame.error:
-            pass
+            self.mismatch_end_ms = self.driver.get_ticks() + getattr(self, "mismatch_ms", 700)
 
     def handle_mismatch_timeout(self):
         if self.first is not None and self.second is not None:
@@ -145,10 +141,13 @@ class MemoryGame:
         self.first = None
         self.second = None
         self.lock = False
-        self._set_mismatch_timer(0)
+        self.mismatch_end_ms = None
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = self.driver.get_ticks()
+        if self.mismatch_end_ms is not None and now >= self.mismatch_end_ms:
+            self.handle_mismatch_timeout()
+
         if not self.started and self.reveal_end_ms and now >= self.reveal_end_ms:
             for c in self.cards:
                 if not c["matched"]:
@@ -183,7 +182,7 @@ class MemoryGame:
         self.screen.blit(info, (20, 60))
 
         if self.started and self.limit_start_ms:
-            now = pygame.time.get_ticks()
+            now = self.driver.get_ticks()
             remain_ms = max(0, self.time_limit_ms - (now - self.limit_start_ms))
             remain_s = round(remain_ms / 1000, 1)
             t = self.small_font.render(f"남은 시간: {remain_s}초", True, (120, 80, 80))
@@ -195,13 +194,13 @@ class MemoryGame:
             else:
                 self.screen.blit(self.back_image, (card["rect"].x, card["rect"].y))
 
-        pygame.display.flip()
+        self.driver.flip()
 
     def run(self):
         while self.running:
-            self.clock.tick(60)
+            self.driver.tick(60)
 
-            for event in pygame.event.get():
+            for event in self.driver.get_events():
                 if event.type == pygame.QUIT:
                     self.running = False
 
@@ -211,9 +210,6 @@ class MemoryGame:
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     self.handle_click(event.pos)
 
-                elif event.type == MISMATCH_EVENT:
-                    self.handle_mismatch_timeout()
-
             self.update()
             self.draw()
 
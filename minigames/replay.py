@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import time
+import zlib
+from pathlib import Path
+from types import SimpleNamespace
+
+import pygame
+
+import state as game_state
+from minigames.cat_follow import CatFollowGame
+from minigames.cat_run import CatRunGame
+from minigames.driver import LiveDriver, RecordingDriver, ReplayDriver
+from minigames.laser_chase import run_laser_chase
+from minigames.memory_game import MemoryGame
+
+
+REPLAY_VERSION = 4
+REPLAY_FPS = 60
+REPLAY_SUFFIX = ".replay"
+REPLAY_DIR = Path(os.getenv("APPDATA") or str(Path.home())) / "growing-cat" / "replays"
+RECORD_ENV = "GROWING_CAT_RECORD_REPLAYS"
+
+MINIGAME_IDS = ("jump", "memory", "footsteps", "laser", "laser_multi")
+
+
+def recording_enabled() -> bool:
+    return os.getenv(RECORD_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def play(minigame_id: str, screen, state, *, seed: int | None = None, driver=None):
+    if seed is None:
+        seed = random.getrandbits(64)
+    rng = random.Random(seed)
+    driver = driver or LiveDriver()
+    if minigame_id == "jump":
+        return CatRunGame(screen, state, rng=rng, driver=driver).run()
+    if minigame_id == "memory":
+        return MemoryGame(screen, state, rng=rng, driver=driver).run()
+    if minigame_id == "footsteps":
+        return CatFollowGame(screen, state, rng=rng, driver=driver).run()
+    if minigame_id in ("laser", "laser_multi"):
+        difficulty = getattr(state, "difficulty", "normal")
+        return run_laser_chase(screen, difficulty=difficulty, rng=rng, driver=driver, multi=minigame_id == "laser_multi")
+    return None
+
+
+def play_and_record(minigame_id: str, screen, state, *, seed: int, directory: str | os.PathLike | None = None):
+    driver = RecordingDriver()
+    result = play(minigame_id, screen, state, seed=seed, driver=driver)
+    data = {
+        "version": REPLAY_VERSION,
+        "game": minigame_id,
+        "seed": int(seed),
+        "difficulty": game_state.normalize_difficulty(getattr(state, "difficulty", None)),
+        "size": list(screen.get_size()),
+        "dt": driver.dts,
+        "events": driver.events,
+        "result": result if isinstance(result, dict) else None,
+    }
+    folder = Path(directory) if directory is not None else REPLAY_DIR
+    name = f"{minigame_id}_{time.strftime('%Y%m%d_%H%M%S')}_{int(seed) % 100000:05d}{REPLAY_SUFFIX}"
+    try:
+        write_replay(folder / name, data)
+    except OSError:
+        pass
+    return result
+
+
+def write_replay(path: str | os.PathLike, data: dict):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    path.write_bytes(zlib.compress(payload, 9))
+
+
+def read_replay(path: str | os.PathLike) -> dict:
+    data = json.loads(zlib.decompress(Path(path).read_bytes()).decode("utf-8"))
+    if not isinstance(data, dict) or data.get("version") != REPLAY_VERSION:
+        raise ValueError("지원하지 않는 리플레이 파일입니다.")
+    if data.get("game") not in MINIGAME_IDS:
+        raise ValueError("알 수 없는 미니게임입니다.")
+    return data
+
+
+def _percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def timing_stats(samples) -> dict:
+    values = sorted(samples)
+    if not values:
+        return {"count": 0, "total_ms": 0.0, "mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    total = sum(values)
+    return {
+        "count": len(values),
+        "total_ms": total * 1000,
+        "mean_ms": total / len(values) * 1000,
+        "p50_ms": _percentile(values, 0.50) * 1000,
+        "p95_ms": _percentile(values, 0.95) * 1000,
+        "p99_ms": _percentile(values, 0.99) * 1000,
+        "max_ms": values[-1] * 1000,
+    }
+
+
+def replay(data: dict, screen=None, *, present: bool = True) -> dict:
+    if screen is None:
+        screen = pygame.display.get_surface()
+    if screen is None or tuple(screen.get_size()) != tuple(data["size"]):
+        screen = pygame.display.set_mode(tuple(data["size"]))
+
+    driver = ReplayDriver(data["dt"], data["events"], present=present)
+    state = SimpleNamespace(difficulty=data["difficulty"])
+    started = time.perf_counter()
+    result = play(data["game"], screen, state, seed=data["seed"], driver=driver)
+    driver.finish()
+    elapsed = time.perf_counter() - started
+
+    expected = data.get("result")
+    return {
+        "game": data["game"],
+        "result": result,
+        "expected": expected,
+        "match": expected is None or result == expected,
+        "overrun": driver.overrun,
+        "frames": driver.frame,
+        "recorded_frames": len(data["dt"]),
+        "recorded_seconds": sum(data["dt"]) / 1000,
+        "elapsed": elapsed,
+        "frame": timing_stats(driver.frame_times),
+        "flip": timing_stats(driver.flip_times),
+    }
+
+
+def _print_report(path, report: dict):
+    print(f"{path}: {report['game']} {report['frames']}/{report['recorded_frames']} frames")
+    print(
+        f"  {report['recorded_seconds']:.1f}s recorded -> {report['elapsed']:.2f}s replayed "
+        f"(x{report['recorded_seconds'] / max(report['elapsed'], 1e-9):.1f})"
+    )
+    for key in ("frame", "flip"):
+        stats = report[key]
+        print(
+            f"  {key}: mean {stats['mean_ms']:.3f}ms p50 {stats['p50_ms']:.3f} "
+            f"p95 {stats['p95_ms']:.3f} p99 {stats['p99_ms']:.3f} max {stats['max_ms']:.3f}"
+        )
+    status = "OK" if report["match"] and not report["overrun"] else "MISMATCH"
+    print(f"  result {status}: {report['result']} (recorded {report['expected']})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="미니게임 리플레이 재생")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--no-present", action="store_true")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+    reports = []
+    failed = False
+    for path in args.paths:
+        data = read_replay(path)
+        for _ in range(max(1, args.repeat)):
+            report = replay(data, present=not args.no_present)
+            failed = failed or not report["match"] or report["overrun"]
+            reports.append({"path": str(path), **report})
+            if not args.json:
+                _print_report(path, report)
+
+    if args.json:
+        print(json.dumps(reports, ensure_ascii=False, indent=2))
+    pygame.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import math
+import random
+from functools import lru_cache
+
+import pygame
+
+
+DEFAULT_CAPACITY = 16384
+ALPHA_STEPS = 16
+COMPACT_INTERVAL = 0.1
+
+
+@lru_cache(maxsize=64)
+def particle_sprites(color: tuple[int, int, int], radius: int, steps: int = ALPHA_STEPS) -> tuple:
+    # 투명도 단계별 원 스프라이트. 0번이 가장 흐리다.
+    size = radius * 2
+    sprites = []
+    for step in range(steps):
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        alpha = int(255 * (step + 1) / steps)
+        pygame.draw.circle(surf, (*color[:3], alpha), (radius, radius), radius)
+        sprites.append(surf)
+    return tuple(sprites)
+
+
+class ParticleSystem:
+    # 입자는 용량만큼 미리 잡아 둔 병렬 리스트의 앞부분 [0, count)에 촘촘히 둔다.
+    # 위치는 생성 시점 값과 현재 시각으로 바로 계산하므로 프레임마다 적분하지 않고,
+    # 죽은 입자는 그릴 때 거르다가 COMPACT_INTERVAL마다 한 번에 앞으로 당긴다.
+    # 가득 차면 ring 커서가 가리키는 칸부터 덮어쓴다.
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        *,
+        color=(255, 220, 220),
+        radius: int = 3,
+        gravity: float = 0.0,
+    ):
+        self.capacity = max(1, int(capacity))
+        self.sprites = particle_sprites(tuple(color), int(radius))
+        self.radius = int(radius)
+        self.gravity = float(gravity)
+        self.time = 0.0
+        self.count = 0
+        self._ring = 0
+        self._compact_at = COMPACT_INTERVAL
+
+        empty = [0.0] * self.capacity
+        # x0, y0: 시각 0으로 되돌린 위치(중력 없음 기준), fade_end: 투명도 단계가 0이 되는 값
+        self.x0 = list(empty)
+        self.y0 = list(empty)
+        self.vx = list(empty)
+        self.vy = list(empty)
+        self.born = list(empty)
+        self.fade_end = list(empty)
+        self.fade_rate = list(empty)
+
+    def __len__(self) -> int:
+        now = self.time
+        return sum(1 for end, rate in zip(self.fade_end[: self.count], self.fade_rate) if end > now * rate)
+
+    def _slot(self) -> int:
+        if self.count < self.capacity:
+            self.count += 1
+            return self.count - 1
+        slot = self._ring
+        self._ring = (self._ring + 1) % self.capacity
+        return slot
+
+    def emit(self, x: float, y: float, vx: float, vy: float, life: float, fade: float | None = None):
+        # fade는 완전히 불투명한 상태에서 사라질 때까지의 시간이며 수명보다 짧게 두지 않는다.
+        life = max(1e-6, float(life))
+        fade = life if fade is None else max(life, float(fade))
+        now = self.time
+        i = self._slot()
+        rate = (len(self.sprites) - 1) / fade
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.born[i] = now
+        if self.gravity:
+            self.x0[i] = x
+            self.y0[i] = y
+        else:
+            self.x0[i] = x - vx * now
+            self.y0[i] = y - vy * now
+        self.fade_end[i] = (now + life) * rate
+        self.fade_rate[i] = rate
+
+    def burst(
+        self,
+        x: float,
+        y: float,
+        n: int,
+        rng=None,
+        *,
+        speed=(140.0, 360.0),
+        life=(0.25, 0.45),
+        angle=(0.0, math.tau),
+        fade: float | None = None,
+    ):
+        rng = rng or random
+        for _ in range(int(n)):
+            a = rng.uniform(*angle)
+            s = rng.uniform(*speed)
+            self.emit(x, y, math.cos(a) * s, math.sin(a) * s, rng.uniform(*life), fade)
+
+    def update(self, dt: float):
+        self.time += max(0.0, float(dt))
+        if self.time >= self._compact_at:
+            self.compact()
+
+    def compact(self):
+        n = self.count
+        now = self.time
+        end = self.fade_end
+        rate = self.fade_rate
+        keep = [i for i in range(n) if end[i] > now * rate[i]]
+        if len(keep) != n:
+            k = len(keep)
+            for column in (self.x0, self.y0, self.vx, self.vy, self.born, self.fade_end, self.fade_rate):
+                column[:k] = [column[i] for i in keep]
+            self.count = k
+            self._ring = 0
+        self._compact_at = now + COMPACT_INTERVAL
+
+    def clear(self):
+        self.count = 0
+        self._ring = 0
+
+    def blit_sequence(self, offset=(0, 0)) -> list:
+        n = self.count
+        if not n:
+            return []
+        now = self.time
+        sprites = self.sprites
+        ox = offset[0] - self.radius
+        oy = offset[1] - self.radius
+        if not self.gravity:
+            return [
+                (sprites[int(level)], (x + vx * now + ox, y + vy * now + oy))
+                for x, y, vx, vy, end, rate in zip(
+                    self.x0[:n], self.y0[:n], self.vx[:n], self.vy[:n], self.fade_end[:n], self.fade_rate[:n]
+                )
+                if (level := end - now * rate) > 0
+            ]
+        half_g = 0.5 * self.gravity
+        return [
+            (sprites[int(level)], (x + vx * (now - b) + ox, y + (vy + half_g * (now - b)) * (now - b) + oy))
+            for x, y, vx, vy, b, end, rate in zip(
+                self.x0[:n], self.y0[:n], self.vx[:n], self.vy[:n], self.born[:n], self.fade_end[:n], self.fade_rate[:n]
+            )
+            if (level := end - now * rate) > 0
+        ]
+
+    def draw(self, surface, offset=(0, 0)):
+        sequence = self.blit_sequence(offset)
+        if sequence:
+            surface.blits(sequence, doreturn=False)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import math
+import queue
+import threading
+import zlib
+
+import pygame
+
+
+CLIP_SECONDS = 4.0
+CLIP_FPS = 10
+CLIP_SCALE = 0.5
+CLIP_LEVEL = 1
+LAST_FRAME_MS = 400
+
+
+class FrameRing:
+    # 최근 CLIP_SECONDS초를 CLIP_FPS로 줄여 담는 고정 크기 링 버퍼.
+    # 샘플 시각이 아닌 프레임은 시각 비교 한 번으로 끝나고, 샘플 프레임도 축소와 tobytes만 한다.
+    # zlib 압축은 뒤에서 도는 스레드가 맡아 칸의 원본 바이트를 압축본으로 바꿔 놓는다.
+    def __init__(
+        self,
+        seconds: float = CLIP_SECONDS,
+        fps: int = CLIP_FPS,
+        scale: float = CLIP_SCALE,
+        *,
+        level: int = CLIP_LEVEL,
+    ):
+        self.capacity = max(1, math.ceil(float(seconds) * int(fps)))
+        self.interval_ms = 1000 / max(1, int(fps))
+        self.scale = float(scale)
+        self.level = int(level)
+        self.size = None
+        self._slots: list = [None] * self.capacity
+        self._head = 0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+        self._compress_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = None
+
+    def __len__(self) -> int:
+        return sum(1 for slot in self._slots if slot is not None)
+
+    @property
+    def bytes(self) -> int:
+        return sum(len(slot[1]) for slot in self._slots if slot is not None)
+
+    def clear(self):
+        with self._lock:
+            self._slots = [None] * self.capacity
+            self._head = 0
+
+    def sample(self, surface: pygame.Surface, now_ms: int) -> bool:
+        if now_ms < self._next_at:
+            return False
+        self._next_at = max(self._next_at + self.interval_ms, now_ms)
+
+        width, height = surface.get_size()
+        size = (max(1, int(width * self.scale)), max(1, int(height * self.scale)))
+        if size != self.size:
+            # 창 크기가 바뀌면 크기가 다른 프레임이 섞이지 않게 비운다.
+            self.clear()
+            self.size = size
+        small = pygame.transform.scale(surface, size) if size != (width, height) else surface
+        raw = pygame.image.tobytes(small, "RGB")
+
+        with self._lock:
+            index = self._head
+            slot = [now_ms, raw, False]
+            self._slots[index] = slot
+            self._head = (index + 1) % self.capacity
+        self._compress_queue.put(slot)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._compress_loop, name="clip-compress", daemon=True)
+            self._thread.start()
+        return True
+
+    def _compress_loop(self):
+        while True:
+            slot = self._compress_queue.get()
+            packed = zlib.compress(slot[1], self.level)
+            with self._lock:
+                slot[1] = packed
+                slot[2] = True
+
+    def snapshot(self) -> tuple[tuple[int, int], list[tuple[int, bytes, bool]]]:
+        # 오래된 것부터 (시각, 바이트, 압축 여부). 바이트는 불변이라 복사하지 않는다.
+        with self._lock:
+            order = self._slots[self._head :] + self._slots[: self._head]
+            frames = [tuple(slot) for slot in order if slot is not None]
+        return self.size, frames
+
+
+def iter_clip_frames(frames):
+    # (RGB 바이트, 표시 시간 ms)를 하나씩 풀어서 내준다.
+    for index, (stamp, data, packed) in enumerate(frames):
+        if index + 1 < len(frames):
+            delay = frames[index + 1][0] - stamp
+        else:
+            delay = LAST_FRAME_MS
+        yield (zlib.decompress(data) if packed else data), delay
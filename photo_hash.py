@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import pygame
+
+
+# 가로 HASH_SIZE+1, 세로 HASH_SIZE로 줄여서 이웃 칸을 비교하므로 HASH_SIZE * HASH_SIZE 비트가 된다.
+# 메인 장면은 배경이 고정이라 8x8 정도로는 고양이와 상태 막대가 달라도 거의 같은 값이 나온다.
+HASH_SIZE = 32
+HASH_BITS = HASH_SIZE * HASH_SIZE
+# 밝기(0~255) 차이가 이보다 작으면 평평한 곳으로 보고 0을 둔다. 배경의 거의 같은 이웃 칸이
+# 축소/압축 오차로 뒤집히지 않게 한다.
+FLAT_LEVEL = 8
+# 해밍 거리가 이 값 이하면 거의 같은 사진으로 본다. 연속으로 찍은 같은 화면은 토스트가 겹쳐도
+# 3비트 안쪽이고, 고양이 그림이나 상태만 다른 메인 장면은 10비트 넘게 벌어진다.
+DUPLICATE_DISTANCE = 6
+
+_MASK = (1 << HASH_BITS) - 1
+_HEX_DIGITS = HASH_BITS // 4
+
+
+def dhash(surface: pygame.Surface) -> int:
+    # 흑백으로 줄인 뒤 행마다 왼쪽 칸이 오른쪽보다 FLAT_LEVEL 넘게 밝으면 1인 차이 해시.
+    # 픽셀을 그대로 비교하지 않아 같은 화면을 다시 인코딩하거나 토스트가 조금 겹쳐도 거의 같은 값이 나온다.
+    size = (HASH_SIZE + 1, HASH_SIZE)
+    try:
+        small = pygame.transform.smoothscale(surface, size)
+    except ValueError:
+        # smoothscale은 24/32비트만 받는다.
+        small = pygame.transform.scale(surface, size)
+    rgb = pygame.image.tobytes(small, "RGB")
+    gray = [
+        (rgb[i] * 299 + rgb[i + 1] * 587 + rgb[i + 2] * 114) // 1000
+        for i in range(0, len(rgb), 3)
+    ]
+    value = 0
+    for row in range(HASH_SIZE):
+        base = row * (HASH_SIZE + 1)
+        for col in range(HASH_SIZE):
+            value = (value << 1) | (gray[base + col] > gray[base + col + 1] + FLAT_LEVEL)
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def to_hex(value: int) -> str:
+    return f"{value & _MASK:0{_HEX_DIGITS}x}"
+
+
+def from_hex(text: str | None) -> int | None:
+    # 길이가 다른 값(예전 64비트 해시)은 없는 것으로 보고 파일에서 다시 계산하게 한다.
+    if not text or len(text) != _HEX_DIGITS:
+        return None
+    try:
+        return int(text, 16)
+    except (TypeError, ValueError):
+        return None
+
+
+def _band_masks(bands: int) -> list[tuple[int, int]]:
+    width, extra = divmod(HASH_BITS, bands)
+    masks = []
+    shift = 0
+    for index in range(bands):
+        bits = width + (1 if index < extra else 0)
+        masks.append((shift, (1 << bits) - 1))
+        shift += bits
+    return masks
+
+
+def duplicate_groups(items, max_distance: int = DUPLICATE_DISTANCE, same_shot=None) -> list[list]:
+    # items: (키, 해시) 목록. 앞에서부터 아직 묶이지 않은 키를 대표로 삼고, 대표와 직접
+    # max_distance 이내인 키만 그 묶음에 넣어 두 장 이상인 묶음만 돌려준다. 이웃의 이웃으로
+    # 번져 나가지 않으므로 묶음 안의 모든 장이 대표와 거의 같다. same_shot(대표 키, 키)를 주면
+    # 그것도 참이어야 묶는다. 묶음 안의 키는 items 순서를 따른다.
+    # 해시를 max_distance + 1개 띠로 나누면 거리가 그 이하인 두 해시는 비둘기집 원리로
+    # 적어도 한 띠가 완전히 같다. 그래서 띠마다 값이 같은 것끼리 버킷을 만들고 버킷 안에서만
+    # 거리를 재도 빠짐없이 찾으며, 수만 장이어도 전체 쌍을 비교하지 않는다.
+    keys = []
+    hashes = []
+    for key, value in items:
+        keys.append(key)
+        hashes.append(value & _MASK)
+
+    bands = []
+    for shift, mask in _band_masks(max(1, max_distance + 1)):
+        buckets: dict[int, list[int]] = {}
+        for index, value in enumerate(hashes):
+            buckets.setdefault((value >> shift) & mask, []).append(index)
+        bands.append((shift, mask, buckets))
+
+    owner = [None] * len(keys)
+    groups = []
+    for rep, value in enumerate(hashes):
+        if owner[rep] is not None:
+            continue
+        owner[rep] = rep
+        group = [rep]
+        for shift, mask, buckets in bands:
+            for other in buckets[(value >> shift) & mask]:
+                # 앞쪽 키는 이미 대표이거나 다른 묶음에 들어가 있다.
+                if owner[other] is not None or (value ^ hashes[other]).bit_count() > max_distance:
+                    continue
+                if same_shot is not None and not same_shot(keys[rep], keys[other]):
+                    continue
+                owner[other] = rep
+                group.append(other)
+        if len(group) > 1:
+            groups.append([keys[index] for index in sorted(group)])
+    return groups
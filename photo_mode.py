@@ -1,13 +1,25 @@
 import os
 import datetime
+import queue
+import sqlite3
+import threading
+import zlib
+from functools import lru_cache
 from pathlib import Path
 import pygame
 
-PHOTO_EXTENSIONS = {".png", ".jpg", ".jpeg"}
+import png_writer
+import photo_clip
+import photo_hash
+from album_catalog import PHOTO_EXTENSIONS, AlbumCatalog, meta_text
+
+PHOTO_FORMATS = ("png", "jpg")
+PHOTO_QUEUE_SIZE = 4
 _DATA_DIR = Path(os.getenv("APPDATA") or str(Path.home())) / "growing-cat"
 _ALBUM_DIR = _DATA_DIR / "album"
 
 
+@lru_cache(maxsize=16)
 def _font(size: int) -> pygame.font.Font:
     for name in ("malgungothic", "AppleGothic", "NanumGothic", "Noto Sans CJK KR"):
         f = pygame.font.SysFont(name, size)
@@ -16,14 +28,14 @@ def _font(size: int) -> pygame.font.Font:
     return pygame.font.SysFont(None, size)
 
 
-def _render_fit_text(text: str, color, max_width: int) -> pygame.Surface:
-    for size in range(18, 11, -1):
+def _render_fit_text(text: str, color, max_width: int, scale: int = 1) -> pygame.Surface:
+    for size in range(18 * scale, 11 * scale, -scale):
         font = _font(size)
         label = font.render(text, True, color)
         if label.get_width() <= max_width:
             return label
 
-    font = _font(12)
+    font = _font(12 * scale)
     clipped = str(text)
     while len(clipped) > 3:
         clipped = clipped[:-1]
@@ -42,6 +54,15 @@ def list_photos(folder: str | os.PathLike | None = None) -> list[str]:
     if not target.exists() or not target.is_dir():
         return []
 
+    try:
+        with AlbumCatalog(target) as catalog:
+            catalog.reconcile()
+            return catalog.paths()
+    except (OSError, sqlite3.Error):
+        return _scan_photos(target)
+
+
+def _scan_photos(target: Path) -> list[str]:
     photos = [
         path
         for path in target.iterdir()
@@ -51,18 +72,14 @@ def list_photos(folder: str | os.PathLike | None = None) -> list[str]:
     return [str(path) for path in photos]
 
 
-def take_photo(
-    surface: pygame.Surface,
-    *,
-    player_name: str = "player",
-    day: int | None = None,
-    stage: str | None = None,
-    folder: str | os.PathLike | None = None,
-) -> str:
-    target = Path(folder) if folder is not None else _ALBUM_DIR
-    target.mkdir(parents=True, exist_ok=True)
-
-    now = datetime.datetime.now()
+def _photo_names(
+    player_name: str,
+    day: int | None,
+    stage: str | None,
+    now: datetime.datetime,
+    difficulty: str | None = None,
+) -> tuple[str, str, dict]:
+    # (확장자 없는 파일 이름, 사진 아래에 찍을 라벨, PNG 텍스트 청크로 넣을 메타데이터)
     file_ts = now.strftime("%Y%m%d_%H%M%S_%f")[:-3]
     label_ts = now.strftime("%Y-%m-%d %H:%M:%S")
     safe_name = "".join(ch for ch in player_name if ch.isalnum() or ch in ("_", "-")) or "player"
@@ -71,10 +88,6 @@ def take_photo(
     if day is not None:
         parts.append(f"day{day}")
     parts.append(file_ts)
-    filename = "_".join(parts) + ".png"
-    path = target / filename
-
-    shot = surface.copy()
 
     text_parts = [safe_name]
     if day is not None:
@@ -82,16 +95,228 @@ def take_photo(
     if stage:
         text_parts.append(f"Stage {stage}")
     text_parts.append(label_ts)
-    text = " | ".join(text_parts)
 
-    pad = 10
-    max_label_w = max(40, shot.get_width() - 24 - pad * 2)
-    label = _render_fit_text(text, (255, 255, 255), max_label_w)
+    meta = {
+        "player": player_name or None,
+        "day": day,
+        "stage": stage or None,
+        "difficulty": difficulty or None,
+        "taken_at": now.isoformat(timespec="seconds"),
+    }
+    return "_".join(parts), " | ".join(text_parts), meta_text(meta)
+
+
+def _render_label(text: str, shot_width: int, scale: int = 1) -> pygame.Surface:
+    # HD 사진은 라벨도 같은 배율로 키워서 보통 사진과 같은 비율로 보이게 한다.
+    # pygame 폰트는 스레드에 안전하지 않으므로 UI 스레드에서만 부른다.
+    pad = 10 * scale
+    margin = 12 * scale
+    max_label_w = max(40 * scale, shot_width - margin * 2 - pad * 2)
+    label = _render_fit_text(text, (255, 255, 255), max_label_w, scale)
     bg = pygame.Surface((label.get_width() + pad * 2, label.get_height() + pad * 2), pygame.SRCALPHA)
     bg.fill((0, 0, 0, 160))
     bg.blit(label, (pad, pad))
+    return bg
+
+
+def _blit_label(shot: pygame.Surface, label: pygame.Surface, scale: int = 1):
+    margin = 12 * scale
+    shot.blit(label, (margin, shot.get_height() - label.get_height() - margin))
+
 
-    shot.blit(bg, (12, shot.get_height() - bg.get_height() - 12))
+def _draw_label(shot: pygame.Surface, text: str, scale: int = 1):
+    _blit_label(shot, _render_label(text, shot.get_width(), scale), scale)
 
-    pygame.image.save(shot, str(path))
+
+def take_photo(
+    surface: pygame.Surface,
+    *,
+    player_name: str = "player",
+    day: int | None = None,
+    stage: str | None = None,
+    difficulty: str | None = None,
+    folder: str | os.PathLike | None = None,
+) -> str:
+    target = Path(folder) if folder is not None else _ALBUM_DIR
+    target.mkdir(parents=True, exist_ok=True)
+
+    stem, text, meta = _photo_names(player_name, day, stage, datetime.datetime.now(), difficulty)
+    path = target / (stem + ".png")
+
+    shot = surface.copy()
+    _draw_label(shot, text)
+    meta = _with_hash(meta, shot)
+
+    stamp = _folder_stamp(target)
+    width, height = shot.get_size()
+    png_writer.write_atomic(path, png_writer.encode_png(width, height, pygame.image.tobytes(shot, "RGB"), text=meta))
+    _catalog_add(target, path, stamp)
     return str(path)
+
+
+class PhotoWriter:
+    # 캡처는 화면 픽셀과 미리 그린 라벨을 바이트로 떠서 큐에 넣고 바로 돌아온다.
+    # 라벨 붙이기, 인코딩, 저장, 카탈로그 반영은 작업 스레드 하나가 순서대로 하고,
+    # 끝난 결과는 UI 스레드가 poll()로 가져가 토스트를 띄운다.
+    def __init__(
+        self,
+        folder: str | os.PathLike | None = None,
+        *,
+        fmt: str = "png",
+        png_level: int = png_writer.DEFAULT_LEVEL,
+        queue_size: int = PHOTO_QUEUE_SIZE,
+    ):
+        if fmt not in PHOTO_FORMATS:
+            raise ValueError(f"지원하지 않는 사진 형식입니다: {fmt}")
+        self.folder = Path(folder) if folder is not None else _ALBUM_DIR
+        self.fmt = fmt
+        self.png_level = max(0, min(9, int(png_level)))
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._done: list[tuple[str | None, str | None]] = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def capture(
+        self,
+        surface: pygame.Surface,
+        *,
+        player_name: str = "player",
+        day: int | None = None,
+        stage: str | None = None,
+        difficulty: str | None = None,
+        scale: int = 1,
+    ) -> str | None:
+        # 저장될 경로를 돌려준다. 큐가 가득 차 있으면 찍지 않고 None.
+        # scale은 화면을 몇 배로 다시 그린 사진인지로, 파일 이름과 라벨 크기에만 쓴다.
+        if self._queue.full():
+            return None
+        stem, text, meta = _photo_names(player_name, day, stage, datetime.datetime.now(), difficulty)
+        suffix = "_hd" if scale > 1 else ""
+        path = self.folder / f"{stem}{suffix}.{self.fmt}"
+        pixels = pygame.image.tobytes(surface, "RGB")
+        # 폰트는 작업 스레드에서 쓰지 않는다. 라벨은 여기서 그리고 픽셀만 넘긴다.
+        label = _render_label(text, surface.get_width(), scale)
+        label = (label.get_size(), pygame.image.tobytes(label, "RGBA"))
+        job = (self._write, path, label, meta, surface.get_size(), pixels, self.fmt, self.png_level, scale)
+        return self._submit(job, path)
+
+    def capture_clip(
+        self,
+        ring: photo_clip.FrameRing,
+        *,
+        player_name: str = "player",
+        day: int | None = None,
+        stage: str | None = None,
+        difficulty: str | None = None,
+    ) -> str | None:
+        # 링 버퍼의 현재 내용을 APNG로 내보낸다. 프레임 목록만 떠 가므로 즉시 돌아온다.
+        size, frames = ring.snapshot()
+        if not frames or self._queue.full():
+            return None
+        stem, _, meta = _photo_names(player_name, day, stage, datetime.datetime.now(), difficulty)
+        path = self.folder / f"{stem}_clip.png"
+        return self._submit((self._write_clip, path, meta, size, frames, self.png_level), path)
+
+    def _submit(self, job, path: Path) -> str | None:
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            return None
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._work, name="photo-writer", daemon=True)
+            self._thread.start()
+        return str(path)
+
+    def poll(self) -> list[tuple[str | None, str | None]]:
+        # [(저장된 경로, None) 또는 (None, 오류 메시지)]
+        with self._lock:
+            done, self._done = self._done, []
+        return done
+
+    def close(self, timeout: float | None = 5.0):
+        # 종료 전에 남은 사진을 마저 쓴다.
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                result = job[0](*job[1:])
+            finally:
+                self._queue.task_done()
+            with self._lock:
+                self._done.append(result)
+
+    def _write(self, path: Path, label, meta: dict, size, pixels: bytes, fmt: str, level: int, scale: int = 1):
+        # label: (크기, RGBA 바이트). UI 스레드에서 그려 둔 라벨이다.
+        try:
+            shot = pygame.image.frombytes(pixels, size, "RGB")
+            label_size, label_pixels = label
+            _blit_label(shot, pygame.image.frombytes(label_pixels, label_size, "RGBA"), scale)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            stamp = _folder_stamp(path.parent)
+            if fmt == "png":
+                meta = _with_hash(meta, shot)
+                data = png_writer.encode_png(size[0], size[1], pygame.image.tobytes(shot, "RGB"), level=level, text=meta)
+                png_writer.write_atomic(path, data)
+            else:
+                # pygame은 JPEG 품질을 받지 않으므로 SDL_image 기본 품질로 저장한다.
+                # 메타데이터를 넣을 곳이 없어 카탈로그는 파일 이름에서 이름, 날짜, 찍은 시각만 읽는다.
+                tmp = path.with_name(f".{path.stem}.tmp{path.suffix}")
+                pygame.image.save(shot, str(tmp))
+                os.replace(tmp, path)
+        except (OSError, TypeError, ValueError, pygame.error) as exc:
+            return None, str(exc) or type(exc).__name__
+        _catalog_add(path.parent, path, stamp)
+        return str(path), None
+
+    def _write_clip(self, path: Path, meta: dict, size, frames, level: int):
+        # 프레임을 하나씩 풀어서 바로 인코딩해 쓰므로 풀린 프레임은 한 장만 메모리에 있다.
+        tmp = path.with_name(f".{path.name}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            stamp = _folder_stamp(path.parent)
+            with open(tmp, "wb") as file:
+                writer = png_writer.APNGWriter(file, size[0], size[1], len(frames), level=level, text=meta)
+                for pixels, delay in photo_clip.iter_clip_frames(frames):
+                    writer.add(pixels, delay)
+                writer.close()
+            os.replace(tmp, path)
+        except (OSError, ValueError, zlib.error) as exc:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return None, str(exc) or type(exc).__name__
+        _catalog_add(path.parent, path, stamp)
+        return str(path), None
+
+
+def _with_hash(meta: dict, shot: pygame.Surface) -> dict:
+    # 라벨까지 그린 뒤의 해시를 넣어 앨범이 나중에 파일에서 다시 계산한 값과 같게 한다.
+    return {**meta, **meta_text({"dhash": photo_hash.dhash(shot)})}
+
+
+def _folder_stamp(target: Path) -> str:
+    try:
+        return str(os.stat(target).st_mtime_ns)
+    except OSError:
+        return ""
+
+
+def _catalog_add(target: Path, path: Path, stamp: str):
+    # 카탈로그는 목록용 색인일 뿐이라 실패해도 사진 저장은 그대로 둔다.
+    try:
+        with AlbumCatalog(target) as catalog:
+            catalog.add(path, stamp)
+    except (OSError, sqlite3.Error):
+        pass
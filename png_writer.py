@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from pathlib import Path
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+DEFAULT_LEVEL = 6
+
+# IHDR 색 형식
+COLOR_RGB = 2
+COLOR_RGBA = 6
+_CHANNELS = {"RGB": (3, COLOR_RGB), "RGBA": (4, COLOR_RGBA)}
+
+
+def chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+def ihdr(width: int, height: int, mode: str = "RGB") -> bytes:
+    _, color_type = _CHANNELS[mode]
+    return chunk(b"IHDR", struct.pack(">IIBBBBB", int(width), int(height), 8, color_type, 0, 0, 0))
+
+
+def text_chunk(key: str, value) -> bytes:
+    # iTXt(비압축, UTF-8). 고양이 이름 같은 한글도 그대로 담는다.
+    return chunk(b"iTXt", key.encode("latin-1") + b"\x00\x00\x00\x00\x00" + str(value).encode("utf-8"))
+
+
+def text_chunks(text: dict | None) -> bytes:
+    if not text:
+        return b""
+    return b"".join(text_chunk(key, value) for key, value in text.items() if value is not None)
+
+
+def read_text(path: str | os.PathLike, *, limit: int = 64 * 1024) -> dict[str, str]:
+    # 첫 IDAT 전까지 청크 헤더만 따라가며 tEXt/iTXt를 읽는다. 픽셀은 읽지도 풀지도 않는다.
+    text = {}
+    with open(path, "rb") as file:
+        if file.read(8) != PNG_SIGNATURE:
+            return text
+        while True:
+            header = file.read(8)
+            if len(header) < 8:
+                break
+            length, kind = struct.unpack(">I4s", header)
+            if kind in (b"IDAT", b"IEND") or length > limit:
+                break
+            if kind not in (b"tEXt", b"iTXt"):
+                file.seek(length + 4, os.SEEK_CUR)
+                continue
+            data = file.read(length)
+            file.seek(4, os.SEEK_CUR)
+            key, _, rest = data.partition(b"\x00")
+            try:
+                if kind == b"tEXt":
+                    value = rest.decode("latin-1")
+                else:
+                    compressed = rest[:1] == b"\x01"
+                    # 압축 플래그, 압축 방식, 언어 태그, 번역된 키워드를 건너뛴다.
+                    _, _, tail = rest[2:].partition(b"\x00")
+                    _, _, body = tail.partition(b"\x00")
+                    value = (zlib.decompress(body) if compressed else body).decode("utf-8")
+            except (UnicodeDecodeError, zlib.error):
+                continue
+            text[key.decode("latin-1")] = value
+    return text
+
+
+def image_data(width: int, height: int, pixels: bytes, mode: str = "RGB", level: int = DEFAULT_LEVEL) -> bytes:
+    # 행마다 필터 0(None)을 붙여 zlib으로 압축한다. 필터 선택은 파이썬에서 느려서 하지 않는다.
+    channels, _ = _CHANNELS[mode]
+    stride = int(width) * channels
+    if len(pixels) != stride * int(height):
+        raise ValueError("픽셀 데이터 크기가 이미지 크기와 맞지 않습니다.")
+    compressor = zlib.compressobj(max(0, min(9, int(level))))
+    parts = []
+    for offset in range(0, len(pixels), stride):
+        parts.append(compressor.compress(b"\x00" + pixels[offset : offset + stride]))
+    parts.append(compressor.flush())
+    return b"".join(parts)
+
+
+def encode_png(
+    width: int,
+    height: int,
+    pixels: bytes,
+    *,
+    mode: str = "RGB",
+    level: int = DEFAULT_LEVEL,
+    text: dict | None = None,
+) -> bytes:
+    return b"".join(
+        (
+            PNG_SIGNATURE,
+            ihdr(width, height, mode),
+            text_chunks(text),
+            chunk(b"IDAT", image_data(width, height, pixels, mode, level)),
+            chunk(b"IEND", b""),
+        )
+    )
+
+
+def write_atomic(path: str | os.PathLike, data: bytes):
+    # 같은 폴더의 점(.) 임시 파일에 쓴 뒤 교체해서, 목록에 반쯤 쓰인 파일이 보이지 않게 한다.
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+class APNGWriter:
+    # 프레임을 받는 즉시 압축해서 파일에 흘려 쓴다. 프레임 수는 acTL에 먼저 적어야 하므로 미리 받는다.
+    def __init__(
+        self,
+        fileobj,
+        width: int,
+        height: int,
+        frames: int,
+        *,
+        loops: int = 0,
+        mode: str = "RGB",
+        level: int = DEFAULT_LEVEL,
+        text: dict | None = None,
+    ):
+        if frames <= 0:
+            raise ValueError("프레임이 없습니다.")
+        self.file = fileobj
+        self.width = int(width)
+        self.height = int(height)
+        self.frames = int(frames)
+        self.mode = mode
+        self.level = level
+        self.written = 0
+        self._sequence = 0
+        self.file.write(PNG_SIGNATURE)
+        self.file.write(ihdr(self.width, self.height, mode))
+        self.file.write(chunk(b"acTL", struct.pack(">II", self.frames, int(loops))))
+        self.file.write(text_chunks(text))
+
+    def add(self, pixels: bytes, delay_ms: int):
+        if self.written >= self.frames:
+            raise ValueError("acTL에 적은 프레임 수를 넘었습니다.")
+        delay = max(1, min(65535, int(delay_ms)))
+        # 전체 크기 프레임을 (0, 0)에 덮어쓴다: dispose_op 0, blend_op 0
+        self.file.write(
+            chunk(
+                b"fcTL",
+                struct.pack(">IIIIIHHBB", self._sequence, self.width, self.height, 0, 0, delay, 1000, 0, 0),
+            )
+        )
+        self._sequence += 1
+        data = image_data(self.width, self.height, pixels, self.mode, self.level)
+        if self.written == 0:
+            # 첫 프레임은 IDAT이라 APNG를 모르는 뷰어에서도 정지 사진으로 보인다.
+            self.file.write(chunk(b"IDAT", data))
+        else:
+            self.file.write(chunk(b"fdAT", struct.pack(">I", self._sequence) + data))
+            self._sequence += 1
+        self.written += 1
+
+    def close(self):
+        if self.written != self.frames:
+            raise ValueError("acTL에 적은 프레임 수와 쓴 프레임 수가 다릅니다.")
+        self.file.write(chunk(b"IEND", b""))
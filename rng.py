@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import random
+import secrets
+import struct
+
+
+STREAM_CAT = "cat"
+STREAM_CAT_IMAGE = "cat_image"
+STREAM_COMPETITION = "competition"
+STREAM_DIALOGUE = "dialogue"
+STREAM_EFFECTS = "effects"
+STREAM_HOUSEHOLD = "household"
+
+_STATE_WORDS = 625
+
+
+def derive_seed(seed: int, name: str) -> int:
+    digest = hashlib.sha256(f"{int(seed)}:{name}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:16], "big")
+
+
+def minigame_stream(minigame_id: str) -> str:
+    return f"minigame.{minigame_id}"
+
+
+def _encode_state(rng: random.Random) -> list:
+    _, internal, gauss_next = rng.getstate()
+    packed = struct.pack(f"<{_STATE_WORDS}I", *internal)
+    return [base64.b64encode(packed).decode("ascii"), gauss_next]
+
+
+def _decode_state(value) -> tuple:
+    packed = base64.b64decode(str(value[0]).encode("ascii"), validate=True)
+    internal = struct.unpack(f"<{_STATE_WORDS}I", packed)
+    gauss_next = value[1]
+    if gauss_next is not None:
+        gauss_next = float(gauss_next)
+    return (random.Random.VERSION, internal, gauss_next)
+
+
+class RngService:
+    def __init__(self, seed: int | None = None):
+        self.seed = secrets.randbits(64) if seed is None else int(seed)
+        self._streams = {}
+
+    def stream(self, name: str) -> random.Random:
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = random.Random(derive_seed(self.seed, name))
+            self._streams[name] = stream
+        return stream
+
+    def child(self, name: str) -> "RngService":
+        return RngService(derive_seed(self.seed, f"child:{name}") >> 64)
+
+    def snapshot(self) -> dict:
+        return {
+            "seed": self.seed,
+            "streams": {name: _encode_state(stream) for name, stream in sorted(self._streams.items())},
+        }
+
+    def restore(self, data) -> bool:
+        if not isinstance(data, dict):
+            return False
+        try:
+            seed = int(data.get("seed"))
+            states = {str(name): _decode_state(value) for name, value in dict(data.get("streams") or {}).items()}
+        except (IndexError, TypeError, ValueError, struct.error):
+            return False
+
+        self.seed = seed
+        for name, stream in self._streams.items():
+            stream.seed(derive_seed(seed, name))
+        for name, value in states.items():
+            try:
+                self.stream(name).setstate(value)
+            except (TypeError, ValueError):
+                self._streams[name].seed(derive_seed(seed, name))
+        return True
+
+    @classmethod
+    def from_snapshot(cls, data) -> "RngService":
+        service = cls()
+        service.restore(data)
+        return service
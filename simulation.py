@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+import argparse
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import care_planner
+import competition
+import effects
+import evolution
+import state as game_state
+from cat import Cat
+from items import SHOP_ID_TO_INVENTORY_ID, apply_item_effect, get_shop_item
+from rng import STREAM_CAT, STREAM_COMPETITION, RngService
+
+
+CARE_ACTIONS = ("feed_free", "play_free", "clean", "sleep")
+DEFAULT_MAX_DAYS = 60
+SIM_IMAGE_PATH = "<simulation>"
+
+INVENTORY_ID_TO_SHOP_ID = {item: shop_id for shop_id, item in SHOP_ID_TO_INVENTORY_ID.items()}
+OUTCOMES = ("hunger", "tiredness", "happiness", "cleanliness", "alive")
+
+
+def game_over_cause(cat) -> str | None:
+    if cat.hunger >= game_state.DEATH_HUNGER_THRESHOLD:
+        return "hunger"
+    if cat.tiredness >= game_state.DEATH_TIREDNESS_THRESHOLD:
+        return "tiredness"
+    if cat.happiness <= game_state.RUNAWAY_HAPPINESS_THRESHOLD:
+        return "happiness"
+    if cat.cleanliness <= game_state.RUNAWAY_CLEANLINESS_THRESHOLD:
+        return "cleanliness"
+    return None
+
+
+class LifeSimulation:
+    def __init__(
+        self,
+        difficulty: str,
+        personality: str,
+        policy,
+        *,
+        max_days: int = DEFAULT_MAX_DAYS,
+        rng: RngService | None = None,
+    ):
+        self.state = game_state.GameState(difficulty, personality, rng=rng)
+        self.difficulty = self.state.difficulty
+        self.cat = Cat(
+            "sim",
+            evolution.BABY,
+            image_path=SIM_IMAGE_PATH,
+            difficulty=self.state.difficulty,
+            personality=self.state.personality,
+            rng=self.state.rng.stream(STREAM_CAT),
+        )
+        self.policy = policy
+        self.max_days = max(1, int(max_days))
+        self.inventory = {}
+        self.last_competition_day = 0
+        self.competition_grades = Counter()
+        self.actions_used = set()
+        self.evolved_on = {}
+        self.coins_in = Counter()
+        self.coins_out = Counter()
+        self.outcome = None
+        self.last_day = 1
+
+        # 한 생애 동안 바뀌지 않는 값은 미리 구해 둔다. 단계마다 dict를 새로 만들지 않는다.
+        self._effects = effects.effect_table(self.cat.difficulty, self.cat.personality)
+        self._day_coin = game_state.get_day_coin_reward(self.difficulty)
+        self._evolution_costs = {
+            stage: game_state.get_evolution_cost(cost, self.difficulty)
+            for stage, cost in evolution.EVOLUTION_COST.items()
+        }
+        self._shop_prices = {}
+
+    def run(self) -> "LifeSimulation":
+        while self.outcome is None:
+            for action in self.policy(self) or ():
+                self.perform(action)
+                if self._check_game_over():
+                    return self
+            self.advance_time()
+        return self
+
+    def perform(self, action: str) -> bool:
+        if action in CARE_ACTIONS:
+            if action in self.actions_used:
+                return False
+            self._apply(action)
+            self.actions_used.add(action)
+            return True
+
+        kind, _, arg = action.partition(":")
+        if kind == "item":
+            if self.inventory.get(arg, 0) <= 0 or not apply_item_effect(self.cat, arg):
+                return False
+            self.inventory[arg] -= 1
+            return True
+        if kind == "buy":
+            return self._buy(arg)
+        if kind == "compete":
+            return self._compete()
+        return False
+
+    def advance_time(self):
+        # 시뮬레이션은 미니게임을 하지 않으므로 minigame_used는 처음 그대로 둔다.
+        phase = self.state.advance_time()
+        cat = self.cat
+        if phase == game_state.NIGHT:
+            self._apply("night")
+        else:
+            self._apply("morning")
+            self._earn("day", self._day_coin)
+        cat.check_death()
+        cat.check_runaway()
+
+        self.actions_used.clear()
+        if phase == game_state.MORNING:
+            self._try_auto_evolve()
+
+        if not self._check_game_over() and self.state.day > self.max_days:
+            self.outcome = "alive"
+            self.last_day = self.max_days + 1
+
+    def _apply(self, action: str):
+        # Cat._apply_effect와 같은 effects.apply_outcomes를 쓴다. 표만 생애 동안 들고 있는다.
+        cat = self.cat
+        if cat.alive and not cat.runaway:
+            effects.apply_outcomes(cat, self._effects[action], cat.rng)
+
+    def evolution_cost(self) -> int:
+        cost = self._evolution_costs.get(self.cat.stage)
+        return cost if cost is not None else game_state.get_evolution_cost(0, self.difficulty)
+
+    def shop_price(self, shop_id: str) -> int | None:
+        if shop_id not in self._shop_prices:
+            item = get_shop_item(shop_id)
+            self._shop_prices[shop_id] = (
+                None if item is None else game_state.get_shop_price(item["price"], self.difficulty)
+            )
+        return self._shop_prices[shop_id]
+
+    def _earn(self, source: str, amount: int):
+        amount = max(0, int(amount))
+        self.state.money += amount
+        self.coins_in[source] += amount
+
+    def _spend(self, sink: str, amount: int) -> bool:
+        amount = max(0, int(amount))
+        if self.state.money < amount:
+            return False
+        self.state.money -= amount
+        self.coins_out[sink] += amount
+        return True
+
+    def _buy(self, shop_id: str) -> bool:
+        item = SHOP_ID_TO_INVENTORY_ID.get(shop_id)
+        price = self.shop_price(shop_id)
+        if item is None or price is None or not self._spend("shop", price):
+            return False
+        self.inventory[item] = self.inventory.get(item, 0) + 1
+        return True
+
+    def _compete(self) -> bool:
+        day = self.state.day
+        comp = competition.competition_for_day(day)
+        if not competition.is_event_day(day) or self.last_competition_day == day:
+            return False
+        if not self._spend("competition", competition.entry_fee(comp, self.difficulty)):
+            return False
+
+        score = competition.roll_score(
+            comp["id"],
+            self.cat,
+            self.state,
+            self.inventory,
+            rng=self.state.rng.stream(STREAM_COMPETITION),
+        )
+        grade = competition.grade_for_score(score, self.difficulty)
+        reward = competition.reward_for_grade(comp, grade, self.difficulty)
+        self._earn("competition", reward)
+        # 저장용 기록(record_result)은 매번 전체를 정규화하므로 시뮬레이션에서는 날짜와 등급만 센다.
+        self.last_competition_day = day
+        self.competition_grades[grade] += 1
+        return True
+
+    def _try_auto_evolve(self):
+        while True:
+            stage = self.cat.stage
+            cost = self.evolution_cost()
+            if stage not in self._evolution_costs or self.state.money < cost:
+                # can_evolve도 여기서 멈춘다. 대부분의 아침이 이 경우라 호출을 건너뛴다.
+                return
+            required_item = evolution.EVOLUTION_ITEM.get(stage)
+            can_evo, _ = evolution.can_evolve(
+                self.cat,
+                self.state.day,
+                self.state.money,
+                self.inventory.get("고기", 0) > 0,
+                self.inventory.get("뼈", 0) > 0,
+                cost_override=cost,
+            )
+            if not can_evo or not self._spend("evolution", cost):
+                return
+            if required_item is not None:
+                self.inventory[required_item] -= 1
+            evolution.evolve(self.cat)
+            self.evolved_on[self.cat.stage] = self.state.day
+
+    def _check_game_over(self) -> bool:
+        cause = game_over_cause(self.cat)
+        if cause is None:
+            return False
+        self.outcome = cause
+        self.last_day = self.state.day
+        return True
+
+
+def idle_policy(sim: LifeSimulation):
+    return ()
+
+
+def full_care_policy(sim: LifeSimulation):
+    return ("clean", "play_free", "feed_free", "sleep", *_shopping_actions(sim))
+
+
+def basic_policy(sim: LifeSimulation):
+    cat = sim.cat
+    actions = [
+        action
+        for action, stat, threshold, high in effects.BASIC_CARE_RULES
+        if effects.care_rule_fires(getattr(cat, stat), threshold, high)
+    ]
+    actions.extend(_shopping_actions(sim))
+    return actions
+
+
+def planner_policy(sim: LifeSimulation):
+    plan = care_planner.recommend(sim.cat, sim.state.time_phase, sim.actions_used, sim.inventory)
+    actions = [f"item:{plan['item']}"] if plan["item"] else []
+    actions.extend(plan["care"])
+    actions.extend(_shopping_actions(sim))
+    return actions
+
+
+def _shopping_actions(sim: LifeSimulation):
+    actions = []
+    required_item = evolution.EVOLUTION_ITEM.get(sim.cat.stage)
+    if required_item and sim.inventory.get(required_item, 0) <= 0:
+        shop_id = INVENTORY_ID_TO_SHOP_ID[required_item]
+        price = sim.shop_price(shop_id) or 0
+        if sim.state.money >= price + sim.evolution_cost():
+            actions.append(f"buy:{shop_id}")
+
+    day = sim.state.day
+    if sim.state.time_phase == game_state.MORNING and competition.is_event_day(day):
+        comp = competition.competition_for_day(day)
+        score = competition.estimate_score(comp["id"], sim.cat, sim.state, sim.inventory)
+        if competition.grade_for_score(score, sim.difficulty) in ("S", "A", "B"):
+            actions.append("compete")
+    return actions
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "basic": basic_policy,
+    "full": full_care_policy,
+    "planner": planner_policy,
+}
+
+
+class SimulationReport:
+    def __init__(self, max_days: int = DEFAULT_MAX_DAYS):
+        self.max_days = max(1, int(max_days))
+        self.lives = 0
+        self.last_days = Counter()
+        self.outcomes = Counter()
+        self.evolve_count = Counter()
+        self.evolve_day_total = Counter()
+        self.coins_in = Counter()
+        self.coins_out = Counter()
+        self.final_money = 0
+
+    def add(self, sim: LifeSimulation):
+        self.lives += 1
+        self.last_days[sim.last_day] += 1
+        self.outcomes[sim.outcome] += 1
+        for stage, day in sim.evolved_on.items():
+            self.evolve_count[stage] += 1
+            self.evolve_day_total[stage] += day
+        self.coins_in.update(sim.coins_in)
+        self.coins_out.update(sim.coins_out)
+        self.final_money += sim.state.money
+
+    def merge(self, other: "SimulationReport"):
+        self.lives += other.lives
+        self.last_days.update(other.last_days)
+        self.outcomes.update(other.outcomes)
+        self.evolve_count.update(other.evolve_count)
+        self.evolve_day_total.update(other.evolve_day_total)
+        self.coins_in.update(other.coins_in)
+        self.coins_out.update(other.coins_out)
+        self.final_money += other.final_money
+
+    def survival_curve(self) -> list[float]:
+        if not self.lives:
+            return [1.0] * self.max_days
+        curve = []
+        remaining = self.lives
+        for day in range(1, self.max_days + 1):
+            remaining -= self.last_days.get(day, 0)
+            curve.append(remaining / self.lives)
+        return curve
+
+    def summary(self) -> dict:
+        lives = max(1, self.lives)
+        return {
+            "lives": self.lives,
+            "survival": self.survival_curve(),
+            "outcomes": {key: self.outcomes.get(key, 0) / lives for key in OUTCOMES},
+            "evolve_rate": {
+                stage: self.evolve_count.get(stage, 0) / lives for stage in evolution.EVOLUTION_ORDER[1:]
+            },
+            "evolve_day": {
+                stage: self.evolve_day_total[stage] / self.evolve_count[stage]
+                for stage in evolution.EVOLUTION_ORDER[1:]
+                if self.evolve_count.get(stage)
+            },
+            "coins_in": {key: value / lives for key, value in self.coins_in.items()},
+            "coins_out": {key: value / lives for key, value in self.coins_out.items()},
+            "final_money": self.final_money / lives,
+        }
+
+
+def run_simulations(
+    runs: int,
+    difficulty: str = game_state.DIFFICULTY_NORMAL,
+    personality: str = game_state.PERSONALITY_ENERGETIC,
+    policy="basic",
+    *,
+    max_days: int = DEFAULT_MAX_DAYS,
+    seed: int | None = None,
+    workers: int = 1,
+) -> SimulationReport:
+    # 생애마다 master.child(번호)로 시드를 나누므로 여러 프로세스로 나눠 돌려도 결과가 같다.
+    # 프로세스로 넘길 수 있게 policy가 이름일 때만 나눈다.
+    seed = RngService(seed).seed
+    runs = max(0, int(runs))
+    workers = max(1, min(int(workers), runs))
+    if workers == 1 or not isinstance(policy, str):
+        return _run_lives(range(runs), difficulty, personality, policy, max_days, seed)
+
+    bounds = [runs * index // workers for index in range(workers + 1)]
+    report = SimulationReport(max_days)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_lives, range(start, stop), difficulty, personality, policy, max_days, seed)
+            for start, stop in zip(bounds, bounds[1:])
+        ]
+        for future in futures:
+            report.merge(future.result())
+    return report
+
+
+def _run_lives(indices, difficulty: str, personality: str, policy, max_days: int, seed: int) -> SimulationReport:
+    master = RngService(seed)
+    policy_fn = POLICIES[policy] if isinstance(policy, str) else policy
+    report = SimulationReport(max_days)
+    for index in indices:
+        sim = LifeSimulation(difficulty, personality, policy_fn, max_days=max_days, rng=master.child(str(index)))
+        report.add(sim.run())
+    return report
+
+
+def _print_summary(summary: dict, elapsed: float):
+    lives = summary["lives"]
+    print(f"lives: {lives} ({lives / max(elapsed, 1e-9):.0f}/s)")
+    curve = summary["survival"]
+    marks = [day for day in (7, 14, 21, 30, 35, 45, 60) if day <= len(curve)]
+    print("survival: " + ", ".join(f"d{day} {curve[day - 1]:.1%}" for day in marks))
+    print("outcomes: " + ", ".join(f"{key} {value:.1%}" for key, value in summary["outcomes"].items()))
+    for stage, rate in summary["evolve_rate"].items():
+        day = summary["evolve_day"].get(stage)
+        day_text = f"{day:.1f}" if day is not None else "-"
+        print(f"evolve {stage}: {rate:.1%} (day {day_text})")
+    print("coins in: " + ", ".join(f"{key} {value:.1f}" for key, value in summary["coins_in"].items()))
+    print("coins out: " + ", ".join(f"{key} {value:.1f}" for key, value in summary["coins_out"].items()))
+    print(f"final money: {summary['final_money']:.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="고양이 생애 시뮬레이션")
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--difficulty", default=game_state.DIFFICULTY_NORMAL, choices=tuple(game_state.DIFFICULTY_PROFILE))
+    parser.add_argument("--personality", default=game_state.PERSONALITY_ENERGETIC, choices=tuple(game_state.PERSONALITY_PROFILE))
+    parser.add_argument("--policy", default="basic", choices=tuple(POLICIES))
+    parser.add_argument("--max-days", type=int, default=DEFAULT_MAX_DAYS)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=1, help="생애를 나눠 돌릴 프로세스 수")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    report = run_simulations(
+        args.runs,
+        args.difficulty,
+        args.personality,
+        args.policy,
+        max_days=args.max_days,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    _print_summary(report.summary(), time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-import random
+from rng import RngService
 
 MORNING = "morning"
 NIGHT = "night"
@@ -80,6 +80,12 @@ MINIGAME_DIFFICULTY_PROFILE = {
             "max_speed": 650.0,
             "combo_grace": 1.8,
             "miss_penalty": 2,
+            "multi_targets": 3,
+            "multi_max_targets": 6,
+            "multi_spawn_every": 6,
+            "multi_target_score": 620,
+            "multi_speed_spread": 0.25,
+            "multi_radius_spread": 0.15,
         },
     },
     DIFFICULTY_NORMAL: {
@@ -118,6 +124,12 @@ MINIGAME_DIFFICULTY_PROFILE = {
             "max_speed": 720.0,
             "combo_grace": 1.5,
             "miss_penalty": 4,
+            "multi_targets": 4,
+            "multi_max_targets": 8,
+            "multi_spawn_every": 5,
+            "multi_target_score": 720,
+            "multi_speed_spread": 0.30,
+            "multi_radius_spread": 0.20,
         },
     },
     DIFFICULTY_HARD: {
@@ -156,6 +168,12 @@ MINIGAME_DIFFICULTY_PROFILE = {
             "max_speed": 820.0,
             "combo_grace": 1.15,
             "miss_penalty": 8,
+            "multi_targets": 5,
+            "multi_max_targets": 12,
+            "multi_spawn_every": 4,
+            "multi_target_score": 870,
+            "multi_speed_spread": 0.35,
+            "multi_radius_spread": 0.25,
         },
     },
 }
@@ -238,7 +256,13 @@ def normalize_minigame_usage(value) -> dict[str, bool]:
 
 
 class GameState:
-    def __init__(self, difficulty: str = DIFFICULTY_NORMAL, personality: str = PERSONALITY_ENERGETIC):
+    def __init__(
+        self,
+        difficulty: str = DIFFICULTY_NORMAL,
+        personality: str = PERSONALITY_ENERGETIC,
+        rng: RngService | None = None,
+    ):
+        self.rng = rng or RngService()
         self.difficulty = normalize_difficulty(difficulty)
         self.personality = normalize_personality(personality)
         self.day = 1
@@ -262,10 +286,6 @@ def clamp(value):
     return max(0, min(value, MAX_STAT))
 
 
-def rand_range(rng: tuple[int, int]) -> int:
-    return random.randint(rng[0], rng[1])
-
-
 def scaled_range(rng, difficulty: str | None, kind: str) -> tuple[int, int]:
     profile = get_difficulty_profile(difficulty)
     multiplier = profile["stat_pressure"] if kind == "pressure" else profile["stat_recovery"]
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+
+FAILURE_RETRY_S = 5.0
+MAX_FAILURES = 256
+
+
+def surface_bytes(surface) -> int:
+    if surface is None:
+        return 0
+    return int(surface.get_pitch()) * int(surface.get_height())
+
+
+class SurfaceLRU:
+    # 픽셀 바이트 예산을 넘지 않는 Surface LRU.
+    # 예산을 넘으면 distance(key)가 큰 항목부터, 같으면 오래 안 쓴 항목부터 내보낸다.
+    # 실패(None)는 바이트 없이 따로 기록했다가 FAILURE_RETRY_S가 지나면 다시 시도하게 한다.
+    def __init__(self, budget_bytes: int, *, failure_ttl: float = FAILURE_RETRY_S, max_failures: int = MAX_FAILURES):
+        self.budget = max(0, int(budget_bytes))
+        self.failure_ttl = float(failure_ttl)
+        self.max_failures = max(1, int(max_failures))
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items: OrderedDict = OrderedDict()
+        self._failures: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def peek(self, key):
+        # 통계와 LRU 순서를 건드리지 않고 들여다본다. 자리 표시용.
+        return self._items.get(key)
+
+    def lookup(self, key) -> tuple[bool, object]:
+        # (찾음 여부, Surface). 찾았는데 None이면 아직 유효한 실패 기록이다.
+        surface = self._items.get(key)
+        if surface is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return True, surface
+        failed_at = self._failures.get(key)
+        if failed_at is not None:
+            if time.monotonic() - failed_at < self.failure_ttl:
+                self.hits += 1
+                return True, None
+            del self._failures[key]
+        self.misses += 1
+        return False, None
+
+    def put(self, key, surface, distance=None):
+        self.discard(key)
+        if surface is None:
+            self._failures[key] = time.monotonic()
+            while len(self._failures) > self.max_failures:
+                self._failures.popitem(last=False)
+            return
+        self._items[key] = surface
+        self.bytes += surface_bytes(surface)
+        self.trim(distance)
+
+    def discard(self, key):
+        surface = self._items.pop(key, None)
+        if surface is not None:
+            self.bytes -= surface_bytes(surface)
+        self._failures.pop(key, None)
+
+    def trim(self, distance=None):
+        if self.bytes <= self.budget:
+            return
+        if distance is None:
+            victims = list(self._items)
+        else:
+            # sorted는 안정 정렬이라 거리가 같으면 LRU 순서가 유지된다.
+            victims = sorted(self._items, key=distance, reverse=True)
+        for key in victims:
+            if self.bytes <= self.budget or len(self._items) <= 1:
+                break
+            self.bytes -= surface_bytes(self._items.pop(key))
+            self.evictions += 1
+
+    def clear(self):
+        self._items.clear()
+        self._failures.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._items),
+            "failures": len(self._failures),
+            "bytes": self.bytes,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,196 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+import png_writer
+from album_catalog import SCHEMA_VERSION, AlbumCatalog, CatalogView, catalog_path, meta_text
+
+
+def touch_folder(folder):
+    # 폴더 시각 해상도가 거친 파일 시스템에서도 바깥 변경이 보이게 시각을 확실히 바꾼다.
+    os.utime(folder, ns=(1, 1))
+
+
+def write_photo(folder, name, mtime, **meta):
+    # 2x2 PNG에 메타데이터를 넣고 수정 시각을 정해 목록 순서를 고정한다.
+    path = Path(folder) / name
+    path.write_bytes(png_writer.encode_png(2, 2, bytes(12), text=meta_text(meta)))
+    os.utime(path, ns=(mtime, mtime))
+    return str(path)
+
+
+class AlbumCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = Path(tempfile.mkdtemp(prefix="album-"))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_add_and_remove_keep_folder_stamp(self):
+        with AlbumCatalog(self.folder) as catalog:
+            self.assertTrue(catalog.reconcile())
+            # take_photo처럼 쓰기 직전 폴더 시각을 받아 넘기면 다음 reconcile은 폴더를 다시 훑지 않는다.
+            stamp = catalog.folder_stamp()
+            first = write_photo(self.folder, "나비_day3_20250103_090000_000.png", 3 * 10**9, player="나비", day=3, stage="adult")
+            catalog.add(first, stamp)
+            stamp = catalog.folder_stamp()
+            second = write_photo(self.folder, "치즈_day4_20250104_090000_000.png", 4 * 10**9, player="치즈", day=4)
+            catalog.add(second, stamp)
+            self.assertFalse(catalog.reconcile())
+            self.assertEqual(catalog.paths(), [second, first])
+            self.assertEqual(catalog.metadata(first)["stage"], "adult")
+            self.assertEqual(catalog.metadata(first)["day"], 3)
+
+            stamp = catalog.folder_stamp()
+            os.remove(second)
+            catalog.remove(second, stamp)
+            self.assertFalse(catalog.reconcile())
+            self.assertEqual(catalog.paths(), [first])
+
+    def test_stale_stamp_leaves_reconcile_to_rescan(self):
+        with AlbumCatalog(self.folder) as catalog:
+            catalog.reconcile()
+            # 게임 밖에서 넣은 사진 때문에 쓰기 직전 폴더 시각이 기록과 다르다.
+            outside = write_photo(self.folder, "outside.png", 10**9)
+            touch_folder(self.folder)
+            stamp = catalog.folder_stamp()
+            photo = write_photo(self.folder, "나비_20250101_090000_000.png", 2 * 10**9)
+            catalog.add(photo, stamp)
+            self.assertEqual(catalog.count(), 1)
+            self.assertTrue(catalog.reconcile())
+            self.assertEqual(catalog.paths(), [photo, outside])
+
+    def test_reconcile_picks_up_outside_changes(self):
+        with AlbumCatalog(self.folder) as catalog:
+            kept = write_photo(self.folder, "a.png", 1 * 10**9)
+            gone = write_photo(self.folder, "b.png", 2 * 10**9)
+            changed = write_photo(self.folder, "c.png", 3 * 10**9, player="나비", day=1)
+            catalog.reconcile()
+            self.assertEqual(catalog.count(), 3)
+            catalog.set_duplicates([[kept, gone]])
+
+        # 게임 밖에서 지우고, 새로 넣고, 덮어쓴다. 숨김 파일과 사진이 아닌 파일은 색인하지 않는다.
+        os.remove(gone)
+        added = write_photo(self.folder, "나비_day9_20250109_120000_000.png", 4 * 10**9)
+        changed = write_photo(self.folder, "c.png", 5 * 10**9, player="치즈", day=2)
+        (self.folder / "notes.txt").write_text("메모", encoding="utf-8")
+        write_photo(self.folder, ".hidden.png", 6 * 10**9)
+        touch_folder(self.folder)
+        with AlbumCatalog(self.folder) as catalog:
+            self.assertTrue(catalog.reconcile())
+            self.assertFalse(catalog.reconcile())
+            self.assertEqual(catalog.paths(), [changed, added, kept])
+            self.assertEqual(catalog.metadata(changed)["player"], "치즈")
+            # 메타데이터가 없는 사진은 파일 이름에서 읽는다.
+            self.assertEqual(catalog.metadata(added)["player"], "나비")
+            self.assertEqual(catalog.metadata(added)["day"], 9)
+            self.assertEqual(catalog.metadata(added)["taken_at"], "2025-01-09T12:00:00")
+            # 지운 대표의 중복은 다시 보인다.
+            self.assertEqual(catalog.duplicate_count(), 0)
+
+    def test_pages_are_newest_first(self):
+        names = [f"p{index:02d}.png" for index in range(25)]
+        # 수정 시각이 같은 사진은 이름 역순으로 줄 세운다.
+        for index, name in enumerate(names):
+            write_photo(self.folder, name, (index // 2 + 1) * 10**9, day=index % 3)
+        with AlbumCatalog(self.folder) as catalog:
+            catalog.reconcile()
+            expected = [str(self.folder / name) for name in reversed(names)]
+            self.assertEqual(catalog.paths(), expected)
+            pages = [catalog.page(offset, 7) for offset in range(0, 25, 7)]
+            self.assertEqual([path for page in pages for path in page], expected)
+            self.assertEqual([len(page) for page in pages], [7, 7, 7, 4])
+            self.assertEqual(catalog.page(30, 7), [])
+            for index, path in enumerate(expected):
+                self.assertEqual(catalog.index_of(path), index)
+
+            day_one = [path for path in expected if int(Path(path).stem[1:]) % 3 == 1]
+            self.assertEqual(catalog.page(0, -1, day=1), day_one)
+            self.assertEqual(catalog.count(day=1), len(day_one))
+            self.assertEqual(catalog.index_of(day_one[3], day=1), 3)
+            self.assertEqual(list(CatalogView(catalog, page_size=4, max_pages=2, day=1)), day_one)
+
+    def test_older_schema_is_rebuilt(self):
+        # 1판 카탈로그(메타데이터 열 없음)에 남은 줄은 버리고 폴더에서 다시 채운다.
+        photo = write_photo(self.folder, "나비_day2_20250102_090000_000.png", 10**9, player="나비", day=2)
+        path = catalog_path(self.folder)
+        path.parent.mkdir(parents=True)
+        conn = sqlite3.connect(str(path))
+        with conn:
+            conn.executescript(
+                "CREATE TABLE photos (name TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL);"
+                "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            )
+            conn.execute("INSERT INTO photos VALUES ('old.png', 1, 1)")
+            conn.execute("INSERT INTO meta VALUES ('schema', '1')")
+            conn.execute("INSERT INTO meta VALUES ('folder_mtime_ns', ?)", (str(os.stat(self.folder).st_mtime_ns),))
+        conn.close()
+
+        with AlbumCatalog(self.folder) as catalog:
+            self.assertEqual(catalog.count(), 0)
+            self.assertTrue(catalog.reconcile())
+            self.assertEqual(catalog.paths(), [photo])
+            self.assertEqual(catalog.metadata(photo)["day"], 2)
+            self.assertEqual(catalog.groups("player"), [("나비", 1)])
+        conn = sqlite3.connect(str(path))
+        try:
+            self.assertEqual(conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()[0], str(SCHEMA_VERSION))
+        finally:
+            conn.close()
+
+
+class CatalogViewTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = Path(tempfile.mkdtemp(prefix="album-"))
+        self.photos = [
+            write_photo(self.folder, f"나비_day1_20250101_1200{index:02d}_000.png", (index + 1) * 10**9, player="나비", day=1)
+            for index in range(10)
+        ]
+        self.catalog = AlbumCatalog(self.folder)
+        self.catalog.reconcile(force=True)
+
+    def tearDown(self):
+        self.catalog.close()
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_duplicates_change_under_open_view(self):
+        # 중복 검사 작업 스레드처럼 다른 연결이 개수를 읽은 뒤에 목록을 줄이고 늘린다.
+        view = CatalogView(self.catalog, page_size=4, collapse=True)
+        self.assertEqual(len(view), 10)
+        newest = list(reversed(self.photos))
+        self.assertEqual(view[0], newest[0])
+
+        with AlbumCatalog(self.folder) as worker:
+            worker.set_duplicates([newest[:6]])
+        self.assertEqual(len(view), 5)
+        self.assertEqual(list(view), [newest[0], *newest[6:]])
+        with self.assertRaises(IndexError):
+            view[5]
+
+        with AlbumCatalog(self.folder) as worker:
+            worker.set_duplicates([])
+            worker.remove_many(newest[8:])
+        self.assertEqual(list(view), newest[:8])
+        self.assertEqual(view.index_of(newest[7]), 7)
+
+    def test_short_page_ends_the_list(self):
+        # len()과 [i] 사이에 사진이 빠지면 IndexError로 끝을 알리고 다음 len()에서 다시 센다.
+        view = CatalogView(self.catalog, page_size=4)
+        count = len(view)
+        with AlbumCatalog(self.folder) as worker:
+            worker.remove_many(self.photos[:3])
+        seen = []
+        for index in range(count):
+            try:
+                seen.append(view[index])
+            except IndexError:
+                break
+        self.assertEqual(seen, list(reversed(self.photos[3:])))
+        self.assertEqual(len(view), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
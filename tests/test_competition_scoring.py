@@ -0,0 +1,169 @@
+import random
+import unittest
+from types import SimpleNamespace
+
+import competition
+import competition_forecast
+import evolution
+import state as game_state
+
+
+DIFFICULTIES = (game_state.DIFFICULTY_EASY, game_state.DIFFICULTY_NORMAL, game_state.DIFFICULTY_HARD)
+PERSONALITIES = (game_state.PERSONALITY_ENERGETIC, game_state.PERSONALITY_CALM, game_state.PERSONALITY_LAZY)
+STAGES = (evolution.BABY, evolution.ADULT, evolution.LION, evolution.DINO, "")
+
+
+def baseline_score(comp_id, cat, state, inventory, random_bonus=0):
+    # 가중치 행렬로 바꾸기 전의 if/elif 계산식을 그대로 옮겨 둔 것
+    def clamped(name):
+        try:
+            number = float(getattr(cat, name, 50))
+        except (TypeError, ValueError):
+            number = 50.0
+        return max(0.0, min(100.0, number))
+
+    def count(keys):
+        total = 0
+        for key in keys:
+            try:
+                total += max(0, int(inventory.get(key, 0)))
+            except (TypeError, ValueError):
+                pass
+        return total
+
+    happy = clamped("happiness")
+    clean = clamped("cleanliness")
+    hunger_ok = 100 - clamped("hunger")
+    rested = 100 - clamped("tiredness")
+    stage_bonus = {evolution.DINO: 12, evolution.LION: 10, evolution.ADULT: 5}.get(cat.stage, 0)
+    minigame_count = sum(1 for used in state.minigame_used.values() if used)
+    food_count = count(competition.FOOD_ITEMS)
+    toy_count = count(competition.TOY_ITEMS)
+
+    if comp_id == "cute":
+        score = happy * 0.45 + clean * 0.35 + hunger_ok * 0.10 + rested * 0.10 + stage_bonus
+    elif comp_id == "clean":
+        score = clean * 0.68 + happy * 0.14 + rested * 0.10 + hunger_ok * 0.08
+    elif comp_id == "food":
+        score = hunger_ok * 0.58 + happy * 0.16 + clean * 0.10 + min(food_count, 8) * 4.0
+    elif comp_id == "hunt":
+        score = happy * 0.26 + rested * 0.22 + hunger_ok * 0.14 + minigame_count * 12 + toy_count * 2.5 + stage_bonus
+    elif comp_id == "stamina":
+        score = rested * 0.46 + hunger_ok * 0.25 + clean * 0.14 + happy * 0.15 + stage_bonus * 0.5
+    elif comp_id == "luck":
+        avg = (happy + clean + hunger_ok + rested) / 4
+        score = avg * 0.72 + min(food_count + toy_count, 10) * 2.0 + random_bonus
+    else:
+        score = (happy + clean + hunger_ok + rested) / 4
+    return max(0, min(120, int(round(score))))
+
+
+def random_case(rng):
+    def stat():
+        # 정수, 소수, 범위 밖 값을 섞는다.
+        kind = rng.random()
+        if kind < 0.4:
+            return rng.randint(0, 100)
+        if kind < 0.9:
+            return rng.uniform(0, 100)
+        return rng.uniform(-30, 130)
+
+    cat = SimpleNamespace(
+        hunger=stat(),
+        tiredness=stat(),
+        happiness=stat(),
+        cleanliness=stat(),
+        stage=rng.choice(STAGES),
+        personality=rng.choice(PERSONALITIES),
+        difficulty=rng.choice(DIFFICULTIES),
+    )
+    state = SimpleNamespace(minigame_used={key: rng.random() < 0.5 for key in game_state.MINIGAME_KEYS})
+    inventory = {key: rng.randint(0, 6) for key in (*competition.FOOD_ITEMS, *competition.TOY_ITEMS)}
+    return cat, state, inventory
+
+
+class CompetitionScoringTest(unittest.TestCase):
+    def test_estimate_score_matches_baseline(self):
+        rng = random.Random(20240527)
+        for _ in range(3000):
+            cat, state, inventory = random_case(rng)
+            for comp in competition.COMPETITIONS:
+                expected = baseline_score(comp["id"], cat, state, inventory)
+                self.assertEqual(competition.estimate_score(comp["id"], cat, state, inventory), expected)
+
+    def test_roll_score_matches_baseline(self):
+        rng = random.Random(7)
+        for seed in range(2000):
+            cat, state, inventory = random_case(rng)
+            for comp in competition.COMPETITIONS:
+                bonus_rng = random.Random(seed)
+                bonus = bonus_rng.randint(*competition.LUCK_BONUS_RANGE) if comp["id"] == "luck" else 0
+                expected = baseline_score(comp["id"], cat, state, inventory, random_bonus=bonus)
+                actual = competition.roll_score(comp["id"], cat, state, inventory, rng=random.Random(seed))
+                self.assertEqual(actual, expected)
+
+    def test_batch_and_all_match_single_scores(self):
+        rng = random.Random(99)
+        cases = [random_case(rng) for _ in range(500)]
+        rows = [competition.features_for(*case) for case in cases]
+        for comp in competition.COMPETITIONS:
+            expected = [baseline_score(comp["id"], *case) for case in cases]
+            self.assertEqual(competition.score_batch(comp["id"], rows), expected)
+        for case, row in zip(cases, rows):
+            self.assertEqual(
+                competition.score_all(row),
+                {comp["id"]: baseline_score(comp["id"], *case) for comp in competition.COMPETITIONS},
+            )
+
+    def test_unknown_competition_uses_average(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            cat, state, inventory = random_case(rng)
+            self.assertEqual(
+                competition.estimate_score("unknown", cat, state, inventory),
+                baseline_score("unknown", cat, state, inventory),
+            )
+
+
+class GradeForecastTest(unittest.TestCase):
+    def _forecaster(self, hunger):
+        cat = SimpleNamespace(
+            hunger=hunger, tiredness=20, happiness=70, cleanliness=70, stage=evolution.ADULT,
+            personality=game_state.PERSONALITY_CALM,
+        )
+        state = SimpleNamespace(
+            day=1, time_phase=game_state.MORNING, difficulty=game_state.DIFFICULTY_NORMAL,
+            minigame_used={},
+        )
+        comp = competition.COMPETITIONS[0]
+        return comp, competition_forecast.GradeForecaster(comp, cat, state, {}, rng=random.Random(5))
+
+    def test_expected_net_counts_lost_cats(self):
+        # 대회 전에 반드시 죽는 고양이는 참가비만 잃는다.
+        comp, forecaster = self._forecaster(hunger=99)
+        forecaster.run(500)
+        result = forecaster.result()
+        self.assertEqual(result["survival"], 0.0)
+        self.assertEqual(result["expected_net"], -competition.entry_fee(comp, game_state.DIFFICULTY_NORMAL))
+
+    def test_expected_net_is_mean_over_all_samples(self):
+        comp, forecaster = self._forecaster(hunger=60)
+        forecaster.run(2000)
+        result = forecaster.result()
+        self.assertLess(result["survival"], 1.0)
+        reward = sum(
+            forecaster.grade_counts[grade] * competition.reward_for_grade(comp, grade, game_state.DIFFICULTY_NORMAL)
+            for grade in competition.GRADE_ORDER
+        )
+        fee = competition.entry_fee(comp, game_state.DIFFICULTY_NORMAL)
+        self.assertAlmostEqual(result["expected_net"], reward / 2000 - fee)
+
+    def test_run_for_stops_at_limit(self):
+        _, forecaster = self._forecaster(hunger=30)
+        while forecaster.run_for(budget=0.0, limit=250):
+            pass
+        self.assertEqual(forecaster.samples, 250)
+
+
+if __name__ == "__main__":
+    unittest.main()
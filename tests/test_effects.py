@@ -0,0 +1,151 @@
+import random
+import unittest
+from types import SimpleNamespace
+
+import effects
+import state
+from cat import Cat
+
+
+DIFFICULTIES = (state.DIFFICULTY_EASY, state.DIFFICULTY_NORMAL, state.DIFFICULTY_HARD)
+PERSONALITIES = (state.PERSONALITY_ENERGETIC, state.PERSONALITY_CALM, state.PERSONALITY_LAZY)
+# 효과 표의 행동 이름 -> Cat 메서드 이름
+CAT_METHODS = {
+    "night": "on_night",
+    "morning": "on_morning",
+    "feed_free": "feed_free",
+    "play_free": "play_free",
+    "clean": "clean",
+    "sleep": "sleep",
+}
+STAT_KEYS = ("hunger", "tiredness", "happiness", "cleanliness")
+
+
+class LegacyCat:
+    # 효과 표로 바꾸기 전의 Cat 메서드를 그대로 옮겨 둔 것. 범위마다 rng.randint를 부르고 끝에서 한 번에 자른다.
+    def __init__(self, difficulty, personality, rng, stats):
+        self.difficulty = difficulty
+        self.personality = personality
+        self.rng = rng
+        self.hunger, self.tiredness, self.happiness, self.cleanliness = stats
+
+    def _get_personality_modifier(self, stat_type):
+        prof = state.get_personality_profile(self.personality)
+        if stat_type in prof:
+            return prof[stat_type]
+        return 1.0
+
+    def _roll_stat_change(self, base_range, difficulty_kind, modifier_key, *, inverse_modifier=False):
+        low, high = state.scaled_range(base_range, self.difficulty, difficulty_kind)
+        value = self.rng.randint(low, high)
+        modifier = self._get_personality_modifier(modifier_key)
+        if inverse_modifier:
+            return int(value / modifier)
+        return int(value * modifier)
+
+    def _clamp_all(self):
+        self.hunger = state.clamp(self.hunger)
+        self.tiredness = state.clamp(self.tiredness)
+        self.happiness = state.clamp(self.happiness)
+        self.cleanliness = state.clamp(self.cleanliness)
+
+    def night(self):
+        hunger_inc = self._roll_stat_change(state.NIGHT_HUNGER_INC, "pressure", "hunger_increase")
+        tiredness_inc = self._roll_stat_change(state.NIGHT_TIREDNESS_INC, "pressure", "tiredness_increase")
+        happiness_dec = self._roll_stat_change(state.NIGHT_HAPPINESS_DEC, "pressure", "happiness_recovery", inverse_modifier=True)
+        cleanliness_dec = self._roll_stat_change(state.NIGHT_CLEANLINESS_DEC, "pressure", "cleanliness_decrease")
+        self.hunger += hunger_inc
+        self.tiredness += tiredness_inc
+        self.happiness -= happiness_dec
+        self.cleanliness -= cleanliness_dec
+        self._clamp_all()
+
+    def morning(self):
+        hunger_inc = self._roll_stat_change(state.MORNING_HUNGER_INC, "pressure", "hunger_increase")
+        tiredness_dec = self._roll_stat_change(state.MORNING_TIREDNESS_DEC, "recovery", "tiredness_recovery")
+        happiness_inc = self._roll_stat_change(state.MORNING_HAPPINESS_INC, "recovery", "happiness_recovery")
+        cleanliness_dec = self._roll_stat_change(state.MORNING_CLEANLINESS_DEC, "pressure", "cleanliness_decrease")
+        self.hunger += hunger_inc
+        self.tiredness -= tiredness_dec
+        self.happiness += happiness_inc
+        self.cleanliness -= cleanliness_dec
+        self._clamp_all()
+
+    def feed_free(self):
+        hunger_dec = self._roll_stat_change(state.FREE_FEED_HUNGER_DEC, "recovery", "hunger_increase", inverse_modifier=True)
+        happiness_inc = self._roll_stat_change(state.FREE_FEED_HAPPINESS_INC, "recovery", "happiness_recovery")
+        self.hunger -= hunger_dec
+        self.happiness += happiness_inc
+        self._clamp_all()
+
+    def play_free(self):
+        happiness_inc = self._roll_stat_change(state.FREE_PLAY_HAPPINESS_INC, "recovery", "happiness_recovery")
+        tiredness_inc = self._roll_stat_change(state.FREE_PLAY_TIREDNESS_INC, "pressure", "tiredness_increase")
+        hunger_inc = self._roll_stat_change(state.FREE_PLAY_HUNGER_INC, "pressure", "hunger_increase")
+        cleanliness_dec = self._roll_stat_change(state.FREE_PLAY_CLEANLINESS_DEC, "pressure", "cleanliness_decrease")
+        self.happiness += happiness_inc
+        self.tiredness += tiredness_inc
+        self.hunger += hunger_inc
+        self.cleanliness -= cleanliness_dec
+        self._clamp_all()
+
+    def clean(self):
+        cleanliness_inc = self._roll_stat_change(state.CLEAN_CLEANLINESS_INC, "recovery", "cleanliness_decrease", inverse_modifier=True)
+        happiness_dec = self._roll_stat_change(state.CLEAN_HAPPINESS_DEC, "pressure", "happiness_recovery", inverse_modifier=True)
+        self.cleanliness += cleanliness_inc
+        self.happiness -= happiness_dec
+        self._clamp_all()
+
+    def sleep(self):
+        tiredness_dec = self._roll_stat_change(state.SLEEP_TIREDNESS_DEC, "recovery", "tiredness_recovery")
+        happiness_inc = self._roll_stat_change(state.SLEEP_HAPPINESS_INC, "recovery", "happiness_recovery")
+        self.tiredness -= tiredness_dec
+        self.happiness += happiness_inc
+        self._clamp_all()
+
+
+def stats_of(cat):
+    return tuple(getattr(cat, key) for key in STAT_KEYS)
+
+
+class EffectTableTest(unittest.TestCase):
+    def test_table_matches_legacy_methods(self):
+        # 같은 시드에서 표 기반 효과가 예전 메서드와 같은 값을 뽑고 같은 자리에서 자르는지 본다.
+        # 시작 스탯은 0과 100 근처도 나오게 골라 자르는 경우가 섞이게 한다.
+        cases = random.Random(32)
+        for difficulty in DIFFICULTIES:
+            for personality in PERSONALITIES:
+                for action, method in CAT_METHODS.items():
+                    for seed in range(60):
+                        stats = tuple(cases.choice((0, 3, 50, 97, 100, cases.randint(0, 100))) for _ in STAT_KEYS)
+                        legacy = LegacyCat(difficulty, personality, random.Random(seed), stats)
+                        getattr(legacy, action)()
+
+                        current = Cat("나비", "아기고양이", "", difficulty, personality, rng=random.Random())
+                        current.hunger, current.tiredness, current.happiness, current.cleanliness = stats
+                        current.rng = random.Random(seed)
+                        getattr(current, method)()
+
+                        label = (difficulty, personality, action, seed, stats)
+                        self.assertEqual(stats_of(current), stats_of(legacy), label)
+                        # 뽑은 난수 개수도 같아야 다음 행동이 같은 값을 받는다.
+                        self.assertEqual(current.rng.random(), legacy.rng.random(), label)
+
+    def test_outcomes_match_legacy_ranges(self):
+        for difficulty in DIFFICULTIES:
+            for personality in PERSONALITIES:
+                legacy = LegacyCat(difficulty, personality, None, (0, 0, 0, 0))
+                for action, rolls in effects.ACTION_EFFECTS.items():
+                    for key, sign, base_range, kind, modifier_key, inverse in rolls:
+                        low, high = state.scaled_range(base_range, difficulty, kind)
+                        outcomes = effects.roll_outcomes(base_range, difficulty, kind, personality, modifier_key, inverse)
+                        expected = []
+                        for value in range(low, high + 1):
+                            # 예전 코드가 이 값을 뽑았을 때의 변화량
+                            legacy.rng = SimpleNamespace(randint=lambda low, high, value=value: value)
+                            expected.append(legacy._roll_stat_change(base_range, kind, modifier_key, inverse_modifier=inverse))
+                        self.assertEqual(outcomes, tuple(expected), (difficulty, personality, action, key))
+
+
+if __name__ == "__main__":
+    unittest.main()
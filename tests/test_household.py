@@ -0,0 +1,149 @@
+import random
+import unittest
+
+import effects
+import evolution
+import state as game_state
+from cat import Cat
+from household import CARE_ACTIONS, DIFFICULTIES, PERSONALITIES, STAT_KEYS, CatHousehold
+
+
+class PinnedRng:
+    # 결과 목록에서 항상 같은 비율 자리를 고르는 난수. 가족 모드는 choices로, Cat은 choice로 뽑으므로
+    # 둘에 같은 변화량을 주어 스탯 계산과 자르기, 사망/가출 판정만 비교한다.
+    def __init__(self, fraction):
+        self.fraction = fraction
+
+    def choice(self, seq):
+        return seq[int(self.fraction * len(seq))]
+
+    def choices(self, seq, k=1):
+        return [self.choice(seq)] * k
+
+
+def random_household(rng, count=40):
+    household = CatHousehold(rng=random.Random(1))
+    for index in range(count):
+        # 대부분은 버티는 스탯으로, 일부만 0/100 근처로 두어 자르기와 사망/가출이 섞이게 한다.
+        stats = {
+            key: rng.randint(20, 80) if rng.random() < 0.9 else rng.choice((0, 3, 97, 100))
+            for key in STAT_KEYS
+        }
+        household.add(
+            f"냥이{index}",
+            rng.choice(evolution.EVOLUTION_ORDER),
+            rng.choice(DIFFICULTIES),
+            rng.choice(PERSONALITIES),
+            stats,
+            runaway=rng.random() < 0.1,
+            image=rng.randrange(5),
+        )
+    return household
+
+
+def cat_for(household, i, rng):
+    cat = Cat(
+        household.names[i],
+        evolution.EVOLUTION_ORDER[household.stage[i]],
+        "",
+        DIFFICULTIES[household.difficulty[i]],
+        PERSONALITIES[household.personality[i]],
+        rng=random.Random(i),
+    )
+    cat.rng = rng
+    for key in STAT_KEYS:
+        setattr(cat, key, getattr(household, key)[i])
+    cat.alive = bool(household.alive[i])
+    cat.runaway = bool(household.runaway[i])
+    return cat
+
+
+def cat_row(cat):
+    return (*(getattr(cat, key) for key in STAT_KEYS), int(cat.alive), int(cat.runaway))
+
+
+def household_row(household, i):
+    return (*(getattr(household, key)[i] for key in STAT_KEYS), household.alive[i], household.runaway[i])
+
+
+class HouseholdTest(unittest.TestCase):
+    def test_save_round_trip(self):
+        household = random_household(random.Random(34))
+        household.care_used = {"clean", "sleep"}
+        data = household.to_save()
+        loaded = CatHousehold.from_save(data, rng=random.Random(2))
+        self.assertEqual(loaded.to_save(), data)
+        self.assertEqual(loaded.care_used, {"clean", "sleep"})
+
+    def test_bad_entries_fall_back(self):
+        data = {
+            "names": ["나비", "치즈", "까미"],
+            "stage": [evolution.ADULT, "없는단계", evolution.LION],
+            "difficulty": ["hard", "nightmare", None],
+            "personality": ["lazy", "grumpy", 3],
+            # 길이가 다른 열은 통째로 기본값을 쓴다.
+            "image": [1, 2],
+            "hunger": [10, 20, "배고픔"],
+            "tiredness": [200, -5, 30],
+            "happiness": [60, 60, 60],
+            "cleanliness": [70, 70, 70],
+            "alive": [1, 0],
+            "care_used": ["clean", "dance"],
+        }
+        loaded = CatHousehold.from_save(data)
+        # 숫자가 아닌 스탯이 있는 고양이는 건너뛴다.
+        self.assertEqual(loaded.names, ["나비", "치즈"])
+        saved = loaded.to_save()
+        self.assertEqual(saved["stage"], [evolution.ADULT, evolution.BABY])
+        self.assertEqual(saved["difficulty"], ["hard", game_state.normalize_difficulty("nightmare")])
+        self.assertEqual(saved["personality"], ["lazy", game_state.normalize_personality("grumpy")])
+        self.assertEqual(saved["image"], [0, 0])
+        self.assertEqual(saved["tiredness"], [game_state.MAX_STAT, 0])
+        self.assertEqual(saved["alive"], [1, 1])
+        self.assertEqual(saved["runaway"], [0, 0])
+        self.assertEqual(loaded.care_used, {"clean"})
+
+        for data in (None, [], {"names": "나비"}, {}):
+            self.assertEqual(len(CatHousehold.from_save(data)), 0)
+
+    def test_advance_matches_cat(self):
+        # 한 시간대와 돌보기 한 번이 마리마다 Cat과 같은 스탯, 같은 사망/가출 결과를 내는지 본다.
+        for fraction in (0.0, 0.3, 0.7, 0.999):
+            rng = PinnedRng(fraction)
+            household = random_household(random.Random(int(fraction * 1000)))
+            household.rng = rng
+            cats = [cat_for(household, i, rng) for i in range(len(household))]
+
+            active = household.active_indices()
+            lost = household.on_night()
+            for cat in cats:
+                cat.on_night()
+            self.assertEqual(lost, [i for i in active if not cats[i].alive or cats[i].runaway])
+            for action in CARE_ACTIONS:
+                self.assertTrue(household.care_all(action))
+                self.assertFalse(household.care_all(action))
+                for cat in cats:
+                    getattr(cat, action)()
+            household.on_morning()
+            for cat in cats:
+                cat.on_morning()
+
+            for i, cat in enumerate(cats):
+                self.assertEqual(household_row(household, i), cat_row(cat), (fraction, i))
+
+    def test_draws_stay_in_cat_outcomes(self):
+        # 실제 난수로는 뽑는 순서가 Cat과 달라도 변화량은 같은 결과 목록에서 고르게 나온다.
+        difficulty = game_state.DIFFICULTY_NORMAL
+        personality = game_state.PERSONALITY_CALM
+        household = CatHousehold(rng=random.Random(7))
+        for index in range(2000):
+            household.add(f"냥이{index}", evolution.BABY, difficulty, personality, {key: 50 for key in STAT_KEYS})
+        household.apply_effect("play_free")
+        for key, sign, outcomes in effects.effect_table(difficulty, personality)["play_free"]:
+            deltas = [sign * (value - 50) for value in getattr(household, key)]
+            self.assertTrue(set(deltas) <= set(outcomes), key)
+            self.assertAlmostEqual(sum(deltas) / len(deltas), sum(outcomes) / len(outcomes), delta=0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import os
+import random
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# 게임 모듈이 저장 폴더를 import할 때 정하므로 그 전에 임시 폴더로 돌린다.
+_APPDATA = tempfile.mkdtemp(prefix="growing-cat-test-")
+os.environ["APPDATA"] = _APPDATA
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import app
+import photo_hash
+import photo_mode
+from album_catalog import AlbumCatalog
+from album_dedupe import DuplicateScanner
+
+
+CAT_DIR = Path(__file__).resolve().parent.parent / "assets" / "cats"
+
+
+def render_main_scenes(seed=1):
+    # 고양이 그림 20장을 하나씩 띄우고 상태와 날짜를 무작위로 바꿔 메인 장면을 그린다.
+    game = app.Game()
+    game.start_new_game("나비")
+    rng = random.Random(seed)
+    scenes = []
+    for path in sorted(CAT_DIR.glob("*/*.png")):
+        game.cat.image_path = str(path)
+        game.cat.stage = path.parent.name
+        for key in ("hunger", "tiredness", "happiness", "cleanliness"):
+            setattr(game.cat, key, rng.randint(0, 100))
+        game.state.day = rng.randint(1, 30)
+        game._draw_game_view_base()
+        game._draw_care_panel()
+        game._draw_menu_panel()
+        game.draw_button(game._advance_rect(), "다음 시간", game.tab_font)
+        scenes.append(game.screen.copy())
+    return scenes
+
+
+def wait_for(scanner, kind, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for done, result in scanner.poll():
+            if done == "error":
+                raise AssertionError(result)
+            if done == kind:
+                return result
+        time.sleep(0.01)
+    raise AssertionError(f"{kind} 작업이 끝나지 않았습니다")
+
+
+class PhotoHashTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.scenes = render_main_scenes()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+        shutil.rmtree(_APPDATA, ignore_errors=True)
+
+    def setUp(self):
+        self.folder = Path(tempfile.mkdtemp(prefix="album-", dir=_APPDATA))
+
+    def _take(self, surface, day=7, stage="adult"):
+        # 파일 이름이 밀리초까지라 같은 밀리초에 찍히지 않게 한다.
+        time.sleep(0.002)
+        return photo_mode.take_photo(surface, player_name="나비", day=day, stage=stage, folder=self.folder)
+
+    def _scan(self):
+        scanner = DuplicateScanner(self.folder)
+        try:
+            scanner.scan()
+            return wait_for(scanner, "scan")
+        finally:
+            scanner.close()
+
+    def test_distinct_main_scenes_are_not_duplicates(self):
+        hashes = [photo_hash.dhash(scene) for scene in self.scenes]
+        distances = [
+            photo_hash.hamming(a, b)
+            for index, a in enumerate(hashes)
+            for b in hashes[index + 1 :]
+        ]
+        self.assertGreater(min(distances), photo_hash.DUPLICATE_DISTANCE)
+        self.assertEqual(photo_hash.duplicate_groups(enumerate(hashes)), [])
+
+    def test_groups_do_not_chain_through_neighbours(self):
+        # a-b, b-c는 가깝지만 a-c는 멀다. c는 대표 a의 묶음에 들어가면 안 된다.
+        a = 0
+        b = (1 << 8) - 1
+        c = (1 << 16) - 1
+        self.assertEqual(photo_hash.duplicate_groups([("a", a), ("b", b), ("c", c)], 8), [["a", "b"]])
+
+    def test_same_shot_is_required(self):
+        items = [("a", 0), ("b", 1), ("c", 3)]
+        groups = photo_hash.duplicate_groups(items, 4, lambda rep, key: key != "b")
+        self.assertEqual(groups, [["a", "c"]])
+
+    def test_album_keeps_distinct_scenes_with_same_metadata(self):
+        for scene in self.scenes:
+            self._take(scene)
+        self.assertEqual(self._scan(), 0)
+        with AlbumCatalog(self.folder) as catalog:
+            self.assertEqual(catalog.duplicate_count(), 0)
+
+    def test_cleanup_removes_only_burst_copies(self):
+        kept = [self._take(scene) for scene in self.scenes[:6]]
+        copies = [self._take(scene) for scene in self.scenes[:3]]
+        # 같은 장면이어도 다른 날 찍은 사진은 중복이 아니다.
+        other_day = self._take(self.scenes[4], day=8)
+        self.assertEqual(self._scan(), 3)
+
+        scanner = DuplicateScanner(self.folder)
+        try:
+            scanner.cleanup()
+            removed = wait_for(scanner, "cleanup")
+        finally:
+            scanner.close()
+        self.assertEqual(len(removed), 3)
+        left = {str(path) for path in self.folder.glob("*.png")}
+        self.assertEqual(len(left), 7)
+        self.assertIn(other_day, left)
+        for original, copy in zip(kept, copies):
+            self.assertEqual(len({original, copy} & left), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
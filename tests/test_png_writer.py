@@ -0,0 +1,206 @@
+import io
+import os
+import random
+import shutil
+import struct
+import tempfile
+import time
+import unittest
+import zlib
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import png_writer
+from photo_clip import LAST_FRAME_MS, FrameRing, iter_clip_frames
+
+
+def random_pixels(rng, width, height, channels):
+    return bytes(rng.randrange(256) for _ in range(width * height * channels))
+
+
+def read_chunks(data):
+    # (종류, 내용) 목록. CRC도 함께 확인한다.
+    assert data[:8] == png_writer.PNG_SIGNATURE
+    chunks = []
+    offset = 8
+    while offset < len(data):
+        length, kind = struct.unpack(">I4s", data[offset : offset + 8])
+        body = data[offset + 8 : offset + 8 + length]
+        (crc,) = struct.unpack(">I", data[offset + 8 + length : offset + 12 + length])
+        assert crc == zlib.crc32(kind + body) & 0xFFFFFFFF, kind
+        chunks.append((kind, body))
+        offset += 12 + length
+    return chunks
+
+
+def unfilter(data, width, height, channels):
+    # 필터 0만 쓰므로 행 앞의 필터 바이트만 떼면 된다.
+    raw = zlib.decompress(data)
+    stride = width * channels
+    rows = []
+    for row in range(height):
+        start = row * (stride + 1)
+        assert raw[start] == 0
+        rows.append(raw[start + 1 : start + 1 + stride])
+    return b"".join(rows)
+
+
+class PngWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = Path(tempfile.mkdtemp(prefix="png-"))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_pygame_reads_encoded_pixels(self):
+        rng = random.Random(45)
+        for mode, channels in (("RGB", 3), ("RGBA", 4)):
+            for width, height in ((1, 1), (7, 3), (64, 33)):
+                for level in (0, 6, 9):
+                    pixels = random_pixels(rng, width, height, channels)
+                    data = png_writer.encode_png(width, height, pixels, mode=mode, level=level)
+                    image = pygame.image.load(io.BytesIO(data), "photo.png")
+                    self.assertEqual(image.get_size(), (width, height))
+                    self.assertEqual(pygame.image.tobytes(image, mode), pixels, (mode, width, height, level))
+
+    def test_bad_pixel_size_is_rejected(self):
+        with self.assertRaises(ValueError):
+            png_writer.encode_png(4, 4, bytes(47))
+
+    def test_read_text_returns_itxt(self):
+        text = {"growing-cat:player": "나비", "growing-cat:day": 12, "growing-cat:stage": None, "Software": "growing-cat"}
+        data = png_writer.encode_png(2, 2, bytes(12), text=text)
+        path = self.folder / "photo.png"
+        png_writer.write_atomic(path, data)
+        self.assertEqual(
+            png_writer.read_text(path),
+            {"growing-cat:player": "나비", "growing-cat:day": "12", "Software": "growing-cat"},
+        )
+        self.assertEqual(list(self.folder.iterdir()), [path])
+
+    def test_read_text_handles_other_chunks(self):
+        # 다른 프로그램이 쓴 tEXt, 압축 iTXt는 읽고, IDAT 뒤의 청크는 보지 않는다.
+        compressed = b"growing-cat:player\x00\x01\x00ko\x00\xec\x9d\xb4\xeb\xa6\x84\x00" + zlib.compress("치즈".encode("utf-8"))
+        data = b"".join(
+            (
+                png_writer.PNG_SIGNATURE,
+                png_writer.ihdr(1, 1),
+                png_writer.chunk(b"tEXt", b"Comment\x00caf\xe9"),
+                png_writer.chunk(b"iTXt", compressed),
+                png_writer.chunk(b"IDAT", png_writer.image_data(1, 1, bytes(3))),
+                png_writer.text_chunk("late", "늦음"),
+                png_writer.chunk(b"IEND", b""),
+            )
+        )
+        path = self.folder / "other.png"
+        path.write_bytes(data)
+        self.assertEqual(png_writer.read_text(path), {"Comment": "café", "growing-cat:player": "치즈"})
+        (self.folder / "not.png").write_bytes(b"JFIF")
+        self.assertEqual(png_writer.read_text(self.folder / "not.png"), {})
+
+    def test_apng_frames_and_sequence(self):
+        rng = random.Random(7)
+        width, height = 5, 4
+        frames = [random_pixels(rng, width, height, 3) for _ in range(4)]
+        delays = [100, 0, 70000, 250]
+        out = io.BytesIO()
+        writer = png_writer.APNGWriter(out, width, height, len(frames), loops=2, text={"growing-cat:player": "나비"})
+        for pixels, delay in zip(frames, delays):
+            writer.add(pixels, delay)
+        with self.assertRaises(ValueError):
+            writer.add(frames[0], 100)
+        writer.close()
+
+        chunks = read_chunks(out.getvalue())
+        kinds = [kind for kind, _ in chunks]
+        self.assertEqual(kinds[:3], [b"IHDR", b"acTL", b"iTXt"])
+        self.assertEqual(kinds[-1], b"IEND")
+        self.assertEqual(struct.unpack(">II", dict(chunks)[b"acTL"]), (4, 2))
+        self.assertEqual(kinds.count(b"fcTL"), 4)
+        self.assertEqual(kinds.count(b"IDAT"), 1)
+        self.assertEqual(kinds.count(b"fdAT"), 3)
+
+        # fcTL과 fdAT의 순번은 0부터 빠짐없이 이어지고, 첫 프레임은 IDAT이다.
+        sequence = []
+        decoded = []
+        shown = []
+        for kind, body in chunks:
+            if kind == b"fcTL":
+                fields = struct.unpack(">IIIIIHHBB", body)
+                sequence.append(fields[0])
+                self.assertEqual(fields[1:5], (width, height, 0, 0))
+                shown.append(fields[5] / fields[6])
+            elif kind == b"fdAT":
+                sequence.append(struct.unpack(">I", body[:4])[0])
+                decoded.append(unfilter(body[4:], width, height, 3))
+            elif kind == b"IDAT":
+                decoded.append(unfilter(body, width, height, 3))
+        self.assertEqual(sequence, list(range(len(sequence))))
+        self.assertEqual(decoded, frames)
+        self.assertEqual(shown, [0.1, 0.001, 65.535, 0.25])
+
+        # APNG를 모르는 디코더에게는 첫 프레임이 정지 사진으로 보인다.
+        image = pygame.image.load(io.BytesIO(out.getvalue()), "clip.png")
+        self.assertEqual(pygame.image.tobytes(image, "RGB"), frames[0])
+
+    def test_apng_rejects_missing_frames(self):
+        with self.assertRaises(ValueError):
+            png_writer.APNGWriter(io.BytesIO(), 2, 2, 0)
+        writer = png_writer.APNGWriter(io.BytesIO(), 2, 2, 2)
+        writer.add(bytes(12), 100)
+        with self.assertRaises(ValueError):
+            writer.close()
+
+
+class FrameRingTest(unittest.TestCase):
+    def _surface(self, value, size=(40, 20)):
+        surface = pygame.Surface(size)
+        surface.fill((value, 255 - value, value // 2))
+        return surface
+
+    def _frames(self, ring):
+        # 압축 스레드가 아직 안 끝난 칸은 원본 그대로 나와도 된다.
+        deadline = time.monotonic() + 5
+        size, frames = ring.snapshot()
+        while not all(packed for _, _, packed in frames) and time.monotonic() < deadline:
+            time.sleep(0.01)
+            size, frames = ring.snapshot()
+        return size, frames
+
+    def test_keeps_latest_frames_at_clip_rate(self):
+        ring = FrameRing(seconds=0.5, fps=10, scale=0.5)
+        self.assertEqual(ring.capacity, 5)
+        taken = []
+        for now in range(0, 1200, 20):
+            if ring.sample(self._surface(now // 10), now):
+                taken.append(now)
+        self.assertEqual(taken, list(range(0, 1200, 100)))
+        self.assertEqual(len(ring), 5)
+
+        size, frames = self._frames(ring)
+        self.assertEqual(size, (20, 10))
+        self.assertEqual([stamp for stamp, _, _ in frames], taken[-5:])
+        clip = list(iter_clip_frames(frames))
+        self.assertEqual([delay for _, delay in clip], [100, 100, 100, 100, LAST_FRAME_MS])
+        for (pixels, _), stamp in zip(clip, taken[-5:]):
+            expected = pygame.image.tobytes(pygame.transform.scale(self._surface(stamp // 10), size), "RGB")
+            self.assertEqual(pixels, expected)
+
+    def test_resize_clears_ring(self):
+        ring = FrameRing(seconds=1, fps=10, scale=1.0)
+        ring.sample(self._surface(10), 0)
+        ring.sample(self._surface(20), 100)
+        ring.sample(self._surface(30, (30, 30)), 200)
+        size, frames = self._frames(ring)
+        self.assertEqual(size, (30, 30))
+        self.assertEqual([stamp for stamp, _, _ in frames], [200])
+        ring.clear()
+        self.assertEqual(len(ring), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
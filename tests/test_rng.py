@@ -0,0 +1,82 @@
+import json
+import unittest
+
+import rng
+from rng import RngService
+
+
+STREAMS = (rng.STREAM_CAT, rng.STREAM_CAT_IMAGE, rng.STREAM_COMPETITION, rng.minigame_stream("jump"))
+
+
+def draws(service, name, count=20):
+    stream = service.stream(name)
+    return [stream.random() for _ in range(count)]
+
+
+class RngServiceTest(unittest.TestCase):
+    def test_snapshot_restores_each_stream(self):
+        service = RngService(1234)
+        for index, name in enumerate(STREAMS):
+            draws(service, name, index * 7 + 1)
+        service.stream(rng.STREAM_DIALOGUE).gauss(0, 1)
+        # 저장 파일에 JSON으로 들어가므로 한 번 거쳐서 되살린다.
+        data = json.loads(json.dumps(service.snapshot()))
+        loaded = RngService.from_snapshot(data)
+
+        self.assertEqual(loaded.seed, 1234)
+        for name in (*STREAMS, rng.STREAM_DIALOGUE):
+            self.assertEqual(draws(loaded, name), draws(service, name), name)
+        self.assertEqual(loaded.stream(rng.STREAM_DIALOGUE).gauss(0, 1), service.stream(rng.STREAM_DIALOGUE).gauss(0, 1))
+
+    def test_streams_do_not_share_draws(self):
+        # 한 스트림을 더 뽑아도 다른 스트림의 결과는 그대로다.
+        quiet = RngService(99)
+        busy = RngService(99)
+        draws(busy, rng.STREAM_CAT, 500)
+        self.assertEqual(draws(busy, rng.STREAM_COMPETITION), draws(quiet, rng.STREAM_COMPETITION))
+        self.assertNotEqual(draws(quiet, rng.STREAM_CAT), draws(quiet, rng.STREAM_CAT_IMAGE))
+
+    def test_unsaved_stream_starts_from_seed(self):
+        # 스냅샷에 없던 스트림은 시드에서 새로 시작한다. 이미 뽑던 스트림도 마찬가지다.
+        service = RngService(5)
+        draws(service, rng.STREAM_CAT)
+        data = service.snapshot()
+        other = RngService(77)
+        draws(other, rng.STREAM_COMPETITION, 3)
+        self.assertTrue(other.restore(data))
+        self.assertEqual(draws(other, rng.STREAM_COMPETITION), draws(RngService(5), rng.STREAM_COMPETITION))
+
+    def test_child_names_are_stable(self):
+        service = RngService(2024)
+        self.assertEqual(service.child("3").seed, RngService(2024).child("3").seed)
+        self.assertEqual(service.child("3").seed, rng.derive_seed(2024, "child:3") >> 64)
+        self.assertNotEqual(service.child("3").seed, service.child("4").seed)
+        self.assertEqual(draws(service.child("life"), rng.STREAM_CAT), draws(RngService(2024).child("life"), rng.STREAM_CAT))
+        # 자식을 만들어도 부모 스트림은 움직이지 않는다.
+        self.assertEqual(draws(service, rng.STREAM_CAT), draws(RngService(2024), rng.STREAM_CAT))
+
+    def test_save_without_rng_keeps_current_streams(self):
+        # 예전 저장 파일에는 "rng" 항목이 없다. 불러와도 지금 스트림을 그대로 이어 쓴다.
+        for data in ({}, {"money": 10}):
+            service = RngService(8)
+            before = draws(RngService(8), rng.STREAM_CAT, 5)
+            self.assertFalse(service.restore(data.get("rng")))
+            self.assertEqual(service.seed, 8)
+            self.assertEqual(draws(service, rng.STREAM_CAT, 5), before)
+
+    def test_broken_rng_data_is_ignored(self):
+        for data in ({"seed": "x"}, {"seed": 1, "streams": {"cat": ["not base64!", None]}}, {"seed": 1, "streams": {"cat": []}}):
+            service = RngService(8)
+            expected = draws(RngService(8), rng.STREAM_CAT)
+            self.assertFalse(service.restore(data))
+            self.assertEqual(service.seed, 8)
+            self.assertEqual(draws(service, rng.STREAM_CAT), expected)
+
+    def test_from_snapshot_without_data_gets_fresh_seed(self):
+        service = RngService.from_snapshot(None)
+        self.assertIsInstance(service.seed, int)
+        self.assertEqual(len(draws(service, rng.STREAM_CAT)), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import random
+import unittest
+
+import evolution
+import simulation
+import state as game_state
+from cat import Cat
+from rng import STREAM_CAT, RngService
+
+
+DIFFICULTIES = tuple(game_state.DIFFICULTY_PROFILE)
+PERSONALITIES = tuple(game_state.PERSONALITY_PROFILE)
+STATS = ("hunger", "tiredness", "happiness", "cleanliness", "alive", "runaway", "stage")
+
+
+class SimulationMatchesCatTest(unittest.TestCase):
+    def test_same_actions_give_same_stats(self):
+        for difficulty in DIFFICULTIES:
+            for personality in PERSONALITIES:
+                for seed in range(5):
+                    with self.subTest(difficulty=difficulty, personality=personality, seed=seed):
+                        self._play(difficulty, personality, seed)
+
+    def _play(self, difficulty, personality, seed):
+        sim = simulation.LifeSimulation(difficulty, personality, simulation.idle_policy, rng=RngService(seed))
+        cat = Cat(
+            "sim",
+            evolution.BABY,
+            image_path=simulation.SIM_IMAGE_PATH,
+            difficulty=difficulty,
+            personality=personality,
+            rng=RngService(seed).stream(STREAM_CAT),
+        )
+        script = random.Random(f"{difficulty}:{personality}:{seed}")
+        while sim.outcome is None:
+            for action in script.sample(simulation.CARE_ACTIONS, script.randint(0, 4)):
+                sim.perform(action)
+                getattr(cat, action)()
+            sim.advance_time()
+            if sim.state.time_phase == game_state.NIGHT:
+                cat.on_night()
+            else:
+                cat.on_morning()
+            # 시뮬레이터가 아침에 진화하면(게임처럼 게임 오버 판정 전에) 이미지도 같은 스트림에서 뽑는다.
+            while sim.cat.stage != cat.stage:
+                evolution.evolve(cat)
+            self.assertEqual(
+                {key: getattr(sim.cat, key) for key in STATS},
+                {key: getattr(cat, key) for key in STATS},
+            )
+
+    def test_workers_do_not_change_results(self):
+        single = simulation.run_simulations(24, seed=3).summary()
+        split = simulation.run_simulations(24, seed=3, workers=2).summary()
+        self.assertEqual(single, split)
+
+
+if __name__ == "__main__":
+    unittest.main()